@@ -0,0 +1,87 @@
+# benchmarks/connection_info_compression.py
+#
+# Compares the SQLite and YAML repositories storing kubeconfig-sized connection info
+# uncompressed and compressed with zlib and zstd (when the zstandard package is installed):
+#
+# - size:  bytes of the database or YAML file
+# - list:  one page of 100 metadata-only summaries
+# - get:   get_configuration, which decompresses the connection info
+#
+# Run it from the repository root:
+#     python benchmarks/connection_info_compression.py [--configs 2000] [--repeat 200]
+
+import argparse
+import base64
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigQuery  # noqa: E402
+from hw_agent.repositories.connection_info_codec import zstandard  # noqa: E402
+from hw_agent.repositories.sqlite_repository import SQLiteRepository  # noqa: E402
+from hw_agent.repositories.yaml_repository import YAMLRepository  # noqa: E402
+
+
+def build_configuration(index: int, rng: random.Random) -> ConnectionConfigCreate:
+    # Certificates are base64 of DER, i.e. of nearly random bytes; the rest is repetitive
+    def certificate():
+        return base64.b64encode(rng.randbytes(1800)).decode()
+
+    return ConnectionConfigCreate(
+        metadata={"name": f"cluster-{index}", "description": "benchmark", "contact": "ops@example.org"},
+        orchestrator_type="kubernetes",
+        connection_info={"kubeconfig": {
+            "apiVersion": "v1",
+            "kind": "Config",
+            "clusters": [{"name": f"cluster-{index}", "cluster": {"server": f"https://k8s-{index}.example.org:6443", "certificate-authority-data": certificate()}}],
+            "users": [{"name": "admin", "user": {"client-certificate-data": certificate(), "client-key-data": certificate()}}],
+            "contexts": [{"name": "default", "context": {"cluster": f"cluster-{index}", "user": "admin"}}],
+            "current-context": "default",
+        }},
+    )
+
+
+def timed(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the effect of connection info compression.")
+    parser.add_argument("--configs", type=int, default=2000, help="Number of stored configurations.")
+    parser.add_argument("--repeat", type=int, default=200, help="Repetitions of each timed call.")
+    args = parser.parse_args()
+
+    algorithms = ["none", "zlib"] + (["zstd"] if zstandard is not None else [])
+    rng = random.Random(0)
+    configurations = {f"config-{index}": build_configuration(index, rng) for index in range(args.configs)}
+    config_ids = list(configurations)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in ("sqlite", "yaml"):
+            for algorithm in algorithms:
+                os.environ["CONNECTION_INFO_COMPRESSION"] = algorithm
+                os.environ["SQLITE_DB_FILE"] = path = os.path.join(directory, f"{algorithm}.db")
+                if backend == "yaml":
+                    os.environ["YAML_CONFIG_FILE"] = path = os.path.join(directory, f"{algorithm}.yaml")
+                repository = SQLiteRepository() if backend == "sqlite" else YAMLRepository()
+                repository.save_configurations(configurations)
+                if backend == "sqlite":
+                    repository.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+                list_ms = timed(lambda: repository.list_configurations(ConnectionConfigQuery(limit=100)), args.repeat)
+                get_ms = timed(lambda: repository.get_configuration(rng.choice(config_ids)), args.repeat)
+                size_mib = os.path.getsize(path) / 2 ** 20
+                print(f"{backend:>6} {algorithm:>4}: {size_mib:7.1f} MiB, list {list_ms:6.2f} ms, get {get_ms:6.3f} ms")
+                if backend == "sqlite":
+                    repository.close()
+
+
+if __name__ == "__main__":
+    main()
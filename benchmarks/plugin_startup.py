@@ -0,0 +1,57 @@
+# benchmarks/plugin_startup.py
+#
+# Measures the cold start of the PluginManager in a fresh interpreter.
+#
+# - lazy:  PluginManager() only, plugin modules are imported on first use
+# - eager: PluginManager() plus loading every plugin, i.e. what startup used to cost
+#
+# Run it from the repository root:
+#     python benchmarks/plugin_startup.py [--runs 5]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ["kubernetes", "openstack", "paramiko"]
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from hw_agent.core.plugin_manager import PluginManager
+plugin_manager = PluginManager()
+if sys.argv[1] == "eager":
+    for orchestrator_type in list(plugin_manager.plugins):
+        plugin_manager.get_plugin(orchestrator_type)
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "imported": [m for m in %r if m in sys.modules],
+}))
+""" % HEAVY_MODULES
+
+
+def measure(mode: str) -> dict:
+    env = dict(os.environ, PYTHONPATH="src", LOG_LEVEL="WARNING")
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure PluginManager cold start.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters per mode.")
+    args = parser.parse_args()
+
+    for mode in ("eager", "lazy"):
+        results = [measure(mode) for _ in range(args.runs)]
+        median = statistics.median(r["seconds"] for r in results)
+        print(f"{mode:>5}: median {median * 1000:8.1f} ms over {args.runs} runs, "
+              f"heavy modules imported: {results[-1]['imported'] or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/sqlite_read_scaling.py
+#
+# Measures the read throughput of SQLiteRepository.get_configuration with a growing number of
+# threads, while one thread keeps writing.
+#
+# - locked: a single shared connection behind one lock, i.e. what every read used to wait for
+# - wal:    the current repository, WAL mode with one read connection per thread
+#
+# Run it from the repository root:
+#     python benchmarks/sqlite_read_scaling.py [--configs 2000] [--seconds 2]
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hw_agent.models.connection_config_models import ConnectionConfigCreate  # noqa: E402
+from hw_agent.repositories.sqlite_repository import SQLiteRepository  # noqa: E402
+
+
+class LockedSQLiteRepository(SQLiteRepository):
+    """Reads through the writer connection and its lock, as before WAL and per-thread readers."""
+
+    def _get_reader(self):
+        return self.connection
+
+    def get_configuration(self, config_id):
+        with self._write_lock:
+            return super().get_configuration(config_id)
+
+
+def build_configuration(index: int) -> ConnectionConfigCreate:
+    return ConnectionConfigCreate(
+        metadata={"name": f"cluster-{index}", "description": "benchmark", "contact": "ops@example.org"},
+        orchestrator_type="hpc",
+        connection_info={"ssh_credentials": {"login_node": f"login{index}.example.org", "user": "u", "private_key": "k" * 512}},
+    )
+
+
+def measure(repository: SQLiteRepository, config_ids, threads: int, seconds: float) -> float:
+    stop = threading.Event()
+    reads = [0] * threads
+
+    def reader(slot: int):
+        rng = random.Random(slot)
+        while not stop.is_set():
+            repository.get_configuration(rng.choice(config_ids))
+            reads[slot] += 1
+
+    def writer():
+        index = 0
+        while not stop.is_set():
+            repository.save_configuration(f"write-{index % 100}", build_configuration(index))
+            index += 1
+            time.sleep(0.001)
+
+    workers = [threading.Thread(target=reader, args=(slot,)) for slot in range(threads)]
+    workers.append(threading.Thread(target=writer))
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(reads) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure SQLiteRepository read scaling.")
+    parser.add_argument("--configs", type=int, default=2000, help="Number of stored configurations.")
+    parser.add_argument("--seconds", type=float, default=2, help="Duration of each measurement.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="Reader thread counts.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for mode, repository_cls in (("locked", LockedSQLiteRepository), ("wal", SQLiteRepository)):
+            os.environ["SQLITE_DB_FILE"] = os.path.join(directory, f"{mode}.db")
+            repository = repository_cls()
+            config_ids = [f"config-{index}" for index in range(args.configs)]
+            for index, config_id in enumerate(config_ids):
+                repository.save_configuration(config_id, build_configuration(index))
+
+            for threads in args.threads:
+                throughput = measure(repository, config_ids, threads, args.seconds)
+                print(f"{mode:>6}: {threads:2d} reader threads, {throughput:10.0f} reads/s")
+            repository.close()
+
+
+if __name__ == "__main__":
+    main()
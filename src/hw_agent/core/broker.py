@@ -3,6 +3,7 @@
 from hw_agent.core.orchestrator_type import OrchestratorType
 from hw_agent.core.plugin_context import PluginContext
 from hw_agent.core.singleton_meta import SingletonMeta
+from hw_agent.core.target_fingerprint import compute_target_fingerprint
 from hw_agent.core.plugin_manager import PluginManager
 from hw_agent.models.computational_asset import ComputationalAsset
 from hw_agent.services.aiod_metadata_client import AIODMetadataClient
@@ -44,10 +45,7 @@ class Broker(metaclass=SingletonMeta):
         # Build the execution context
         plugin_context = self._build_context(connection_config, plugin)
         
-        # Execute plugin command. For now it returns a ComputaqualAsset with specific information of each orchestrator
-        computational_data = plugin.fetch(plugin_context)
-        
-        return computational_data
+        return self._collect(connection_config, plugin_context)
     
     def fetch_and_transform(self, config_id: str) -> ComputationalData:
         # Retrieve configuration
@@ -60,10 +58,22 @@ class Broker(metaclass=SingletonMeta):
         # Build the execution context
         plugin_context = self._build_context(connection_config, plugin)
         
-        # Execute plugin command. For now it returns a ComputaqualAsset with specific information of each orchestrator
-        computational_asset = plugin.fetch_and_transform(plugin_context)
-        
-        return computational_asset
+        computational_data = self._collect(connection_config, plugin_context)
+
+        # The transformation may use the metadata of the configuration, so it is never shared
+        self.logger.info("Starting transforming computational asset through the plugin...")
+        return plugin.transform_computational_data(plugin_context, computational_data)
+
+    def _collect(self, connection_config: ConnectionConfigRead, plugin_context: PluginContext) -> ComputationalData:
+        # Execute plugin command under the plugin's execution policy. Configurations with the same
+        # target fingerprint point to the same infrastructure and identity: a collection for one
+        # of them is shared with the others, whether it is in progress or cached. It is computed
+        # from the connection info rather than read from the store, so that it always covers the
+        # credentials: a configuration with a wrong or revoked secret authenticates on its own
+        target = compute_target_fingerprint(connection_config.orchestrator_type, connection_config.connection_info)
+        return plugin_manager.execute_plugin(
+            connection_config.orchestrator_type, plugin_context, "fetch", target=target,
+        )
     
     
     def _build_context(self, connection_config: ConnectionConfigRead, plugin: BasePlugin) -> PluginContext:
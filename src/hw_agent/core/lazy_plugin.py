@@ -0,0 +1,77 @@
+# src/hw_agent/core/lazy_plugin.py
+
+import time
+from threading import Lock
+from typing import Callable, Optional
+
+from jsonschema.protocols import Validator
+
+from hw_agent.core.base_plugin import BasePlugin
+from hw_agent.core.plugin_executor import PluginExecutor
+from hw_agent.models.plugin_models import PluginDefinition
+
+
+class LazyPlugin:
+    """
+    Registry entry of a plugin whose module is only imported on first use.
+
+    The plugin definition (config.yaml) is available right away, so listing plugins and validating
+    connection info never import the plugin module or its dependencies.
+
+    Attributes:
+    - plugin_folder (str): The folder of the plugin inside the plugins directory.
+    - plugin_definition (PluginDefinition): The definition read from the plugin's config.yaml.
+    - connection_validator (Validator): The compiled validator of the connection schema, if any.
+    - load_time_in_seconds (float): Time spent importing and instantiating the plugin, once loaded.
+    - executor (PluginExecutor): Enforces the execution policy of the plugin definition.
+    """
+
+    def __init__(
+        self,
+        plugin_folder: str,
+        plugin_definition: PluginDefinition,
+        loader: Callable[[str, PluginDefinition], Optional[BasePlugin]],
+        connection_validator: Optional[Validator] = None,
+    ):
+        self.plugin_folder = plugin_folder
+        self.plugin_definition = plugin_definition
+        self.connection_validator = connection_validator
+        self.load_time_in_seconds: Optional[float] = None
+        self._loader = loader
+        self._instance: Optional[BasePlugin] = None
+        self._executor: Optional[PluginExecutor] = None
+        self._lock = Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._instance is not None
+
+    @property
+    def executor(self) -> PluginExecutor:
+        # Created with the definition it belongs to, so a reload also replaces the policy
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = PluginExecutor(
+                        self.plugin_definition.execution, self.plugin_definition.orchestrator_type
+                    )
+        return self._executor
+
+    def close(self):
+        """Releases the executor once this version was swapped out of the registry."""
+        # Kept, shut down, for the executions that looked this version up before the swap
+        self.executor.shutdown()
+
+    def get_instance(self) -> Optional[BasePlugin]:
+        """
+        Imports and instantiates the plugin on first call. Concurrent callers wait for the
+        first one instead of importing the module twice. Returns None if the plugin could not
+        be loaded; the next call will try again.
+        """
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    start_time = time.perf_counter()
+                    self._instance = self._loader(self.plugin_folder, self.plugin_definition)
+                    self.load_time_in_seconds = time.perf_counter() - start_time
+        return self._instance
@@ -0,0 +1,92 @@
+# src/hw_agent/core/manifest_cache.py
+
+import hashlib
+import json
+import os
+import tempfile
+from threading import Lock
+from typing import Dict, Optional
+
+from hw_agent.models.plugin_models import PluginDefinition
+from hw_agent.utils.logger import get_logger
+
+
+def _definition_model_version() -> str:
+    # Cached definitions are dropped whenever the PluginDefinition model itself changes,
+    # otherwise new fields would silently take their defaults instead of the config.yaml values
+    model_schema = json.dumps(PluginDefinition.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(model_schema.encode()).hexdigest()
+
+
+class PluginManifestCache:
+    """
+    On-disk cache of validated plugin definitions, keyed by plugin folder and by the SHA-256 of
+    its config.yaml. An entry is only used while the file content is unchanged; its connection
+    schema has already been checked against its JSON Schema Draft, so it is not checked again.
+    """
+
+    def __init__(self, cache_file: str):
+        self.cache_file = os.path.abspath(cache_file)
+        self.logger = get_logger(self.__class__.__name__)
+        self._model_version = _definition_model_version()
+        self._lock = Lock()
+        self._dirty = False
+        self._entries: Dict[str, Dict[str, str]] = self._load()
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, plugin_folder: str, content_hash: str) -> Optional[PluginDefinition]:
+        with self._lock:
+            entry = self._entries.get(plugin_folder)
+        if not entry or entry["sha256"] != content_hash:
+            return None
+        try:
+            return PluginDefinition.model_validate_json(entry["definition"])
+        except Exception as e:
+            self.logger.warning(f"Ignoring cached definition of plugin '{plugin_folder}': {e}")
+            return None
+
+    def put(self, plugin_folder: str, content_hash: str, plugin_definition: PluginDefinition):
+        with self._lock:
+            self._entries[plugin_folder] = {
+                "sha256": content_hash,
+                "definition": plugin_definition.model_dump_json(),
+            }
+            self._dirty = True
+
+    def retain(self, plugin_folders):
+        """Drops the entries of plugin folders that no longer exist."""
+        with self._lock:
+            for plugin_folder in self._entries.keys() - set(plugin_folders):
+                del self._entries[plugin_folder]
+                self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.cache_file))
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({"model_version": self._model_version, "plugins": self._entries}, f)
+                os.replace(tmp_path, self.cache_file)
+                self._dirty = False
+            except Exception as e:
+                self.logger.warning(f"Unable to persist plugin manifest cache '{self.cache_file}': {e}")
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable plugin manifest cache '{self.cache_file}': {e}")
+            return {}
+        if data.get("model_version") != self._model_version:
+            self.logger.info("Plugin definition model changed; discarding the plugin manifest cache.")
+            return {}
+        return data.get("plugins", {})
@@ -0,0 +1,171 @@
+# src/hw_agent/core/plugin_executor.py
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from hw_agent.exceptions.custom_exceptions import PluginExecutionTimeoutError
+from hw_agent.models.plugin_models import PluginExecutionPolicy
+from hw_agent.utils.logger import get_logger
+
+# Returned by _get_cached_result when there is no result to reuse, since None is a result
+_MISSING = object()
+
+
+class PluginExecutor:
+    """
+    Runs the operations of one plugin according to the `execution` section of its config.yaml.
+
+    - timeout_seconds: the caller gets a PluginExecutionTimeoutError once the timeout is reached.
+      Python threads cannot be killed, so the operation keeps running in the background until it
+      returns, and it keeps its concurrency slot until then.
+    - max_concurrency: further callers wait for a free slot; the wait counts towards the timeout.
+    - result_ttl_seconds: results are reused per cache key for that long.
+    - retries / retry_backoff_seconds: failed attempts are retried with exponential backoff.
+
+    Callers asking for a cache key that is already being executed wait for that execution and
+    get its result or its error, instead of running the operation again.
+    """
+
+    def __init__(self, policy: PluginExecutionPolicy, name: str):
+        self.policy = policy
+        self.name = name
+        self.logger = get_logger(f"{self.__class__.__name__}-{name}")
+        self._slots = BoundedSemaphore(policy.max_concurrency) if policy.max_concurrency else None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._thread_pool_lock = Lock()
+        self._shut_down = False
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+        self._results_lock = Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._in_flight_lock = Lock()
+
+    def execute(self, cache_key: Hashable, operation: Callable[[], Any]) -> Any:
+        cached = self._get_cached_result(cache_key)
+        if cached is not _MISSING:
+            self.logger.info(f"Reusing result of '{cache_key}' from the last {self.policy.result_ttl_seconds}s.")
+            return cached
+
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(cache_key)
+            running = in_flight is not None
+            if not running:
+                in_flight = self._in_flight[cache_key] = Future()
+        if running:
+            self.logger.info(f"Waiting for the execution of '{cache_key}' already in progress.")
+            return in_flight.result()
+
+        try:
+            result = self._execute_with_retries(cache_key, operation)
+        except BaseException as e:
+            in_flight.set_exception(e)
+            raise
+        else:
+            in_flight.set_result(result)
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[cache_key]
+        return result
+
+    def _execute_with_retries(self, cache_key: Hashable, operation: Callable[[], Any]) -> Any:
+        attempt = 0
+        while True:
+            try:
+                result = self._execute_once(operation)
+                break
+            except PluginExecutionTimeoutError:
+                raise
+            except Exception as e:
+                if attempt >= self.policy.retries:
+                    raise
+                backoff = self.policy.retry_backoff_seconds * (2 ** attempt)
+                attempt += 1
+                self.logger.warning(f"Attempt {attempt} of '{cache_key}' failed: {e}. Retrying in {backoff}s.")
+                time.sleep(backoff)
+
+        self._store_result(cache_key, result)
+        return result
+
+    def invalidate(self, cache_key: Optional[Hashable] = None):
+        """Drops the cached result of `cache_key`, or every cached result."""
+        with self._results_lock:
+            if cache_key is None:
+                self._results.clear()
+            else:
+                self._results.pop(cache_key, None)
+
+    def shutdown(self):
+        """
+        Drops the cached results and releases the worker threads. Operations already running
+        still complete and their callers get the result; later ones each get a thread of their
+        own, released once they end.
+        """
+        self.invalidate()
+        with self._thread_pool_lock:
+            self._shut_down = True
+            if self._thread_pool:
+                self._thread_pool.shutdown(wait=False)
+                self._thread_pool = None
+
+    def _execute_once(self, operation: Callable[[], Any]) -> Any:
+        timeout = self.policy.timeout_seconds
+        if timeout is None and self._slots is None:
+            return operation()
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        if self._slots and not self._slots.acquire(timeout=timeout if timeout is not None else -1):
+            raise PluginExecutionTimeoutError(
+                f"Plugin '{self.name}' did not get one of its {self.policy.max_concurrency} execution slots within {timeout}s."
+            )
+
+        try:
+            future = self._submit(operation)
+        except Exception:
+            self._release_slot()
+            raise
+        # The slot is given back when the operation ends, not when the caller stops waiting
+        future.add_done_callback(lambda _: self._release_slot())
+
+        remaining = max(deadline - time.monotonic(), 0) if deadline is not None else None
+        try:
+            return future.result(timeout=remaining)
+        except FutureTimeoutError:
+            raise PluginExecutionTimeoutError(f"Plugin '{self.name}' did not complete within {timeout}s.")
+
+    def _release_slot(self):
+        if self._slots:
+            self._slots.release()
+
+    def _submit(self, operation: Callable[[], Any]) -> Future:
+        with self._thread_pool_lock:
+            if self._shut_down:
+                thread_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"plugin-{self.name}")
+                try:
+                    return thread_pool.submit(operation)
+                finally:
+                    thread_pool.shutdown(wait=False)
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.policy.max_concurrency,
+                    thread_name_prefix=f"plugin-{self.name}",
+                )
+            return self._thread_pool.submit(operation)
+
+    def _get_cached_result(self, cache_key: Hashable) -> Any:
+        if not self.policy.result_ttl_seconds:
+            return _MISSING
+        with self._results_lock:
+            entry = self._results.get(cache_key)
+            if not entry:
+                return _MISSING
+            if time.monotonic() >= entry[0]:
+                del self._results[cache_key]
+                return _MISSING
+            return entry[1]
+
+    def _store_result(self, cache_key: Hashable, result: Any):
+        if not self.policy.result_ttl_seconds:
+            return
+        with self._results_lock:
+            self._results[cache_key] = (time.monotonic() + self.policy.result_ttl_seconds, result)
@@ -2,30 +2,48 @@
 
 import os
 import sys
+import time
 import importlib
 import jsonschema
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
 from typing import Dict, List, Optional
 
 from fastapi import Depends
 import yaml
 from hw_agent.core.base_plugin import BasePlugin
+from hw_agent.core.lazy_plugin import LazyPlugin
+from hw_agent.core.manifest_cache import PluginManifestCache
+from hw_agent.core.plugin_watcher import PluginWatcher
 from hw_agent.core.plugin_context import PluginContext
 from hw_agent.core.singleton_meta import SingletonMeta
 from hw_agent.dependencies import get_plugin_cache_service, get_plugin_manager_configuration_service
 from hw_agent.exceptions.custom_exceptions import ConnectionConfigurationError, PluginLoadError, PluginNotFoundError
 from hw_agent.models.computational_models import ComputationalData
-from hw_agent.models.plugin_models import PluginDefinition
+from hw_agent.models.plugin_models import PluginDefinition, PluginDiagnosticsReport, PluginLoadDiagnostics, PluginReloadStatistics
 from hw_agent.services.cache_service import CacheService
 from hw_agent.services.plugin_manager_configuration_service import PluginManagerConfigurationService
 from hw_agent.utils.logger import get_logger
 from hw_agent.core.orchestrator_type import OrchestratorType
 
+# The libyaml based loader is several times faster than the pure Python one, when available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Upper bound of threads used to read plugin definitions and pre-warm plugin imports
+_MAX_LOADER_THREADS = 8
+
 
 class PluginManager(metaclass=SingletonMeta):
     def __init__(self):
         
         self.logger = get_logger("PluginManager") 
-        self.plugins: Dict[str, BasePlugin] = {}
+        # Copy-on-write registry: it is never modified in place, reloads build a new dict and
+        # swap it, so readers always see a complete registry without taking any lock
+        self.plugins: Dict[str, LazyPlugin] = {}
+        self.definitions_load_time_in_seconds: Optional[float] = None
+        self.reload_statistics = PluginReloadStatistics()
+        self.load_diagnostics: Dict[str, PluginLoadDiagnostics] = {}
+        self._reload_lock = RLock()
         
         # Initalize the CacheService and the PluginManagerConfigurationService
         self.cache_service = get_plugin_cache_service()     
@@ -35,24 +53,55 @@ class PluginManager(metaclass=SingletonMeta):
         self.allowed_orchestrator_types = self.config_service.get_config_value('AllowedOrchestratorTypes', [])
         self.plugins_dir = self._get_plugins_directory()
         self.exclude_directories = self.config_service.get_config_value('ExcludeDirectories', [])
+
+        # Validated definitions of unchanged config.yaml files are reused across restarts
+        manifest_cache_file = self.config_service.get_config_value('ManifestCacheFile')
+        self.manifest_cache = PluginManifestCache(manifest_cache_file) if manifest_cache_file else None
         
         # Finally load the plugins
         self._load_plugin_definitions()
 
+        # Optionally reload plugins when their files change
+        self.plugin_watcher: Optional[PluginWatcher] = None
+        if self.config_service.get_config_value('WatchPlugins', False):
+            self.plugin_watcher = PluginWatcher(
+                self.plugins_dir,
+                self.exclude_directories,
+                on_change=self.reload_plugin,
+                interval_in_seconds=self.config_service.get_config_value('WatchIntervalSeconds', 2.0),
+            )
+            self.plugin_watcher.start()
+
+        # Optionally import the plugin modules in the background instead of on first use
+        if self.config_service.get_config_value('PrewarmPlugins', False):
+            self._prewarm_plugins()
 
-    def execute_plugin(self, orchestrator_type: str, plugin_context: PluginContext) -> ComputationalData:
+
+    def execute_plugin(self, orchestrator_type: str, plugin_context: PluginContext, operation: str = "fetch_and_transform",
+                       target: Optional[str] = None) -> ComputationalData:
         """
-        Executes the plugin for the specified orchestrator type.
+        Executes the plugin for the specified orchestrator type, enforcing the execution policy
+        (timeout, concurrency, result TTL and retries) of its config.yaml.
 
         Args:
             orchestrator_type (str): The orchestrator type.
             plugin_context (PluginContext): The context for the plugin execution.
+            operation (str): The plugin method to run, 'fetch' or 'fetch_and_transform'.
+            target (str): Executions of the same operation and target share their result, the
+                config_id by default.
 
         Returns:
             ComputationalData: The result of the plugin execution.
         """
-        plugin = self.get_plugin(orchestrator_type)
-        return plugin.fecth_and_transform(plugin_context)
+        if operation not in ("fetch", "fetch_and_transform"):
+            raise ValueError(f"Unknown plugin operation '{operation}'")
+        # One lookup, so a concurrent reload cannot pair the new plugin with the old executor
+        lazy_plugin = self._get_lazy_plugin(orchestrator_type)
+        plugin_method = getattr(self._get_instance(orchestrator_type, lazy_plugin), operation)
+        return lazy_plugin.executor.execute(
+            (operation, target or plugin_context.config_id),
+            lambda: plugin_method(plugin_context)
+        )
     
     def _get_plugins_directory(self) -> str:
         plugins_directory = self.config_service.get_config_value('PluginsDirectory')
@@ -67,19 +116,148 @@ class PluginManager(metaclass=SingletonMeta):
         self.logger.info(f"Using plugins directory: '{plugins_directory}'")
         return plugins_directory
 
-    def _load_plugin_definitions(self):
+    def _load_plugin_definitions(self, reload: bool = False):
+        """
+        Reads the config.yaml of every plugin and registers a LazyPlugin for it. Plugin modules
+        are imported on first use (see get_plugin), so their dependencies are not part of startup.
+        On reload, the plugin modules are imported again from disk.
+
+        The new registry is built off to the side and swapped in at once: requests keep using the
+        current plugins until the swap, and executions already running finish on them.
+        """
         self.logger.info("Loading plugin definitions...")
-        self.plugins.clear()
-        self.cache_service.clear_plugins() 
+        with self._reload_lock:
+            start_time = time.perf_counter()
+
+            registry: Dict[str, LazyPlugin] = {}
+            plugin_folder_names = self._get_plugin_folder_names()
+
+            # Definitions are read and validated in parallel, then registered in folder order
+            # so that duplicates are resolved the same way on every start
+            with ThreadPoolExecutor(max_workers=self._get_loader_threads(plugin_folder_names)) as executor:
+                lazy_plugins = list(executor.map(lambda folder: self._load_plugin_manifest(folder, reload), plugin_folder_names))
+
+            for lazy_plugin in lazy_plugins:
+                if lazy_plugin and self._is_orchestrator_type_unique(lazy_plugin, registry):
+                    previous = self.plugins.get(lazy_plugin.plugin_definition.orchestrator_type)
+                    self._register_plugin(registry, self._prepare_replacement(lazy_plugin, previous))
+
+            self._swap_registry(registry)
+            if self.manifest_cache:
+                self.manifest_cache.retain(plugin_folder_names)
+                self.manifest_cache.save()
+            self.definitions_load_time_in_seconds = time.perf_counter() - start_time
+            self._record_reload(plugin_folder_names, self.definitions_load_time_in_seconds)
+
+        self.logger.info(
+            f"Total plugins registered: {len(self.plugins)} "
+            f"in {self.definitions_load_time_in_seconds * 1000:.1f} ms"
+        )
+
+    def reload_plugin(self, plugin_folder: str):
+        """
+        Reloads a single plugin from its folder and swaps it into the registry. The other
+        plugins are not touched. If the folder was removed, the plugin is unregistered; if its
+        definition or module is broken, the current version is kept.
+        """
+        self.logger.info(f"Reloading plugin from folder '{plugin_folder}'...")
+        with self._reload_lock:
+            start_time = time.perf_counter()
 
-        plugin_folder_names = self._get_plugin_folder_names()
-        for plugin_folder in plugin_folder_names:
-            self.logger.debug(f"Attempting to load plugin from: '{plugin_folder}'")
-            plugin_instance = self._load_plugin(plugin_folder)
-            if plugin_instance:
-                self._register_plugin(plugin_instance.plugin_definition.orchestrator_type, plugin_instance)
+            registry = dict(self.plugins)
+            previous = None
+            for orchestrator_type, lazy_plugin in list(registry.items()):
+                if lazy_plugin.plugin_folder == plugin_folder:
+                    previous = registry.pop(orchestrator_type)
 
-        self.logger.info(f"Total plugins loaded: {len(self.plugins)}")
+            if os.path.isdir(os.path.join(self.plugins_dir, plugin_folder)):
+                lazy_plugin = self._load_plugin_manifest(plugin_folder, reload=True)
+                if not lazy_plugin:
+                    self.logger.error(f"Plugin in folder '{plugin_folder}' could not be reloaded. Keeping current version.")
+                    return
+                if not self._is_orchestrator_type_unique(lazy_plugin, registry):
+                    return
+                self._register_plugin(registry, self._prepare_replacement(lazy_plugin, previous))
+            else:
+                self.logger.info(f"Plugin folder '{plugin_folder}' was removed. Unregistering plugin.")
+
+            self._swap_registry(registry)
+            if self.manifest_cache:
+                self.manifest_cache.save()
+            self._record_reload([plugin_folder], time.perf_counter() - start_time)
+
+    def _get_loader_threads(self, plugin_folder_names: List[str]) -> int:
+        return max(1, min(_MAX_LOADER_THREADS, len(plugin_folder_names)))
+
+    def _prewarm_plugins(self):
+        """
+        Imports every registered plugin concurrently in background threads. Importing different
+        plugin packages at the same time is safe: Python serializes imports of the same module,
+        and LazyPlugin makes concurrent first uses wait for the running import.
+        """
+        lazy_plugins = list(self.plugins.values())
+        self.logger.info(f"Pre-warming {len(lazy_plugins)} plugins in the background...")
+        executor = ThreadPoolExecutor(max_workers=self._get_loader_threads(lazy_plugins), thread_name_prefix="plugin-prewarm")
+        for lazy_plugin in lazy_plugins:
+            executor.submit(lazy_plugin.get_instance)
+        executor.shutdown(wait=False)
+
+    def get_diagnostics(self) -> PluginDiagnosticsReport:
+        """
+        Returns the load time of each plugin, split into YAML parsing, validation, import and
+        instantiation, to find out which plugin dependency slows down startup.
+        """
+        registry = self.plugins
+        for lazy_plugin in registry.values():
+            if diagnostics := self.load_diagnostics.get(lazy_plugin.plugin_folder):
+                diagnostics.loaded = lazy_plugin.is_loaded
+        return PluginDiagnosticsReport(
+            definitions_load_time_in_seconds=self.definitions_load_time_in_seconds,
+            plugins=sorted(self.load_diagnostics.values(), key=lambda d: d.plugin_folder),
+        )
+
+    def _prepare_replacement(self, lazy_plugin: LazyPlugin, previous: Optional[LazyPlugin]) -> LazyPlugin:
+        """
+        If the previous version was already in use, the new one is imported right away (still off
+        to the side) so the first request after the swap does not pay for the import. If that
+        import fails, the previous version is kept.
+        """
+        if previous is None or not previous.is_loaded:
+            return lazy_plugin
+        if lazy_plugin.get_instance() is None:
+            self.logger.error(
+                f"New version of plugin '{lazy_plugin.plugin_definition.name}' could not be loaded. Keeping current version."
+            )
+            return previous
+        return lazy_plugin
+
+    def _swap_registry(self, registry: Dict[str, LazyPlugin]):
+        previous_registry = self.plugins
+        self.plugins = registry
+        for orchestrator_type in previous_registry.keys() - registry.keys():
+            self.cache_service.remove_plugin(orchestrator_type)
+        for orchestrator_type, lazy_plugin in registry.items():
+            if lazy_plugin.is_loaded:
+                self.cache_service.store_plugin(orchestrator_type, lazy_plugin.get_instance())
+            else:
+                self.cache_service.remove_plugin(orchestrator_type)
+        # Versions that were replaced or removed release their thread pool and cached results
+        current = {id(lazy_plugin) for lazy_plugin in registry.values()}
+        for lazy_plugin in previous_registry.values():
+            if id(lazy_plugin) not in current:
+                lazy_plugin.close()
+        self.reload_statistics.swaps += 1
+
+    def _record_reload(self, plugin_folders: List[str], reload_time_in_seconds: float):
+        statistics = self.reload_statistics
+        statistics.reloads += 1
+        statistics.last_reload_time_in_seconds = reload_time_in_seconds
+        statistics.total_reload_time_in_seconds += reload_time_in_seconds
+        statistics.last_reloaded_plugins = list(plugin_folders)
+        self.logger.info(f"Reloaded {plugin_folders} in {reload_time_in_seconds * 1000:.1f} ms.")
+
+    def get_reload_statistics(self) -> PluginReloadStatistics:
+        return self.reload_statistics
 
     def _get_plugin_folder_names(self) -> List[str]:
         try:
@@ -94,13 +272,21 @@ class PluginManager(metaclass=SingletonMeta):
             raise PluginLoadError(plugin_names, e)
 
     def _load_plugin(self, plugin_folder: str) -> Optional[BasePlugin]:
+        lazy_plugin = self._load_plugin_manifest(plugin_folder)
+        if not lazy_plugin:
+            return None
+
+        # Instantiate the plugin and set the configuration
+        return lazy_plugin.get_instance()
+
+    def _load_plugin_manifest(self, plugin_folder: str, reload: bool = False) -> Optional[LazyPlugin]:
         plugin_definition = self._read_plugin_definition(plugin_folder)
         
         if not plugin_definition:
             self.logger.warning(f"Error parsing config.yaml '{plugin_folder}'. Skipping plugin.")    
             return None
 
-        # Check if the orchestrator type is allowed and it is not duplicated
+        # Check if the orchestrator type is allowed
         if not self._is_orchestrator_type_allowed(plugin_definition.orchestrator_type, plugin_definition.name):
             self.logger.warning(f"Orchestrator type '{plugin_definition.orchestrator_type}' is not allowed. Skipping plugin.")
             return None
@@ -109,10 +295,41 @@ class PluginManager(metaclass=SingletonMeta):
             self.logger.warning(f"Module not specified in config.yaml for plugin '{plugin_definition.name}'. Skipping plugin.")
             return None
 
-        # Instantiate the plugin and set the configuration
-        plugin_instance = self._import_plugin_instance(plugin_folder, plugin_definition)
+        # The connection schema is compiled once here, and dropped with the LazyPlugin on reload
+        diagnostics = self._get_load_diagnostics(plugin_folder)
+        diagnostics.orchestrator_type = plugin_definition.orchestrator_type
+        start_time = time.perf_counter()
+        try:
+            connection_validator = self._compile_connection_validator(
+                plugin_definition.connection_schema,
+                check_schema=not diagnostics.manifest_cache_hit
+            )
+        except jsonschema.SchemaError as e:
+            self.logger.error(f"Invalid connection_schema in plugin '{plugin_definition.name}': {e.message}. Skipping plugin.")
+            diagnostics.error = f"Invalid connection_schema: {e.message}"
+            return None
+        diagnostics.validation_time_in_seconds = (diagnostics.validation_time_in_seconds or 0) + time.perf_counter() - start_time
+
+        # Only definitions with a valid connection schema are cached
+        if self.manifest_cache and not diagnostics.manifest_cache_hit and diagnostics.config_sha256:
+            self.manifest_cache.put(plugin_folder, diagnostics.config_sha256, plugin_definition)
+
+        # The plugin module is imported and instantiated on first use
+        loader = self._reimport_plugin_instance if reload else self._import_plugin_instance
+        return LazyPlugin(plugin_folder, plugin_definition, loader, connection_validator)
 
-        return plugin_instance
+    def _compile_connection_validator(self, schema: Optional[dict], check_schema: bool = True) -> Optional[jsonschema.protocols.Validator]:
+        """
+        Builds the validator for a connection schema, using the Draft declared by its '$schema'
+        (latest Draft otherwise) and checking the 'format' keywords. The schema itself is checked
+        unless it comes from the manifest cache, where it was already checked.
+        """
+        if schema is None:
+            return None
+        validator_class = jsonschema.validators.validator_for(schema)
+        if check_schema:
+            validator_class.check_schema(schema)
+        return validator_class(schema, format_checker=validator_class.FORMAT_CHECKER)
 
 
     def _read_plugin_definition(self, plugin_name: str) -> PluginDefinition:
@@ -120,41 +337,89 @@ class PluginManager(metaclass=SingletonMeta):
         if not os.path.isfile(config_path):
             self.logger.warning(f"No config.yaml found in plugin directory '{plugin_name}'. Skipping plugin.")
             return None 
+        diagnostics = self._new_load_diagnostics(plugin_name)
         try:
             with open(config_path, 'r') as config_file:
-                config_data = yaml.safe_load(config_file)
-                self.logger.debug(f"Loaded config for plugin '{plugin_name}': {config_data}")
-                return PluginDefinition(**config_data)
+                content = config_file.read()
+
+            # Unchanged config.yaml files are not parsed nor validated again
+            content_hash = PluginManifestCache.hash_content(content)
+            diagnostics.config_sha256 = content_hash
+            if self.manifest_cache:
+                start_time = time.perf_counter()
+                plugin_definition = self.manifest_cache.get(plugin_name, content_hash)
+                if plugin_definition:
+                    diagnostics.manifest_cache_hit = True
+                    diagnostics.validation_time_in_seconds = time.perf_counter() - start_time
+                    self.logger.debug(f"Loaded cached definition for plugin '{plugin_name}'")
+                    return plugin_definition
+
+            start_time = time.perf_counter()
+            config_data = yaml.load(content, Loader=_YAML_LOADER)
+            diagnostics.yaml_parse_time_in_seconds = time.perf_counter() - start_time
+            self.logger.debug(f"Loaded config for plugin '{plugin_name}': {config_data}")
+
+            start_time = time.perf_counter()
+            plugin_definition = PluginDefinition(**config_data)
+            diagnostics.validation_time_in_seconds = time.perf_counter() - start_time
+            return plugin_definition
         except Exception as e:
             self.logger.error(f"Error reading plugin definition for plugin '{plugin_name}': {e}")
+            diagnostics.error = str(e)
             return None
 
+    def _new_load_diagnostics(self, plugin_folder: str) -> PluginLoadDiagnostics:
+        diagnostics = PluginLoadDiagnostics(plugin_folder=plugin_folder)
+        self.load_diagnostics[plugin_folder] = diagnostics
+        return diagnostics
+
+    def _get_load_diagnostics(self, plugin_folder: str) -> PluginLoadDiagnostics:
+        return self.load_diagnostics.get(plugin_folder) or self._new_load_diagnostics(plugin_folder)
+
     def _is_orchestrator_type_allowed(self, orchestrator_type: str, plugin_name: str) -> bool:
         if orchestrator_type not in self.allowed_orchestrator_types:
             self.logger.warning(f"Invalid OrchestratorType '{orchestrator_type}' in plugin '{plugin_name}'. Skipping plugin.")
             return False
-        if orchestrator_type in self.plugins:
-            self.logger.warning(f"Duplicate OrchestratorType '{orchestrator_type}' found in plugin '{plugin_name}'. Skipping plugin.")
+        return True
+
+    def _is_orchestrator_type_unique(self, lazy_plugin: LazyPlugin, registry: Dict[str, LazyPlugin]) -> bool:
+        plugin_definition = lazy_plugin.plugin_definition
+        if plugin_definition.orchestrator_type in registry:
+            self.logger.warning(f"Duplicate OrchestratorType '{plugin_definition.orchestrator_type}' found in plugin '{plugin_definition.name}'. Skipping plugin.")
             return False
         return True
 
+    def _reimport_plugin_instance(self, plugin_folder: str, plugin_definition: PluginDefinition) -> Optional[BasePlugin]:
+        """
+        Loader of reloaded plugins: the plugin modules are removed from sys.modules first, so
+        they are imported again from disk. Instances of the previous version keep their own
+        module objects.
+        """
+        plugin_package = f"hw_agent.plugins.{plugin_folder}."
+        for loaded_module in [name for name in sys.modules if name.startswith(plugin_package)]:
+            del sys.modules[loaded_module]
+        importlib.invalidate_caches()
+        return self._import_plugin_instance(plugin_folder, plugin_definition)
+
     def _import_plugin_instance(self, plugin_folder: str, plugin_definition: PluginDefinition) -> Optional[BasePlugin]:
         module_full_name = f"hw_agent.plugins.{plugin_folder}.{plugin_definition.module}"
+        diagnostics = self._get_load_diagnostics(plugin_folder)
         try:
-            # Remove module from sys.modules if already loaded to allow reloading
-            if module_full_name in sys.modules:
-                del sys.modules[module_full_name]
+            start_time = time.perf_counter()
             module = importlib.import_module(module_full_name)
-            importlib.reload(module)
+            diagnostics.import_time_in_seconds = time.perf_counter() - start_time
 
             plugin_class = self._find_plugin_class_in_module(module)
             if not plugin_class:
                 self.logger.error(f"No valid plugin class found in module '{module_full_name}'.")
+                diagnostics.error = f"No valid plugin class found in module '{module_full_name}'"
                 return None
 
             # Instantiate the plugin and set the plugin configuration
+            start_time = time.perf_counter()
             plugin_instance = plugin_class()
             plugin_instance.plugin_definition = plugin_definition
+            diagnostics.instantiation_time_in_seconds = time.perf_counter() - start_time
             
             self.logger.info(f"Loaded plugin '{plugin_definition.name}' for orchestrator '{plugin_definition.orchestrator_type}'.")
             
@@ -162,6 +427,7 @@ class PluginManager(metaclass=SingletonMeta):
 
         except Exception as e:
             self.logger.error(f"Error importing and initializing plugin '{module_full_name}': {e}")
+            diagnostics.error = str(e)
             return None
                 
     def _find_plugin_class_in_module(self, module) -> Optional[type]:
@@ -176,21 +442,34 @@ class PluginManager(metaclass=SingletonMeta):
                 return attribute
         return None
 
-    def _register_plugin(self, orchestrator_type: str, plugin_instance: BasePlugin):
-        self.plugins[orchestrator_type] = plugin_instance
-        self.cache_service.store_plugin(orchestrator_type, plugin_instance)
+    def _register_plugin(self, registry: Dict[str, LazyPlugin], lazy_plugin: LazyPlugin):
+        orchestrator_type = lazy_plugin.plugin_definition.orchestrator_type
+        registry[orchestrator_type] = lazy_plugin
         self.logger.info(f"Registered plugin for orchestrator '{orchestrator_type}'.")
 
     def get_plugin(self, orchestrator_type: str) -> BasePlugin:
         plugin = self.cache_service.retrieve_plugin(orchestrator_type)
         if not plugin:
-            plugin = self.plugins.get(orchestrator_type)
-            if not plugin:
-                self.logger.error(f"No plugin found for orchestrator type: '{orchestrator_type}'.")
-                raise PluginNotFoundError(f"No plugin found for orchestrator type: {orchestrator_type}")
+            plugin = self._get_instance(orchestrator_type, self._get_lazy_plugin(orchestrator_type))
+        return plugin
+
+    def _get_instance(self, orchestrator_type: str, lazy_plugin: LazyPlugin) -> BasePlugin:
+        plugin = lazy_plugin.get_instance()
+        if not plugin:
+            self.logger.error(f"Plugin for orchestrator type '{orchestrator_type}' could not be loaded.")
+            raise PluginLoadError(f"Plugin for orchestrator type {orchestrator_type} could not be loaded")
+        # Do not cache an instance that a concurrent reload has already replaced
+        if self.plugins.get(orchestrator_type) is lazy_plugin:
             self.cache_service.store_plugin(orchestrator_type, plugin)
         return plugin
 
+    def _get_lazy_plugin(self, orchestrator_type: str) -> LazyPlugin:
+        lazy_plugin = self.plugins.get(orchestrator_type)
+        if not lazy_plugin:
+            self.logger.error(f"No plugin found for orchestrator type: '{orchestrator_type}'.")
+            raise PluginNotFoundError(f"No plugin found for orchestrator type: {orchestrator_type}")
+        return lazy_plugin
+
     def get_all_plugins(self) -> List[BasePlugin]:
         return [
             {
@@ -199,36 +478,48 @@ class PluginManager(metaclass=SingletonMeta):
             for _, plugin in self.plugins.items()
         ]
 
+    def reload_plugin_by_orchestrator_type(self, orchestrator_type: str) -> PluginDefinition:
+        self.reload_plugin(self._get_lazy_plugin(orchestrator_type).plugin_folder)
+        return self._get_lazy_plugin(orchestrator_type).plugin_definition
+
     def reload_plugins(self) -> List[BasePlugin]:
         self.logger.info("Reloading all plugins...")
-        self._load_plugin_definitions()
+        self._load_plugin_definitions(reload=True)
         self.logger.info("Reloaded all plugins...")
         return self.get_all_plugins()
 
     def validate_connection_info(self, connection_definition: dict, orchestratory_type: OrchestratorType) -> bool:
-        if plugin := self.get_plugin(orchestratory_type):
-            try:
-                self._validate_connection_info(plugin.plugin_definition.connection_schema, connection_definition)
-            except jsonschema.ValidationError as e:
-                self.logger.error(f"Connection data validation error: {e.message}")
-                raise ConnectionConfigurationError(e)
+        # Only the plugin definition is needed, the plugin module is not imported
+        if plugin := self._get_lazy_plugin(orchestratory_type):
+            self._validate_connection_info(plugin.connection_validator, connection_definition)
+            return True
         else:
             self.logger.error(f"No plugin found for orchestrator type: '{orchestratory_type}'.")
             raise PluginNotFoundError(f"No plugin found for orchestrator type: {orchestratory_type}")
     
     
 
-    def _validate_connection_info(self, schema: dict, connection_data: dict) -> dict:
+    def _validate_connection_info(self, validator: Optional[jsonschema.protocols.Validator], connection_data: dict) -> dict:
         """
-        Validates 'connection_data' against a JSON Schema given by 'schema'.
+        Validates 'connection_data' with the precompiled validator of the plugin's connection schema.
         
-        :param schema: A dict containing the JSON Schema structure.
+        :param validator: The validator compiled from the plugin's connection schema, or None if the plugin has no schema.
         :param connection_data: The user-supplied connection info dict.
         :return: The same 'connection_data' if validation passes.
-        :raises ValidationError: If the data does not match the schema.
+        :raises ConnectionConfigurationError: With every validation error found, if the data does not match the schema.
         """
-        try:
-            jsonschema.validate(instance=connection_data, schema=schema)
+        if validator is None:
             return connection_data
-        except Exception as e:
-            raise jsonschema.ValidationError(f"JSON Schema validation error: {e.message}") from e
+
+        errors = sorted(validator.iter_errors(connection_data), key=lambda e: list(e.absolute_path))
+        if errors:
+            error_details = [
+                {"location": list(error.absolute_path), "message": error.message}
+                for error in errors
+            ]
+            self.logger.error(f"Connection data validation errors: {[e['message'] for e in error_details]}")
+            raise ConnectionConfigurationError(
+                f"JSON Schema validation error: {len(errors)} error(s) found in connection info",
+                errors=error_details
+            )
+        return connection_data
@@ -0,0 +1,97 @@
+# src/hw_agent/core/plugin_watcher.py
+
+import os
+from threading import Event, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hw_agent.utils.logger import get_logger
+
+# Files that never affect a plugin
+_IGNORED_SUFFIXES = ('.pyc', '.pyo', '.swp', '~')
+
+
+class PluginWatcher:
+    """
+    Polls the plugins directory and calls `on_change` with the name of every plugin folder whose
+    files were added, modified or removed since the previous poll.
+
+    Polling keeps the watcher free of extra dependencies; a plugin folder holds a handful of files,
+    so a poll is only a few stat calls.
+    """
+
+    def __init__(
+        self,
+        plugins_dir: str,
+        exclude_directories: List[str],
+        on_change: Callable[[str], None],
+        interval_in_seconds: float = 2.0,
+    ):
+        self.plugins_dir = plugins_dir
+        self.exclude_directories = exclude_directories
+        self.on_change = on_change
+        self.interval_in_seconds = interval_in_seconds
+        self.logger = get_logger(self.__class__.__name__)
+        self._snapshot = self._take_snapshot()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self):
+        self._thread = Thread(target=self._run, name="plugin-watcher", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Watching '{self.plugins_dir}' for plugin changes every {self.interval_in_seconds}s.")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+
+    def check(self) -> List[str]:
+        """
+        Compares the plugins directory with the previous poll, notifies and returns the plugin
+        folders that changed.
+        """
+        snapshot = self._take_snapshot()
+        changed_folders = sorted(
+            folder for folder in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(folder) != self._snapshot.get(folder)
+        )
+        self._snapshot = snapshot
+
+        for folder in changed_folders:
+            self.logger.info(f"Change detected in plugin folder '{folder}'.")
+            try:
+                self.on_change(folder)
+            except Exception as e:
+                self.logger.error(f"Error reloading plugin folder '{folder}': {e}")
+        return changed_folders
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval_in_seconds):
+            try:
+                self.check()
+            except Exception as e:
+                self.logger.error(f"Error watching plugins directory '{self.plugins_dir}': {e}")
+
+    def _take_snapshot(self) -> Dict[str, Tuple]:
+        snapshot = {}
+        for folder in os.listdir(self.plugins_dir):
+            folder_path = os.path.join(self.plugins_dir, folder)
+            if folder in self.exclude_directories or not os.path.isdir(folder_path):
+                continue
+            snapshot[folder] = self._folder_signature(folder_path)
+        return snapshot
+
+    def _folder_signature(self, folder_path: str) -> Tuple:
+        signature = []
+        for root, directories, files in os.walk(folder_path):
+            directories[:] = [d for d in directories if d not in self.exclude_directories]
+            for file_name in files:
+                if file_name.endswith(_IGNORED_SUFFIXES):
+                    continue
+                file_path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                signature.append((os.path.relpath(file_path, folder_path), stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(signature))
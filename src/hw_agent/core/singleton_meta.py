@@ -33,4 +33,11 @@ class SingletonMeta(type):
             if cls not in cls._instances:
                 instance = super().__call__(*args, **kwargs)
                 cls._instances[cls] = instance
-        return cls._instances[cls]
\ No newline at end of file
+        return cls._instances[cls]
+
+    def existing_instance(cls):
+        """
+        Returns the instance if it was already created, None otherwise. Used to release the
+        resources of a singleton without creating it.
+        """
+        return cls._instances.get(cls)
\ No newline at end of file
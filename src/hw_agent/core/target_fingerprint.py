@@ -0,0 +1,137 @@
+# src/hw_agent/core/target_fingerprint.py
+
+import hashlib
+import json
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from hw_agent.core.orchestrator_type import OrchestratorType
+from hw_agent.models.connection_config_models import DuplicateTargetGroup
+
+# Extracts the (endpoint, identity) of the infrastructure a connection info points to, or None
+TargetExtractor = Callable[[dict], Optional[Tuple[Any, Any]]]
+
+_extractors: Dict[str, TargetExtractor] = {}
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443, 'ssh': 22}
+
+_OPENSTACK_SECRETS = ('password', 'application_credential_id', 'application_credential_secret', 'token')
+_SSH_SECRETS = ('private_key', 'password')
+
+
+def target_extractor(orchestrator_type: OrchestratorType):
+    """Registers the target extractor of an orchestrator type."""
+    def decorator(extractor: TargetExtractor):
+        _extractors[str(orchestrator_type)] = extractor
+        return extractor
+    return decorator
+
+
+def compute_target_fingerprint(orchestrator_type, connection_info: Optional[dict]) -> str:
+    """
+    SHA-256 of the orchestrator type, the normalized endpoint and the identity used on it,
+    credentials included.
+    Configurations with the same fingerprint collect the same data. Without an extractor for
+    the orchestrator type, or if the extractor finds no endpoint, the whole connection info
+    is the target: only identical copies then share a fingerprint.
+    """
+    orchestrator_type = str(orchestrator_type)
+    extractor = _extractors.get(orchestrator_type)
+    target = extractor(connection_info or {}) if extractor else None
+    if target is None:
+        target = connection_info
+    canonical = json.dumps([orchestrator_type, target], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def group_duplicate_targets(targets: Iterable[Tuple[str, str, str]]) -> List[DuplicateTargetGroup]:
+    """Groups (target_fingerprint, orchestrator_type, config_id) by fingerprint, keeping groups of two or more."""
+    groups: Dict[str, List[str]] = defaultdict(list)
+    orchestrator_types: Dict[str, str] = {}
+    for fingerprint, orchestrator_type, config_id in targets:
+        groups[fingerprint].append(config_id)
+        orchestrator_types[fingerprint] = orchestrator_type
+    return [
+        DuplicateTargetGroup(
+            target_fingerprint=fingerprint,
+            orchestrator_type=orchestrator_types[fingerprint],
+            config_ids=sorted(config_ids),
+        )
+        for fingerprint, config_ids in sorted(groups.items())
+        if len(config_ids) > 1
+    ]
+
+
+def normalize_url(url: str) -> str:
+    """Lower-cases scheme and host, drops default ports, credentials, query and trailing slashes."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = normalize_host(parts.hostname or '')
+    if ':' in host:
+        host = f'[{host}]'
+    port = parts.port
+    netloc = host if port in (None, _DEFAULT_PORTS.get(scheme)) else f'{host}:{port}'
+    return urlunsplit((scheme, netloc, parts.path.rstrip('/'), '', ''))
+
+
+def normalize_host(host: str) -> str:
+    return host.strip().lower().rstrip('.')
+
+
+def _secret_digest(values: dict, keys: Iterable[str]) -> str:
+    """
+    SHA-256 of the secrets among `keys`. Part of the identity: configurations with the same
+    endpoint and user but different, possibly wrong or revoked, credentials must each
+    authenticate on their own instead of sharing the collection of another one.
+    """
+    secrets = [values.get(key) for key in keys]
+    return hashlib.sha256(json.dumps(secrets, separators=(',', ':'), default=str).encode()).hexdigest()
+
+
+def _by_name(entries: Optional[list], name: Optional[str], key: str) -> dict:
+    for entry in entries or []:
+        if isinstance(entry, dict) and entry.get('name') == name:
+            return entry.get(key) or {}
+    return {}
+
+
+@target_extractor(OrchestratorType.KUBERNETES)
+def _kubernetes_target(connection_info: dict):
+    # The cluster and user of the current context are the ones the plugin connects to
+    kubeconfig = connection_info.get('kubeconfig') or {}
+    context = _by_name(kubeconfig.get('contexts'), kubeconfig.get('current-context'), 'context')
+    cluster = _by_name(kubeconfig.get('clusters'), context.get('cluster'), 'cluster')
+    if not cluster.get('server'):
+        return None
+    user = _by_name(kubeconfig.get('users'), context.get('user'), 'user')
+    return normalize_url(cluster['server']), user
+
+
+@target_extractor(OrchestratorType.OPENSTACK)
+def _openstack_target(connection_info: dict):
+    if not connection_info.get('auth_url'):
+        return None
+    endpoint = (normalize_url(connection_info['auth_url']), connection_info.get('region_name'))
+    identity = tuple(
+        connection_info.get(key)
+        for key in ('user_domain_name', 'username', 'project_domain_name', 'project_name', 'project_id')
+    ) + (_secret_digest(connection_info, _OPENSTACK_SECRETS),)
+    return endpoint, identity
+
+
+@target_extractor(OrchestratorType.HPC)
+def _hpc_target(connection_info: dict):
+    ssh_credentials = connection_info.get('ssh_credentials') or {}
+    if not ssh_credentials.get('login_node'):
+        return None
+    endpoint = (normalize_host(ssh_credentials['login_node']), ssh_credentials.get('port') or _DEFAULT_PORTS['ssh'])
+    return endpoint, (ssh_credentials.get('user'), _secret_digest(ssh_credentials, _SSH_SECRETS))
+
+
+@target_extractor(OrchestratorType.SLURM)
+def _slurm_target(connection_info: dict):
+    if not connection_info.get('host'):
+        return None
+    endpoint = (normalize_host(connection_info['host']), connection_info.get('port') or _DEFAULT_PORTS['ssh'])
+    return endpoint, (connection_info.get('user'), _secret_digest(connection_info, _SSH_SECRETS))
@@ -3,11 +3,16 @@
 from hw_agent.services.cache_service import CacheService
 from hw_agent.services.plugin_manager_configuration_service import PluginManagerConfigurationService
 from hw_agent.services.settings_service import SettingsService
+from hw_agent.utils.http_session import create_async_http_client, create_http_session
+import httpx
+import requests
 
 # Singleton instances to avoid multiple loads
 _plugin_manager_config_service_instance = None
 _plugin_cache_service_instance = None
 _setting_service_instance = None
+_http_session_instance = None
+_async_http_client_instance = None
 
 
 def get_plugin_manager_configuration_service() -> PluginManagerConfigurationService:
@@ -28,3 +33,21 @@ def get_setting_service() -> SettingsService:
         _setting_service_instance = SettingsService()
     return _setting_service_instance
 
+def get_http_session() -> requests.Session:
+    global _http_session_instance
+    if _http_session_instance is None:
+        _http_session_instance = create_http_session(get_setting_service())
+    return _http_session_instance
+
+def get_async_http_client() -> httpx.AsyncClient:
+    # Bound to the event loop it is first used on, closed with close_async_http_client
+    global _async_http_client_instance
+    if _async_http_client_instance is None:
+        _async_http_client_instance = create_async_http_client(get_setting_service())
+    return _async_http_client_instance
+
+async def close_async_http_client():
+    global _async_http_client_instance
+    if _async_http_client_instance is not None:
+        client, _async_http_client_instance = _async_http_client_instance, None
+        await client.aclose()
@@ -14,9 +14,24 @@ class AuthenticationError(Exception):
     
 class APIRequestError(Exception):
     """Exception raised when an API request fails."""
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        # HTTP status of the answer, None if there was no answer
+        self.status_code = status_code
 
 class PluginLoadError(Exception):
     """Exception raised when a plugin configuration is invalid."""
     
+class PluginExecutionTimeoutError(Exception):
+    """Exception raised when a plugin execution exceeds its timeout."""
+
 class ConnectionConfigurationError(Exception):
-    """Exception raised when a connection configuration is invalid."""
\ No newline at end of file
+    """Exception raised when a connection configuration is invalid."""
+
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        # Every validation error found, as dicts with 'location' and 'message'
+        self.errors = errors or []
+
+class RepositoryMigrationInProgressError(Exception):
+    """Exception raised when a repository migration is started while another one is running."""
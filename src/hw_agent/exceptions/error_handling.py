@@ -5,7 +5,7 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
 from pydantic import ValidationError
-from hw_agent.exceptions.custom_exceptions import APIRequestError, AuthenticationError, ConfigurationNotFoundError, ConnectionConfigurationError, PluginNotFoundError, ExternalAPIError
+from hw_agent.exceptions.custom_exceptions import APIRequestError, AuthenticationError, ConfigurationNotFoundError, ConnectionConfigurationError, PluginExecutionTimeoutError, PluginLoadError, PluginNotFoundError, ExternalAPIError, RepositoryMigrationInProgressError
 
 
 class ErrorDescription:
@@ -44,6 +44,27 @@ def add_exception_handlers(app):
             content=ErrorDescription(exc, "The requested plugin was not found").to_dict()
         )
 
+    @app.exception_handler(PluginLoadError)
+    async def plugin_load_error_handler(request: Request, exc: PluginLoadError):
+        return JSONResponse(
+            status_code=500,
+            content=ErrorDescription(exc, "The requested plugin could not be loaded").to_dict()
+        )
+
+    @app.exception_handler(RepositoryMigrationInProgressError)
+    async def repository_migration_in_progress_handler(request: Request, exc: RepositoryMigrationInProgressError):
+        return JSONResponse(
+            status_code=409,
+            content=ErrorDescription(exc, "Another repository migration is running").to_dict()
+        )
+
+    @app.exception_handler(PluginExecutionTimeoutError)
+    async def plugin_execution_timeout_handler(request: Request, exc: PluginExecutionTimeoutError):
+        return JSONResponse(
+            status_code=504,
+            content=ErrorDescription(exc, "The plugin did not complete in time").to_dict()
+        )
+
     @app.exception_handler(ExternalAPIError)
     async def external_api_error_handler(request: Request, exc: ExternalAPIError):
         return JSONResponse(
@@ -117,5 +138,5 @@ def add_exception_handlers(app):
     async def validate_connection_info(request: Request, exc: ConnectionConfigurationError):
         return JSONResponse(
             status_code=400,
-            content=ErrorDescription(exc)
+            content=ErrorDescription(exc, exc.errors or None).to_dict()
         )
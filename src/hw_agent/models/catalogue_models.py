@@ -0,0 +1,46 @@
+from typing import Any, List, Literal, Optional
+from pydantic import BaseModel, Field, model_validator
+from hw_agent.models.computational_asset import ComputationalAsset
+
+
+class BulkPublishRequest(BaseModel):
+    assets: List[ComputationalAsset] = Field(default=[], description="Assets to publish as they are")
+    config_ids: List[str] = Field(default=[], description="Configurations to collect and transform into the assets to publish")
+    concurrency: Optional[int] = Field(default=None, ge=1, le=256, description="Items handled at once, CATALOGUE_PUBLISH_CONCURRENCY by default")
+    rate_per_second: Optional[float] = Field(default=None, gt=0, description="Most requests sent to the catalogue per second, CATALOGUE_PUBLISH_RATE_PER_SECOND by default")
+
+    @model_validator(mode='after')
+    def check_items(self):
+        items = len(self.assets) + len(self.config_ids)
+        if items == 0:
+            raise ValueError("At least one asset or config_id is required")
+        if items > 1000:
+            raise ValueError("At most 1000 assets and config_ids can be published at once")
+        return self
+
+
+class BulkPublishItemResult(BaseModel):
+    index: int = Field(description="Position of the item: the assets first, then the config_ids")
+    config_id: Optional[str] = None
+    status: Literal['published', 'failed']
+    stage: Optional[Literal['collect', 'publish']] = Field(default=None, description="Step a failed item stopped at")
+    error: Optional[str] = None
+    response: Optional[Any] = Field(default=None, description="Answer of the catalogue to a published asset")
+
+
+class BulkPublishResult(BaseModel):
+    published: int
+    failed: int
+    duration_seconds: float
+    items: List[BulkPublishItemResult]
+
+
+class CatalogueMirrorStatistics(BaseModel):
+    max_age_seconds: float
+    max_entries: int
+    persistent: bool = Field(description="Whether the mirror is backed by a SQLite file")
+    size: int = 0
+    hits: int = Field(default=0, description="Lookups answered from the mirror without asking the catalogue")
+    revalidated: int = Field(default=0, description="Lookups the catalogue confirmed with 304 Not Modified")
+    fetched: int = Field(default=0, description="Lookups that downloaded the asset")
+    evictions: int = 0
@@ -1,5 +1,6 @@
-from typing import Any, Optional
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, List, Literal, Optional
+from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
 from hw_agent.core.orchestrator_type import OrchestratorType
 
 
@@ -23,4 +24,88 @@ class ConnectionConfigRead(BaseModel):
     config_id: str
     metadata: ConnectionConfigMetadata
     orchestrator_type: OrchestratorType
-    connection_info: dict[str, Any]    
\ No newline at end of file
+    connection_info: dict[str, Any]
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    target_fingerprint: Optional[str] = Field(default=None, description="Shared by the configurations of the same infrastructure and identity")
+
+
+class ConnectionConfigSummary(BaseModel):
+    config_id: str
+    metadata: ConnectionConfigMetadata
+    orchestrator_type: OrchestratorType
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    target_fingerprint: Optional[str] = Field(default=None, description="Shared by the configurations of the same infrastructure and identity")
+    connection_info: Optional[dict[str, Any]] = Field(default=None, description="Only returned when include_connection_info is set")
+
+
+class ConnectionConfigQuery(BaseModel):
+    orchestrator_type: Optional[OrchestratorType] = Field(default=None, description="Only configurations of this orchestrator type")
+    name: Optional[str] = Field(default=None, description="Only configurations whose name starts with this value")
+    contact: Optional[str] = Field(default=None, description="Only configurations with this contact")
+    created_after: Optional[datetime] = Field(default=None, description="Only configurations created at or after this time")
+    created_before: Optional[datetime] = Field(default=None, description="Only configurations created before this time")
+    updated_after: Optional[datetime] = Field(default=None, description="Only configurations updated at or after this time")
+    updated_before: Optional[datetime] = Field(default=None, description="Only configurations updated before this time")
+    sort_by: Literal['created_at', 'updated_at', 'name', 'contact', 'orchestrator_type'] = 'created_at'
+    order: Literal['asc', 'desc'] = 'asc'
+    limit: int = Field(default=100, ge=1, le=1000, description="Maximum number of configurations in the page")
+    cursor: Optional[str] = Field(default=None, description="The next_cursor of the previous page")
+    include_connection_info: bool = Field(default=False, description="Also return the connection info of each configuration")
+
+    @field_validator('cursor', mode='before')
+    def empty_cursor_is_first_page(cls, v):
+        return v or None
+
+    @model_validator(mode='after')
+    def cursor_must_match_sort(self):
+        # Imported here, the repositories package imports this module
+        from hw_agent.repositories.pagination import decode_cursor
+        if self.cursor is not None:
+            sort_by, order, _, _ = decode_cursor(self.cursor)
+            if (sort_by, order) != (self.sort_by, self.order):
+                raise ValueError("cursor was issued for a different sort_by or order")
+        return self
+
+
+class ConnectionConfigPage(BaseModel):
+    items: List[ConnectionConfigSummary]
+    next_cursor: Optional[str] = Field(default=None, description="Cursor of the next page, None on the last page")
+
+
+class DuplicateTargetGroup(BaseModel):
+    target_fingerprint: str
+    orchestrator_type: OrchestratorType
+    config_ids: List[str] = Field(description="Configurations of the same target, collected once")
+
+
+class BulkImportItemResult(BaseModel):
+    index: int = Field(description="Position of the configuration in the imported document")
+    status: Literal['created', 'invalid', 'skipped']
+    config_id: Optional[str] = None
+    errors: Optional[List[dict]] = Field(default=None, description="Validation errors of an invalid configuration")
+
+
+class BulkImportResult(BaseModel):
+    created: int
+    invalid: int
+    skipped: int
+    items: List[BulkImportItemResult]
+
+
+class ConfigurationCacheStatistics(BaseModel):
+    max_size: int
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    generation_changes: int = Field(default=0, description="Times the cache was dropped because the repository changed")
+    generation: Optional[int] = Field(default=None, description="Repository generation of the cached configurations")
+
+    @computed_field
+    @property
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
@@ -0,0 +1,46 @@
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, model_validator
+
+
+class RepositoryMigrationRequest(BaseModel):
+    source: str = Field(description="Repository type to copy from, e.g. 'yaml'")
+    target: str = Field(description="Repository type to copy to, e.g. 'sqlite'")
+    batch_size: int = Field(default=500, ge=1, le=10000, description="Configurations read and written at once")
+    resume: bool = Field(default=True, description="Continue from the progress file of a previous run of the same migration")
+    max_rounds: int = Field(default=3, ge=1, le=20, description="Verification passes before giving up on a source that keeps changing")
+
+    @model_validator(mode='after')
+    def check_repository_types(self):
+        # Imported here: the repositories import the models
+        from hw_agent.repositories.repository_factory import RepositoryFactory
+        supported_types = RepositoryFactory.supported_types()
+        for repository_type in (self.source, self.target):
+            if repository_type not in supported_types:
+                raise ValueError(f"Unsupported repository type: {repository_type}. Use one of {supported_types}")
+        if self.source == self.target:
+            raise ValueError("source and target must be different repository types")
+        return self
+
+
+class RepositoryMigrationProgress(BaseModel):
+    source: str
+    target: str
+    phase: Literal['copy', 'verify', 'completed'] = 'copy'
+    last_config_id: Optional[str] = Field(default=None, description="Last configuration copied, in config_id order")
+    copied: int = 0
+
+
+class RepositoryMigrationReport(BaseModel):
+    source: str
+    target: str
+    resumed_after: Optional[str] = Field(default=None, description="config_id the copy was resumed after, if it was resumed")
+    copied: int = Field(default=0, description="Configurations copied by the streaming pass, including previous runs")
+    updated: int = Field(default=0, description="Configurations copied again by verification because they changed or were missing")
+    deleted: int = Field(default=0, description="Configurations deleted from the target because they are no longer in the source")
+    rounds: int = Field(default=0, description="Verification passes run")
+    source_count: int = 0
+    target_count: int = 0
+    source_hash: Optional[str] = None
+    target_hash: Optional[str] = None
+    verified: bool = Field(default=False, description="Whether the last pass found both repositories identical while the source did not change")
+    duration_seconds: float = 0
@@ -9,6 +9,10 @@ class PluginManagerConfig(BaseModel):
     AllowedOrchestratorTypes: list[str] = ["kubernetes", "openstack"]
     PluginsDirectory: str = "plugins"
     ExcludeDirectories: list[str] = ["__pycache__", ".git"]
+    WatchPlugins: bool = False
+    PrewarmPlugins: bool = False
+    ManifestCacheFile: Optional[str] = None
+    WatchIntervalSeconds: float = 2.0
 
     @field_validator('AllowedOrchestratorTypes')
     def orchestrator_type_not_empty(cls, v):
@@ -22,6 +26,12 @@ class PluginManagerConfig(BaseModel):
         if not v.strip():
             raise ValueError("PluginsDirectory cannot be empty")
         return v 
+
+    @field_validator('WatchIntervalSeconds')
+    def watch_interval_must_be_positive(cls, v):
+        if v <= 0:
+            raise ValueError("WatchIntervalSeconds must be greater than 0")
+        return v
     
 
 class PluginDocumentation(BaseModel):
@@ -29,6 +39,26 @@ class PluginDocumentation(BaseModel):
     author: Optional[str]
     version: Optional[str]
 
+class PluginExecutionPolicy(BaseModel):
+    timeout_seconds: Optional[float] = Field(default=None, description="Maximum duration of one plugin execution. None disables the timeout")
+    max_concurrency: Optional[int] = Field(default=None, description="Maximum number of simultaneous executions of the plugin. None means unlimited")
+    result_ttl_seconds: float = Field(default=0, description="Seconds a result is reused for the same configuration. 0 disables result caching")
+    retries: int = Field(default=0, description="Additional attempts after a failed execution. Timeouts are not retried")
+    retry_backoff_seconds: float = Field(default=1, description="Delay before the first retry, doubled on each further retry")
+
+    @field_validator('timeout_seconds', 'max_concurrency')
+    def must_be_positive(cls, v):
+        if v is not None and v <= 0:
+            raise ValueError("value must be greater than 0")
+        return v
+
+    @field_validator('result_ttl_seconds', 'retries', 'retry_backoff_seconds')
+    def must_not_be_negative(cls, v):
+        if v < 0:
+            raise ValueError("value cannot be negative")
+        return v
+
+
 class PluginDefinition(BaseModel):
     name: str
     orchestrator_type: OrchestratorType
@@ -37,6 +67,7 @@ class PluginDefinition(BaseModel):
     dependencies: Optional[List[str]] = Field(default=None, description="The dependencies for the plugin")
     configuration: Optional[Dict[str, Any]] = Field(default_factory=dict, description="The configuration for the plugin")
     connection_schema: Optional[Dict[str, Any]] = Field(default=None, description="The connection schema for the plugin")        
+    execution: PluginExecutionPolicy = Field(default_factory=PluginExecutionPolicy, description="The execution policy enforced by the PluginManager")
 
     @field_validator('orchestrator_type')
     def orchestrator_type_must_not_be_empty(cls, v):
@@ -62,4 +93,30 @@ class PluginDefinition(BaseModel):
     
     
     def to_dict_with_connection_schema(self):
-        return self.model_dump(include={'connection_schema'})
\ No newline at end of file
+        return self.model_dump(include={'connection_schema'})
+
+
+class PluginReloadStatistics(BaseModel):
+    reloads: int = Field(default=0, description="Number of full or per-plugin reloads")
+    swaps: int = Field(default=0, description="Number of times the plugin registry was swapped")
+    last_reload_time_in_seconds: Optional[float] = None
+    total_reload_time_in_seconds: float = 0
+    last_reloaded_plugins: List[str] = Field(default_factory=list, description="Plugin folders reloaded last time")
+
+
+class PluginLoadDiagnostics(BaseModel):
+    plugin_folder: str
+    orchestrator_type: Optional[str] = None
+    config_sha256: Optional[str] = Field(default=None, description="SHA-256 of the plugin's config.yaml")
+    manifest_cache_hit: bool = Field(default=False, description="Whether the definition was read from the manifest cache")
+    yaml_parse_time_in_seconds: Optional[float] = Field(default=None, description="Time spent parsing config.yaml")
+    validation_time_in_seconds: Optional[float] = Field(default=None, description="Time spent validating the definition and compiling its connection schema")
+    import_time_in_seconds: Optional[float] = Field(default=None, description="Time spent importing the plugin module and its dependencies")
+    instantiation_time_in_seconds: Optional[float] = Field(default=None, description="Time spent creating the plugin instance")
+    loaded: bool = Field(default=False, description="Whether the plugin module has been imported")
+    error: Optional[str] = None
+
+
+class PluginDiagnosticsReport(BaseModel):
+    definitions_load_time_in_seconds: Optional[float] = None
+    plugins: List[PluginLoadDiagnostics] = Field(default_factory=list)
@@ -0,0 +1,154 @@
+# src/hw_agent/plugins/hpc/async_ssh.py
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+from hw_agent.plugins.hpc.facts_cache import STALENESS_PROBE_COMMAND, SSHFactsCache
+from hw_agent.plugins.hpc.slurm_inventory import SCONTROL_NODES_COMMAND, SlurmNodeInventory
+from hw_agent.utils.logger import get_logger
+
+logger = get_logger("AsyncSSHCollector")
+
+# A single event loop, shared by every caller, drives all the SSH sessions
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def run_coroutine(coroutine: Coroutine) -> Any:
+    """
+    Runs the coroutine on the shared SSH event loop and waits for its result. It can be called
+    from any thread, including threads that already run their own event loop.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="hpc-ssh-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coroutine, _loop).result()
+
+
+@dataclass(frozen=True)
+class SSHTarget:
+    host: str
+    user: str
+    password: str
+
+
+class AsyncSSHCollector:
+    """
+    Collects the HPC probe commands using asyncssh. Every host gets its own timeout and the
+    commands of a host run concurrently over a single connection. At most `max_concurrency`
+    sessions of the collector are open at once, across all its callers.
+
+    The 'lscpu' and 'hostnamectl' outputs are turned into facts by `parse_facts`, and are
+    reused from `facts_cache` when one is given and the host did not change.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 15,
+        host_timeout: float = 60,
+        max_concurrency: int = 100,
+        parse_facts: Optional[Callable[[Optional[str], Optional[str]], Dict[str, Any]]] = None,
+        facts_cache: Optional[SSHFactsCache] = None,
+    ):
+        self.connect_timeout = connect_timeout
+        self.host_timeout = host_timeout
+        self.max_concurrency = max_concurrency
+        self.parse_facts = parse_facts or (lambda lscpu, hostnamectl: {"lscpu": lscpu, "hostnamectl": hostnamectl})
+        self.facts_cache = facts_cache
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def collect(self, target: SSHTarget, live_inventory: bool = False) -> Dict[str, Any]:
+        """
+        Returns the facts of the target and, if requested, its Slurm inventory.
+        Values are None when they could not be retrieved.
+        """
+        try:
+            async with self._get_semaphore():
+                return await asyncio.wait_for(self._collect(target, live_inventory), timeout=self.host_timeout)
+        except Exception as e:
+            logger.error(f"SSH collection from {target.host} failed: {e!r}")
+            return {"facts": None, "clusters": None}
+
+    async def collect_many(self, targets: List[SSHTarget], live_inventory: bool = False) -> List[Dict[str, Any]]:
+        """
+        Collects from many hosts at once. Results are returned in the order of the targets.
+        """
+        return await asyncio.gather(*(self.collect(target, live_inventory) for target in targets))
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Bound to the loop it is used on; the shared SSH loop is only replaced once closed
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore, self._semaphore_loop = asyncio.Semaphore(self.max_concurrency), loop
+        return self._semaphore
+
+    async def _collect(self, target: SSHTarget, live_inventory: bool) -> Dict[str, Any]:
+        # Optional dependency, only needed when the asyncssh backend is selected
+        import asyncssh
+
+        async with asyncssh.connect(
+            target.host,
+            username=target.user,
+            password=target.password,
+            known_hosts=None,
+            connect_timeout=self.connect_timeout,
+        ) as connection:
+            logger.info(f"SSH connected to {target.host}.")
+            inventory = self._read_slurm_inventory(connection) if live_inventory else self._none()
+            facts, clusters = await asyncio.gather(self._retrieve_facts(connection, target.host), inventory)
+
+        return {"facts": facts, "clusters": clusters}
+
+    async def _retrieve_facts(self, connection, host: str) -> Dict[str, Any]:
+        if not self.facts_cache:
+            return await self._probe_facts(connection)
+
+        fingerprint = connection.get_server_host_key().get_fingerprint()
+        entry = self.facts_cache.get_entry(host, fingerprint)
+        if entry and not self.facts_cache.is_expired(entry):
+            logger.info(f"Using cached hardware facts of {host}.")
+            return entry["facts"]
+
+        marker = await self._run(connection, STALENESS_PROBE_COMMAND)
+        if self.facts_cache.is_unchanged(entry, marker):
+            logger.info(f"Hardware facts of {host} are unchanged; renewing cache entry.")
+            self.facts_cache.renew(host, fingerprint)
+            return entry["facts"]
+
+        facts = await self._probe_facts(connection)
+        self.facts_cache.store(host, fingerprint, facts, marker)
+        return facts
+
+    async def _probe_facts(self, connection) -> Dict[str, Any]:
+        lscpu_output, hostnamectl_output = await asyncio.gather(
+            self._run(connection, "lscpu"),
+            self._run(connection, "hostnamectl"),
+        )
+        return self.parse_facts(lscpu_output, hostnamectl_output)
+
+    async def _run(self, connection, command: str) -> Optional[str]:
+        """Returns the output of the command, or None if it failed or printed nothing."""
+        result = await connection.run(command, check=False)
+        if result.exit_status != 0 or not (result.stdout or "").strip():
+            logger.warning(f"'{command}' exited with status {result.exit_status} and {len(result.stdout or '')} bytes of output.")
+            return None
+        return result.stdout
+
+    async def _read_slurm_inventory(self, connection):
+        inventory = SlurmNodeInventory()
+        async with connection.create_process(SCONTROL_NODES_COMMAND) as process:
+            async for line in process.stdout:
+                inventory.add_line(line)
+            await process.wait()
+        if process.exit_status != 0:
+            logger.warning(f"'{SCONTROL_NODES_COMMAND}' failed; using static info.")
+            return None
+        return inventory.to_clusters_info()
+
+    async def _none(self):
+        return None
@@ -0,0 +1,88 @@
+# src/hw_agent/plugins/hpc/facts_cache.py
+
+import json
+import os
+import tempfile
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from hw_agent.utils.logger import get_logger
+
+# Changes on every reboot and on every kernel update; a single, tiny command
+STALENESS_PROBE_COMMAND = "cat /proc/sys/kernel/random/boot_id; uname -r"
+
+
+class SSHFactsCache:
+    """
+    TTL cache of the hardware facts collected over SSH, keyed by host and SSH host-key fingerprint.
+
+    Entries older than the TTL are not discarded right away: the caller compares the staleness
+    marker (the output of STALENESS_PROBE_COMMAND) and renews the entry if it did not change.
+    When a cache file is given, entries are persisted to it so they survive restarts.
+
+    Facts from a failed probe, None values, are not stored, and a missing marker never counts
+    as unchanged: the next collection probes the host again.
+    """
+
+    def __init__(self, ttl_seconds: float, cache_file: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.cache_file = os.path.abspath(cache_file) if cache_file else None
+        self.logger = get_logger(self.__class__.__name__)
+        self._lock = Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def get_entry(self, host: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(self._key(host, fingerprint))
+
+    def is_expired(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["stored_at"] >= self.ttl_seconds
+
+    def is_unchanged(self, entry: Optional[Dict[str, Any]], marker: Optional[str]) -> bool:
+        return bool(entry and marker) and entry["marker"] == marker
+
+    def store(self, host: str, fingerprint: str, facts: Dict[str, Any], marker: Optional[str]):
+        if not marker or any(value is None for value in facts.values()):
+            self.logger.warning(f"Not caching the hardware facts of {host}: a probe failed.")
+            return
+        with self._lock:
+            self._entries[self._key(host, fingerprint)] = {
+                "facts": facts,
+                "marker": marker,
+                "stored_at": time.time(),
+            }
+            self._save()
+
+    def renew(self, host: str, fingerprint: str):
+        with self._lock:
+            entry = self._entries.get(self._key(host, fingerprint))
+            if entry:
+                entry["stored_at"] = time.time()
+                self._save()
+
+    def _key(self, host: str, fingerprint: str) -> str:
+        return f"{host}|{fingerprint}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable SSH facts cache '{self.cache_file}': {e}")
+            return {}
+
+    def _save(self):
+        if not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            # Write to a temporary file first, a crash never leaves a truncated cache behind
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.cache_file))
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            self.logger.warning(f"Unable to persist SSH facts cache '{self.cache_file}': {e}")
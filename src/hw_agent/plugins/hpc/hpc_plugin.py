@@ -9,26 +9,35 @@ from hw_agent.core.base_plugin import BasePlugin
 from hw_agent.core.plugin_context import PluginContext
 from hw_agent.models.computational_models import ComputationalData
 from hw_agent.models.computational_asset import Description, ComputationalAsset, CPUProperties, MemoryProperties
+from hw_agent.plugins.hpc.async_ssh import AsyncSSHCollector, SSHTarget, run_coroutine
+from hw_agent.plugins.hpc.facts_cache import STALENESS_PROBE_COMMAND, SSHFactsCache
 from hw_agent.plugins.hpc.hpc_domain import ClustersInfo
-from typing import Any, Dict, List
+from hw_agent.plugins.hpc.slurm_inventory import SCONTROL_NODES_COMMAND, SlurmNodeInventory
+from typing import Any, Dict, List, Optional
 
 load_dotenv(os.path.join(os.path.dirname(__file__), '../../.env'))
 
 class HPCPlugin(BasePlugin):
     def __init__(self):
         super().__init__()
+        self._facts_cache: Optional[SSHFactsCache] = None
+        self._async_ssh_collector: Optional[AsyncSSHCollector] = None
 
     def fetch_computational_data(self, plugin_context: PluginContext) -> ComputationalData:
-        clusters_info = self._read_static_info()
-        self.logger.info(f"Retrieved hardware information from {len(clusters_info.clusters)} nodes.")
-        
         ssh_credentials = plugin_context.get_connection_info('ssh_credentials')
         login_node      = ssh_credentials.get('login_node')
         user            = ssh_credentials.get('user')
         private_key     = ssh_credentials.get('private_key')
         
-        ssh_data = self._retrieve_hpc_metadata_via_ssh(login_node, user, private_key)
+        if self._get_ssh_backend() == 'asyncssh':
+            ssh_data = self._retrieve_hpc_metadata_via_asyncssh(login_node, user, private_key)
+        else:
+            ssh_data = self._retrieve_hpc_metadata_via_ssh(login_node, user, private_key)
         # self.logger.debug(f"HPC metadata (CPU info snippet): {hpc_metadata.get('cpu_info', '')[:100]}")
+
+        # The live inventory is preferred, the static file is kept as a fallback
+        clusters_info = ssh_data.pop("clusters", None) or self._read_static_info()
+        self.logger.info(f"Retrieved hardware information from {len(clusters_info.clusters)} clusters.")
                 
         computational_info = {
             "clusters": clusters_info,
@@ -140,7 +149,8 @@ class HPCPlugin(BasePlugin):
         # ----- RETRIEVE DATA -----
         
         cpu_props = None
-        other_data = None
+        hostnamectl_props = None
+        clusters_info = None
         # ...
         
         try:
@@ -148,19 +158,18 @@ class HPCPlugin(BasePlugin):
                 hostname    = login_node,
                 username    = user,
                 password    = password,
-                timeout     = 15
+                timeout     = self.plugin_definition.get_config_value('ssh_connect_timeout', 15)
             )
             self.logger.info(f"SSH connected to {login_node}.")
 
-            # 1) cpu data:
-            _, stdout, stderr   = ssh_client.exec_command("lscpu")
-            lscpu_output        = stdout.read().decode("utf-8", errors="replace")
-            cpu_props = self._parse_ssh_cpu_properties(lscpu_output)
+            # 1) + 2) cpu and OS / kernel data, reused from the cache while the host is unchanged
+            facts = self._retrieve_ssh_facts(ssh_client, login_node)
+            cpu_props = facts["cpu_info"]
+            hostnamectl_props = facts["hostnamectl_info"]
 
-            # 2) OS / kernel data
-            _, stdout, stderr = ssh_client.exec_command("hostnamectl")
-            hostnamectl_output = stdout.read().decode("utf-8", errors="replace")
-            hostnamectl_props = self._parse_hostnamectl_properties(hostnamectl_output)
+            # 3) Live node inventory (streamed, the output can be large)
+            if self._use_live_inventory():
+                clusters_info = self._retrieve_slurm_inventory(ssh_client)
 
         except Exception as e:
             self.logger.error(f"SSH connection failed: {e}")
@@ -171,8 +180,116 @@ class HPCPlugin(BasePlugin):
         return {
             "cpu_info": cpu_props,
             "hostnamectl_info": hostnamectl_props,
+            "clusters": clusters_info,
         }
 
+    def _retrieve_ssh_facts(self, ssh_client: paramiko.SSHClient, login_node: str) -> dict:
+        facts_cache = self._get_facts_cache()
+        if not facts_cache:
+            return self._probe_ssh_facts(ssh_client)
+
+        fingerprint = ssh_client.get_transport().get_remote_server_key().fingerprint
+        entry = facts_cache.get_entry(login_node, fingerprint)
+        if entry and not facts_cache.is_expired(entry):
+            self.logger.info(f"Using cached hardware facts of {login_node}.")
+            return entry["facts"]
+
+        marker = self._exec_ssh_command(ssh_client, STALENESS_PROBE_COMMAND)
+        if facts_cache.is_unchanged(entry, marker):
+            self.logger.info(f"Hardware facts of {login_node} are unchanged; renewing cache entry.")
+            facts_cache.renew(login_node, fingerprint)
+            return entry["facts"]
+
+        facts = self._probe_ssh_facts(ssh_client)
+        facts_cache.store(login_node, fingerprint, facts, marker)
+        return facts
+
+    def _probe_ssh_facts(self, ssh_client: paramiko.SSHClient) -> dict:
+        lscpu_output = self._exec_ssh_command(ssh_client, "lscpu")
+        hostnamectl_output = self._exec_ssh_command(ssh_client, "hostnamectl")
+        return self._parse_probe_outputs(lscpu_output, hostnamectl_output)
+
+    def _exec_ssh_command(self, ssh_client: paramiko.SSHClient, command: str) -> Optional[str]:
+        """Returns the output of the command, or None if it failed or printed nothing."""
+        _, stdout, _ = ssh_client.exec_command(command)
+        output = stdout.read().decode("utf-8", errors="replace")
+        exit_status = stdout.channel.recv_exit_status()
+        if exit_status != 0 or not output.strip():
+            self.logger.warning(f"'{command}' exited with status {exit_status} and {len(output)} bytes of output.")
+            return None
+        return output
+
+    def _parse_probe_outputs(self, lscpu_output: Optional[str], hostnamectl_output: Optional[str]) -> dict:
+        return {
+            "cpu_info": self._parse_ssh_cpu_properties(lscpu_output) if lscpu_output is not None else None,
+            "hostnamectl_info": self._parse_hostnamectl_properties(hostnamectl_output) if hostnamectl_output is not None else None,
+        }
+
+    def _get_facts_cache(self) -> Optional[SSHFactsCache]:
+        """
+        Returns the cache of SSH-collected hardware facts, or None when it is disabled
+        (facts_cache_ttl_seconds set to 0).
+        """
+        ttl_seconds = self.plugin_definition.get_config_value('facts_cache_ttl_seconds', 0)
+        if ttl_seconds and self._facts_cache is None:
+            cache_file = self.plugin_definition.get_config_value('facts_cache_file')
+            self._facts_cache = SSHFactsCache(ttl_seconds, cache_file)
+        return self._facts_cache if ttl_seconds else None
+
+    def _retrieve_hpc_metadata_via_asyncssh(self, login_node, user, password_base64) -> dict:
+        """
+        Same as _retrieve_hpc_metadata_via_ssh, but the session runs on the shared asyncio
+        event loop instead of holding a thread for the whole connect-exec-read cycle.
+        """
+        if not (login_node and user and password_base64):
+            self.logger.warning("SSH environment variables incomplete; skipping SSH retrieval.")
+            return {"cpu_info": None, "parsed_cpu_properties": None}
+
+        target = SSHTarget(login_node, user, base64.b64decode(password_base64).decode("utf-8"))
+        outputs = run_coroutine(self._get_async_ssh_collector().collect(target, self._use_live_inventory()))
+        return self._parse_async_ssh_outputs(outputs)
+
+    def _parse_async_ssh_outputs(self, outputs: dict) -> dict:
+        facts = outputs.get("facts") or {"cpu_info": None, "hostnamectl_info": None}
+        return {**facts, "clusters": outputs.get("clusters")}
+
+    def _get_ssh_backend(self) -> str:
+        return self.plugin_definition.get_config_value('ssh_backend', 'paramiko')
+
+    def _get_async_ssh_collector(self) -> AsyncSSHCollector:
+        # One collector per plugin instance, so that ssh_max_concurrency bounds all the fetches
+        if self._async_ssh_collector is None:
+            self._async_ssh_collector = AsyncSSHCollector(
+                connect_timeout=self.plugin_definition.get_config_value('ssh_connect_timeout', 15),
+                # Without an explicit value a host may take the whole execution timeout of the plugin
+                host_timeout=self.plugin_definition.get_config_value('ssh_host_timeout', self.plugin_definition.execution.timeout_seconds),
+                max_concurrency=self.plugin_definition.get_config_value('ssh_max_concurrency', 100),
+                parse_facts=self._parse_probe_outputs,
+                facts_cache=self._get_facts_cache(),
+            )
+        return self._async_ssh_collector
+
+    def _use_live_inventory(self) -> bool:
+        return self.plugin_definition.get_config_value('inventory_source', 'static') == 'scontrol'
+
+    def _retrieve_slurm_inventory(self, ssh_client: paramiko.SSHClient) -> Optional[ClustersInfo]:
+        """
+        Reads the node inventory from 'scontrol show node --oneliner' line by line, so the
+        whole output is never held in memory. Returns None if Slurm is not available.
+        """
+        try:
+            _, stdout, _ = ssh_client.exec_command(SCONTROL_NODES_COMMAND)
+            inventory = SlurmNodeInventory().add_lines(stdout)
+            if stdout.channel.recv_exit_status() != 0:
+                self.logger.warning(f"'{SCONTROL_NODES_COMMAND}' failed; using static info.")
+                return None
+        except Exception as e:
+            self.logger.warning(f"Unable to retrieve Slurm inventory: {e}")
+            return None
+
+        self.logger.info(f"Retrieved Slurm inventory of {inventory.node_count} nodes.")
+        return inventory.to_clusters_info()
+
     def _parse_ssh_cpu_properties(self, lscpu_output: str) -> dict:
         """
         Helper to parse the lscpu output lines.
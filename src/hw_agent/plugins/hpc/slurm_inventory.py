@@ -0,0 +1,99 @@
+# src/hw_agent/plugins/hpc/slurm_inventory.py
+
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from hw_agent.plugins.hpc.hpc_domain import ClusterInfo, ClustersInfo
+
+# One line per node, so the output can be consumed while it is still being produced
+SCONTROL_NODES_COMMAND = "scontrol show node --oneliner"
+
+# Values such as 'OS=Linux 5.14.0 #1 SMP' contain spaces, but the fields we need never do
+_FIELD_PATTERN = re.compile(r"(?:^|\s)([A-Za-z_]+)=(\S*)")
+
+# Nodes declared in slurm.conf but not yet part of the cluster
+_IGNORED_STATES = ("FUTURE",)
+
+
+def parse_scontrol_node_line(line: Union[str, bytes]) -> Optional[Dict[str, str]]:
+    """
+    Parses a single line of `scontrol show node --oneliner` into a dictionary of fields.
+    Returns None for blank lines and lines not describing a node.
+    """
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="replace")
+    fields = dict(_FIELD_PATTERN.findall(line))
+    if "NodeName" not in fields:
+        return None
+    return fields
+
+
+class SlurmNodeInventory:
+    """
+    Incrementally aggregates Slurm nodes into per-partition shapes.
+
+    Only a counter per (partition, cores, memory) shape is kept, so memory usage depends on the
+    number of distinct node shapes and not on the number of nodes or the size of the output.
+    """
+
+    def __init__(self):
+        self._shapes: Dict[str, Counter] = defaultdict(Counter)
+        self.node_count = 0
+
+    def add_lines(self, lines: Iterable[Union[str, bytes]]) -> "SlurmNodeInventory":
+        for line in lines:
+            self.add_line(line)
+        return self
+
+    def add_line(self, line: Union[str, bytes]):
+        node = parse_scontrol_node_line(line)
+        if node:
+            self.add_node(node)
+
+    def add_node(self, node: Dict[str, str]):
+        if node.get("State", "").startswith(_IGNORED_STATES):
+            return
+
+        shape = self._node_shape(node)
+        if not shape:
+            return
+
+        partitions = [p for p in node.get("Partitions", "").split(",") if p and p != "(null)"]
+        for partition in partitions:
+            self._shapes[partition][shape] += 1
+        self.node_count += 1
+
+    def to_clusters_info(self) -> Optional[ClustersInfo]:
+        """
+        Builds a ClustersInfo with one cluster per partition. Partitions with nodes of different
+        shapes produce one cluster per shape, e.g. 'gpp (112c/256GB)'.
+        Returns None when no partitioned node was found.
+        """
+        clusters = set()
+        for partition, shapes in self._shapes.items():
+            for (cores, memory_gb), count in shapes.items():
+                name = partition if len(shapes) == 1 else f"{partition} ({cores}c/{memory_gb}GB)"
+                clusters.add(
+                    ClusterInfo(
+                        name=name,
+                        node_count=count,
+                        cores_per_node=cores,
+                        memory_per_node=memory_gb,
+                    )
+                )
+        if not clusters:
+            return None
+        return ClustersInfo(clusters=clusters)
+
+    def _node_shape(self, node: Dict[str, str]) -> Optional[Tuple[int, int]]:
+        try:
+            cores = int(node.get("CPUTot", 0))
+            memory_mb = int(node.get("RealMemory", 0))
+        except ValueError:
+            return None
+        # RealMemory is reported in MiB
+        memory_gb = round(memory_mb / 1024)
+        if cores <= 0 or memory_gb <= 0:
+            return None
+        return cores, memory_gb
@@ -33,7 +33,9 @@ class OpenStackPlugin(BasePlugin):
 
         # Establish connection to OpenStack
         try:
-            socket_timeout = self.plugin_definition.get_config_value('client_socket_timeout', 20)
+            socket_timeout = self.plugin_definition.get_config_value(
+                'client_socket_timeout', self.plugin_definition.execution.timeout_seconds
+            )
             conn = connection.Connection(
                 auth_url=auth_url,
                 username=username,
@@ -1,3 +1,5 @@
 # Import repository modules to ensure they are registered
 from .yaml_repository import YAMLRepository
 from .sqlite_repository import SQLiteRepository
+from .journal_repository import JournalRepository
+from .async_sqlite_repository import AsyncSQLiteRepository
@@ -0,0 +1,101 @@
+# src/hw_agent/repositories/async_base_repository.py
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigRead
+from hw_agent.repositories.base_repository import BaseRepository
+
+
+class AsyncBaseRepository(ABC):
+    """
+    Awaitable counterpart of BaseRepository, for the async routers. Implementations share the
+    storage of the synchronous repository they are created from.
+    """
+
+    @abstractmethod
+    async def save_configuration(self, config_id: str, connection_config: ConnectionConfigCreate) -> None:
+        """
+        Stores the configuration under config_id.
+        """
+        pass
+
+    @abstractmethod
+    async def save_configurations(self, connection_configs: Dict[str, ConnectionConfigCreate]) -> None:
+        """
+        Stores many configurations, keyed by config_id, at once: either all of them are
+        stored or none.
+        """
+        pass
+
+    @abstractmethod
+    async def get_configuration(self, config_id: str) -> Optional[ConnectionConfigRead]:
+        """
+        Retrieves the configuration based on config_id.
+        """
+        pass
+
+    @abstractmethod
+    async def list_configurations(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        """
+        Returns one page of configurations, as BaseRepository.list_configurations.
+        """
+        pass
+
+    @abstractmethod
+    async def get_generation(self) -> int:
+        """
+        Returns the same generation as the synchronous repository.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_configuration(self, config_id: str) -> bool:
+        """
+        Deletes a configuration based on config_id.
+        """
+        pass
+
+    @abstractmethod
+    async def clear_all_configurations(self) -> bool:
+        """
+        Clears all configurations.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Releases connections or threads held by the repository.
+        """
+        pass
+
+
+class ThreadedAsyncRepository(AsyncBaseRepository):
+    """
+    Runs the calls of a synchronous repository in worker threads. Used for the repository
+    types without a native async implementation.
+    """
+
+    def __init__(self, repository: BaseRepository):
+        self.repository = repository
+
+    async def save_configuration(self, config_id: str, connection_config: ConnectionConfigCreate) -> None:
+        await asyncio.to_thread(self.repository.save_configuration, config_id, connection_config)
+
+    async def save_configurations(self, connection_configs: Dict[str, ConnectionConfigCreate]) -> None:
+        await asyncio.to_thread(self.repository.save_configurations, connection_configs)
+
+    async def get_configuration(self, config_id: str) -> Optional[ConnectionConfigRead]:
+        return await asyncio.to_thread(self.repository.get_configuration, config_id)
+
+    async def list_configurations(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        return await asyncio.to_thread(self.repository.list_configurations, query)
+
+    async def get_generation(self) -> int:
+        return await asyncio.to_thread(self.repository.get_generation)
+
+    async def delete_configuration(self, config_id: str) -> bool:
+        return await asyncio.to_thread(self.repository.delete_configuration, config_id)
+
+    async def clear_all_configurations(self) -> bool:
+        return await asyncio.to_thread(self.repository.clear_all_configurations)
@@ -0,0 +1,82 @@
+# src/hw_agent/repositories/async_sqlite_repository.py
+
+import asyncio
+from typing import List, Optional
+import aiosqlite
+from hw_agent.models.connection_config_models import ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigRead
+from hw_agent.repositories.async_base_repository import ThreadedAsyncRepository
+from hw_agent.repositories.repository_factory import RepositoryFactory
+from hw_agent.repositories.sqlite_repository import (
+    GENERATION_SQL, GET_CONFIGURATION_SQL, SQLiteRepository, build_list_query, row_to_dict, rows_to_page,
+)
+from hw_agent.services.settings_service import SettingsService
+
+
+@RepositoryFactory.register_async('sqlite')
+class AsyncSQLiteRepository(ThreadedAsyncRepository):
+    """
+    aiosqlite repository on the database of a SQLiteRepository, which creates and migrates the
+    schema. Reads are spread round-robin over a few read-only aiosqlite connections, each
+    running its queries in its own thread, so they run in parallel.
+
+    Writes run in a worker thread through the single writer connection of the SQLiteRepository,
+    so the process never has two writers competing for the database lock.
+
+    Connections are opened on first use and must be closed with close().
+    """
+
+    def __init__(self, repository: SQLiteRepository):
+        super().__init__(repository)
+        settings = SettingsService()
+        self.reader_count = max(1, int(settings.get('sqlite_async_readers', 4)))
+        self._readers: List[aiosqlite.Connection] = []
+        self._next_reader = 0
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._connect_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_connect_lock(self) -> asyncio.Lock:
+        """Lock of the running loop: the repository outlives the loop it was created on."""
+        loop = asyncio.get_running_loop()
+        if self._connect_lock_loop is not loop:
+            self._connect_lock, self._connect_lock_loop = asyncio.Lock(), loop
+        return self._connect_lock
+
+    async def _open(self) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(self.repository.db_file, timeout=self.repository.busy_timeout_ms / 1000)
+        for pragma in self.repository.connection_pragmas(read_only=True):
+            await connection.execute(pragma)
+        return connection
+
+    async def _get_reader(self) -> aiosqlite.Connection:
+        if not self._readers:
+            async with self._get_connect_lock():
+                if not self._readers:
+                    self._readers = [await self._open() for _ in range(self.reader_count)]
+        reader = self._readers[self._next_reader % len(self._readers)]
+        self._next_reader += 1
+        return reader
+
+    async def get_configuration(self, config_id: str) -> Optional[ConnectionConfigRead]:
+        reader = await self._get_reader()
+        rows = await reader.execute_fetchall(GET_CONFIGURATION_SQL, (config_id,))
+        if rows:
+            return ConnectionConfigRead(**row_to_dict(rows[0], include_connection_info=True, codec=self.repository.codec))
+        else:
+            return None
+
+    async def list_configurations(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        sql, parameters = build_list_query(query)
+        reader = await self._get_reader()
+        rows = await reader.execute_fetchall(sql, parameters)
+        return rows_to_page(list(rows), query, self.repository.codec)
+
+    async def get_generation(self) -> int:
+        reader = await self._get_reader()
+        rows = await reader.execute_fetchall(GENERATION_SQL)
+        return rows[0][0]
+
+    async def close(self) -> None:
+        async with self._get_connect_lock():
+            for connection in self._readers:
+                await connection.close()
+            self._readers = []
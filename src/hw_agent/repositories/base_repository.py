@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
-from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigRead
+from typing import Dict, Iterator, List, Optional, Set
+from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigRead, DuplicateTargetGroup
 
 class BaseRepository(ABC):
     @abstractmethod
@@ -10,6 +10,14 @@ class BaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_configurations(self, connection_configs: Dict[str, ConnectionConfigCreate]) -> None:
+        """
+        Stores many configurations, keyed by config_id, at once: either all of them are
+        stored or none.
+        """
+        pass
+
     @abstractmethod
     def get_configuration(self, config_id: str) -> Optional[ConnectionConfigRead]:
         """
@@ -21,6 +29,53 @@ class BaseRepository(ABC):
     def get_configurations(self) -> Optional[list[ConnectionConfigRead]] :
         pass
 
+    @abstractmethod
+    def iter_configurations(self, after_config_id: Optional[str] = None) -> Iterator[ConnectionConfigRead]:
+        """
+        Yields every configuration in config_id order, starting after `after_config_id` if given,
+        without loading all of them in memory at once when the storage allows it.
+        """
+        pass
+
+    @abstractmethod
+    def restore_configurations(self, configurations: List[ConnectionConfigRead]) -> None:
+        """
+        Stores configurations exactly as given, config_id, created_at and updated_at included,
+        replacing existing ones: either all of them are stored or none. Used to copy
+        configurations between repositories.
+        """
+        pass
+
+    @abstractmethod
+    def list_configurations(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        """
+        Returns one page of configurations matching the filters of the query, in the requested
+        order. The connection info is only included if the query asks for it.
+        """
+        pass
+
+    @abstractmethod
+    def list_duplicate_targets(self) -> List[DuplicateTargetGroup]:
+        """
+        Returns the groups of configurations sharing a target fingerprint, i.e. registered more
+        than once for the same infrastructure and identity.
+        """
+        pass
+
+    @abstractmethod
+    def get_generation(self) -> int:
+        """
+        Returns a number that changes whenever the stored configurations change, also when
+        they are changed by another worker, so that caches can detect stale entries.
+        """
+        pass
+
+    def get_changes_since(self, generation: int) -> Optional[Set[str]]:
+        """
+        Returns the config_ids changed after `generation`, or None if the repository cannot
+        tell; caches then drop every entry.
+        """
+        return None
 
     @abstractmethod
     def delete_configuration(self, config_id: str) -> None:
@@ -29,9 +84,22 @@ class BaseRepository(ABC):
         """
         pass
 
+    def delete_configurations(self, config_ids: List[str]) -> int:
+        """
+        Deletes many configurations and returns how many existed. Repositories that rewrite
+        their whole store on every write override it to do it once.
+        """
+        return sum(bool(self.delete_configuration(config_id)) for config_id in config_ids)
+
     @abstractmethod
     def clear_all_configurations(self) -> None:
         """
         Clears all configurations.
         """
         pass
+
+    def close(self) -> None:
+        """
+        Releases connections held by the repository.
+        """
+        pass
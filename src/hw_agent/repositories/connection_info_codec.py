@@ -0,0 +1,135 @@
+# src/hw_agent/repositories/connection_info_codec.py
+
+import base64
+import json
+import zlib
+from typing import Optional, Union
+
+from hw_agent.core.target_fingerprint import compute_target_fingerprint
+from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigRead
+from hw_agent.services.settings_service import SettingsService
+
+try:
+    import zstandard
+except ImportError:
+    # Optional: zlib is used when it is not installed
+    zstandard = None
+
+_ZLIB = 'zlib'
+_ZSTD = 'zstd'
+_NONE = 'none'
+
+
+def _zstd_required():
+    if zstandard is None:
+        raise RuntimeError("Connection info compressed with zstd cannot be read: the zstandard package is not installed.")
+
+
+def _compress(algorithm: str, data: bytes, level: Optional[int]) -> bytes:
+    if algorithm == _ZSTD:
+        _zstd_required()
+        return zstandard.ZstdCompressor(level=level if level is not None else 3).compress(data)
+    return zlib.compress(data, level if level is not None else 6)
+
+
+def _decompress(algorithm: str, data: bytes) -> bytes:
+    if algorithm == _ZSTD:
+        _zstd_required()
+        return zstandard.ZstdDecompressor().decompress(data)
+    if algorithm == _ZLIB:
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown connection info compression tag: {algorithm!r}")
+
+
+class ConnectionInfoCodec:
+    """
+    Compresses the connection info of a configuration at rest.
+
+    Connection info smaller than `min_size` bytes of JSON, or that does not get smaller, is
+    stored as before. Otherwise it is compressed and tagged with its algorithm:
+
+    - binary stores (SQLite) get b'zstd:' or b'zlib:' followed by the compressed JSON
+    - text stores (YAML, journal) get the string 'zstd:' or 'zlib:' followed by its base64
+
+    Decoding reads every tag, whatever the configured algorithm, so changing the setting never
+    makes stored configurations unreadable. Repositories only decode when the connection info
+    itself is returned; metadata listings never touch it.
+    """
+
+    def __init__(self, algorithm: str = 'auto', min_size: int = 512, level: Optional[int] = None):
+        if algorithm == 'auto':
+            algorithm = _ZSTD if zstandard is not None else _ZLIB
+        if algorithm not in (_ZLIB, _ZSTD, _NONE):
+            raise ValueError(f"Unsupported connection info compression: {algorithm}. Use 'auto', 'zstd', 'zlib' or 'none'.")
+        if algorithm == _ZSTD:
+            _zstd_required()
+        self.algorithm = algorithm
+        self.min_size = min_size
+        self.level = level
+
+    @classmethod
+    def from_settings(cls) -> "ConnectionInfoCodec":
+        settings = SettingsService()
+        level = settings.get('connection_info_compression_level')
+        return cls(
+            algorithm=str(settings.get('connection_info_compression', 'auto')).lower(),
+            min_size=int(settings.get('connection_info_compression_min_bytes', 512)),
+            level=int(level) if level not in (None, '') else None,
+        )
+
+    def _compressed(self, data: bytes) -> Optional[bytes]:
+        if self.algorithm == _NONE or len(data) < self.min_size:
+            return None
+        return _compress(self.algorithm, data, self.level)
+
+    def encode(self, connection_info: Optional[dict]) -> Union[str, bytes]:
+        """Encodes for a binary column: JSON text, or tagged compressed bytes when they are smaller."""
+        text = json.dumps(connection_info)
+        compressed = self._compressed(text.encode())
+        if compressed is None or len(compressed) >= len(text):
+            return text
+        return self.algorithm.encode() + b':' + compressed
+
+    def decode(self, value: Union[str, bytes]) -> Optional[dict]:
+        if isinstance(value, str):
+            return json.loads(value)
+        algorithm, _, compressed = bytes(value).partition(b':')
+        return json.loads(_decompress(algorithm.decode(), compressed))
+
+    def encode_text(self, connection_info: Optional[dict]) -> Union[dict, str, None]:
+        """Encodes for a text store: the mapping itself, or a tagged base64 string when it is smaller."""
+        text = json.dumps(connection_info)
+        compressed = self._compressed(text.encode())
+        # base64 takes a third more: data that barely compresses, e.g. certificates, stays as is
+        if compressed is None or len(compressed) * 4 / 3 >= len(text):
+            return connection_info
+        return f'{self.algorithm}:{base64.b64encode(compressed).decode()}'
+
+    def decode_text(self, value: Union[dict, str, None]) -> Optional[dict]:
+        # Only compressed connection info is stored as a string, the plugins' schemas are objects
+        if not isinstance(value, str):
+            return value
+        algorithm, _, encoded = value.partition(':')
+        return json.loads(_decompress(algorithm, base64.b64decode(encoded)))
+
+    def encode_record(self, connection_config: ConnectionConfigCreate, created_at: str, updated_at: Optional[str] = None) -> dict:
+        """Builds the record a text store (YAML, journal) keeps for a configuration."""
+        record = connection_config.model_dump(mode="json", include={'metadata', 'orchestrator_type', 'connection_info'})
+        record['target_fingerprint'] = compute_target_fingerprint(connection_config.orchestrator_type, connection_config.connection_info)
+        record['connection_info'] = self.encode_text(record.get('connection_info'))
+        return {**record, 'created_at': created_at, 'updated_at': updated_at or created_at}
+
+    def record_fingerprint(self, record: dict) -> str:
+        # Configurations stored before fingerprints existed get theirs computed on read
+        return record.get('target_fingerprint') or compute_target_fingerprint(
+            record.get('orchestrator_type'), self.decode_text(record.get('connection_info'))
+        )
+
+    def decode_record(self, config_id: str, record: dict) -> ConnectionConfigRead:
+        """Reads back a record built by `encode_record`, with its connection info decompressed."""
+        return ConnectionConfigRead(**{
+            **record,
+            'config_id': config_id,
+            'connection_info': self.decode_text(record.get('connection_info')),
+            'target_fingerprint': self.record_fingerprint(record),
+        })
@@ -0,0 +1,488 @@
+# src/hw_agent/repositories/journal_repository.py
+
+import json
+import os
+import tempfile
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock, RLock, Thread
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from hw_agent.core.target_fingerprint import group_duplicate_targets
+from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigRead, ConnectionConfigSummary, DuplicateTargetGroup
+from hw_agent.repositories.base_repository import BaseRepository
+from hw_agent.repositories.connection_info_codec import ConnectionInfoCodec
+from hw_agent.repositories.pagination import format_timestamp, paginate, utc_now
+from hw_agent.repositories.repository_factory import RepositoryFactory
+from hw_agent.services.settings_service import SettingsService
+from hw_agent.utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows: there, a journal file must not be shared between processes
+    fcntl = None
+
+# Journals shared by every repository instance of the same file
+_journals: Dict[str, "ConfigurationJournal"] = {}
+_journals_lock = Lock()
+
+# Generations for which the changed config_ids are known, see changes_since
+_HISTORY_SIZE = 1024
+
+
+class ConfigurationJournal:
+    """
+    Append-only JSON Lines log of configuration changes, with the latest state in memory.
+
+    Every change is one record: {"op": "put", "config_id", "data"}, {"op": "delete", "config_id"}
+    or {"op": "clear"}; puts or deletes stored together share one {"op": "batch", "records"} record. A write is one append (plus fsync); a read is a dict lookup. Startup
+    replays the log once, line by line; a torn last line left by a crash is cut off.
+
+    Records that no longer describe the current state are garbage. Once their share of the log
+    passes `garbage_ratio`, a background thread rewrites the log with one record per live
+    configuration. Writes continue meanwhile and are carried over to the new log.
+
+    Several processes may share the file. Writes and compactions hold an exclusive lock on a
+    `.lock` file next to it, and first replay the records other processes appended since.
+    The generation is derived from the file (inode and length), so that `generation` notices
+    the writes of other processes and catches up with them.
+    """
+
+    def __init__(self, journal_file: str, garbage_ratio: float = 0.5, min_compaction_records: int = 1000, fsync: bool = True):
+        self.journal_file = journal_file
+        self.garbage_ratio = garbage_ratio
+        self.min_compaction_records = min_compaction_records
+        self.fsync = fsync
+        self.logger = get_logger(self.__class__.__name__)
+        self.compactions = 0
+        self._lock = RLock()
+        self._configurations: Dict[str, dict] = {}
+        self._summaries: Optional[Dict[str, ConnectionConfigSummary]] = None
+        self._record_count = 0
+        # Position in the file up to which the records were applied, and inode of the file
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._history: "deque[Tuple[int, Optional[FrozenSet[str]]]]" = deque(maxlen=_HISTORY_SIZE)
+        self._file_lock_depth = 0
+        self._compaction_thread: Optional[Thread] = None
+
+        os.makedirs(os.path.dirname(self.journal_file), exist_ok=True)
+        self._lock_file = open(self.journal_file + '.lock', 'ab')
+        with self._exclusive():
+            self._file = open(self.journal_file, 'ab')
+            self._replay()
+            self._history.append((self._generation, frozenset()))
+
+    @property
+    def record_count(self) -> int:
+        return self._record_count
+
+    @property
+    def generation(self) -> int:
+        """Changes with every record appended to the file and with every compaction, whichever process made them."""
+        with self._lock:
+            if self._file_signature() != (self._inode, self._offset):
+                with self._exclusive():
+                    self._catch_up()
+            return self._generation
+
+    @property
+    def _generation(self) -> int:
+        return hash((self._inode, self._offset))
+
+    def changes_since(self, generation: int) -> Optional[Set[str]]:
+        """
+        Returns the config_ids changed after `generation`, or None if they are not known: the
+        generation is too old, or the configurations were cleared since.
+        """
+        with self._lock:
+            changed: Set[str] = set()
+            for history_generation, config_ids in reversed(self._history):
+                if history_generation == generation:
+                    return changed
+                if config_ids is None:
+                    return None
+                changed.update(config_ids)
+            return None
+
+    def get(self, config_id: str) -> Optional[dict]:
+        return self._configurations.get(config_id)
+
+    def items(self):
+        return list(self._configurations.items())
+
+    def summaries(self) -> Dict[str, ConnectionConfigSummary]:
+        with self._lock:
+            if self._summaries is None:
+                self._summaries = {
+                    config_id: self._summary(config_id, data) for config_id, data in self._configurations.items()
+                }
+            return dict(self._summaries)
+
+    def put(self, config_id: str, data: dict):
+        """Stores the configuration; the created_at of a configuration it replaces is kept."""
+        self.put_many({config_id: data})
+
+    def put_many(self, configurations: Dict[str, dict], keep_created_at: bool = True):
+        """Stores many configurations with a single append and fsync."""
+        if not configurations:
+            return
+        with self._exclusive():
+            self._catch_up()
+            records = {}
+            for config_id, data in configurations.items():
+                previous = self._configurations.get(config_id)
+                if keep_created_at and previous and 'created_at' in previous:
+                    data = {**data, 'created_at': previous['created_at']}
+                records[config_id] = data
+            puts = [{"op": "put", "config_id": config_id, "data": data} for config_id, data in records.items()]
+            # Several puts share one line, so a crash keeps all of them or none
+            self._append(puts[0] if len(puts) == 1 else {"op": "batch", "records": puts}, len(puts))
+            self._configurations.update(records)
+            if self._summaries is not None:
+                for config_id, data in records.items():
+                    self._summaries[config_id] = self._summary(config_id, data)
+            # Recorded once the new state is visible, never before
+            self._history.append((self._generation, frozenset(records)))
+        self._maybe_compact()
+
+    def delete(self, config_id: str) -> bool:
+        return self.delete_many([config_id]) == 1
+
+    def delete_many(self, config_ids: List[str]) -> int:
+        """Deletes the configurations that exist with a single append, and returns how many."""
+        with self._exclusive():
+            self._catch_up()
+            deleted = [config_id for config_id in dict.fromkeys(config_ids) if config_id in self._configurations]
+            if not deleted:
+                return 0
+            records = [{"op": "delete", "config_id": config_id} for config_id in deleted]
+            self._append(records[0] if len(records) == 1 else {"op": "batch", "records": records}, len(records))
+            for config_id in deleted:
+                del self._configurations[config_id]
+                if self._summaries is not None:
+                    self._summaries.pop(config_id, None)
+            self._history.append((self._generation, frozenset(deleted)))
+        self._maybe_compact()
+        return len(deleted)
+
+    def clear(self):
+        with self._exclusive():
+            self._catch_up()
+            self._append({"op": "clear"})
+            self._configurations = {}
+            self._summaries = None
+            self._history.append((self._generation, None))
+        self._maybe_compact()
+
+    def compact(self):
+        """
+        Rewrites the log with the live configurations only. The snapshot is written without
+        the lock; the records appended meanwhile are copied over before the new log replaces
+        the old one.
+        """
+        with self._exclusive():
+            self._catch_up()
+            snapshot = dict(self._configurations)
+            inode, offset = self._inode, self._offset
+            operations_at_offset = self._record_count
+
+        directory = os.path.dirname(self.journal_file)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.journal-', suffix='.jsonl')
+        try:
+            with os.fdopen(fd, 'wb') as compacted:
+                for config_id, data in snapshot.items():
+                    compacted.write(self._encode({"op": "put", "config_id": config_id, "data": data}))
+
+                with self._exclusive():
+                    self._catch_up()
+                    if self._inode != inode:
+                        # Another process compacted the file meanwhile
+                        raise _CompactionSuperseded()
+                    with open(self.journal_file, 'rb') as journal:
+                        journal.seek(offset)
+                        self._copy(journal, compacted, self._offset - offset)
+                    compacted.flush()
+                    os.fsync(compacted.fileno())
+                    os.replace(tmp_path, self.journal_file)
+                    self._fsync_directory()
+                    self._file.close()
+                    self._file = open(self.journal_file, 'ab')
+                    self._inode, self._offset = self._file_signature()
+                    self._record_count = len(snapshot) + self._record_count - operations_at_offset
+                    # Same configurations, in a new file
+                    self._history.append((self._generation, frozenset()))
+                    self.compactions += 1
+        except _CompactionSuperseded:
+            os.unlink(tmp_path)
+            return
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.logger.info(f"Compacted journal '{self.journal_file}' to {self._record_count} records.")
+
+    def close(self):
+        # The compaction needs the lock to finish
+        compaction_thread = self._compaction_thread
+        if compaction_thread:
+            compaction_thread.join()
+        with self._lock:
+            self._file.close()
+            self._lock_file.close()
+        # The next repository of this file opens it again
+        with _journals_lock:
+            if _journals.get(self.journal_file) is self:
+                del _journals[self.journal_file]
+
+    def _maybe_compact(self):
+        with self._lock:
+            if self._record_count < self.min_compaction_records:
+                return
+            garbage = 1 - len(self._configurations) / self._record_count
+            if garbage < self.garbage_ratio:
+                return
+            if self._compaction_thread and self._compaction_thread.is_alive():
+                return
+            self._compaction_thread = Thread(target=self._run_compaction, name="journal-compaction", daemon=True)
+            self._compaction_thread.start()
+
+    def _run_compaction(self):
+        try:
+            self.compact()
+        except Exception as e:
+            self.logger.error(f"Compaction of journal '{self.journal_file}' failed: {e}")
+
+    @contextmanager
+    def _exclusive(self):
+        """Holds the lock of this process and the file lock shared with the other processes."""
+        with self._lock:
+            if self._file_lock_depth == 0 and fcntl:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._file_lock_depth += 1
+            try:
+                yield
+            finally:
+                self._file_lock_depth -= 1
+                if self._file_lock_depth == 0 and fcntl:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _append(self, record: dict, operations: int = 1):
+        encoded = self._encode(record)
+        self._file.write(encoded)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._offset += len(encoded)
+        self._record_count += operations
+
+    def _file_signature(self) -> Tuple[Optional[int], int]:
+        try:
+            stat = os.stat(self.journal_file)
+        except FileNotFoundError:
+            return None, 0
+        return stat.st_ino, stat.st_size
+
+    def _replay(self):
+        self._inode, size = self._file_signature()
+        self._offset, self._record_count = self._replay_from(0, self._configurations)
+        if self._offset != size:
+            os.truncate(self.journal_file, self._offset)
+        self.logger.info(
+            f"Replayed {self._record_count} records of journal '{self.journal_file}', "
+            f"{len(self._configurations)} configurations."
+        )
+
+    def _replay_from(self, offset: int, configurations: Dict[str, dict], changed: Optional[Set[str]] = None) -> Tuple[int, int]:
+        """
+        Applies the records from `offset` on to `configurations`, and returns the offset after
+        the last complete one and the number of operations applied. The config_ids they change
+        are added to `changed`; a clear adds None.
+        """
+        record_count = 0
+        valid_length = offset
+        with open(self.journal_file, 'rb') as journal:
+            journal.seek(offset)
+            for line in journal:
+                try:
+                    # A record without its newline was not completely written
+                    if not line.endswith(b'\n'):
+                        raise ValueError("incomplete record")
+                    record = json.loads(line)
+                except ValueError:
+                    # Only the last record can be torn; anything after it is not trusted
+                    self.logger.warning(f"Discarding unreadable record at byte {valid_length} of journal '{self.journal_file}'.")
+                    break
+                record_count += self._apply(record, configurations, changed)
+                valid_length += len(line)
+        return valid_length, record_count
+
+    def _catch_up(self):
+        """Applies the records other processes wrote since the last write or catch-up. Needs `_exclusive`."""
+        inode, size = self._file_signature()
+        if (inode, size) == (self._inode, self._offset):
+            return
+        if inode == self._inode and size > self._offset:
+            changed: Set[str] = set()
+            self._offset, record_count = self._replay_from(self._offset, self._configurations, changed)
+            self._record_count += record_count
+            changed_ids = None if None in changed else frozenset(changed)
+        else:
+            # Compacted, or removed, by another process: the state is read again from scratch,
+            # aside, since get() and items() keep reading the current one meanwhile
+            previous = self._configurations
+            configurations: Dict[str, dict] = {}
+            offset, record_count = self._replay_from(0, configurations) if inode is not None else (0, 0)
+            self._configurations, self._record_count = configurations, record_count
+            self._inode, self._offset = inode, offset
+            changed_ids = frozenset(
+                config_id for config_id in previous.keys() | self._configurations.keys()
+                if previous.get(config_id) != self._configurations.get(config_id)
+            )
+            self._file.close()
+            self._file = open(self.journal_file, 'ab')
+            self._inode = self._file_signature()[0]
+        self._summaries = None
+        self._history.append((self._generation, changed_ids))
+
+    def _apply(self, record: dict, configurations: Dict[str, dict], changed: Optional[Set[str]] = None) -> int:
+        """Applies a record to `configurations` and returns its number of operations."""
+        operation = record["op"]
+        if operation == "batch":
+            return sum(self._apply(batched, configurations, changed) for batched in record["records"])
+        if operation == "put":
+            configurations[record["config_id"]] = record["data"]
+        elif operation == "delete":
+            configurations.pop(record["config_id"], None)
+        elif operation == "clear":
+            configurations.clear()
+        if changed is not None:
+            changed.add(record.get("config_id"))
+        return 1
+
+    def _copy(self, source, target, length: int):
+        while length > 0:
+            chunk = source.read(min(length, 1024 * 1024))
+            if not chunk:
+                break
+            target.write(chunk)
+            length -= len(chunk)
+
+    def _encode(self, record: dict) -> bytes:
+        return (json.dumps(record, separators=(',', ':')) + '\n').encode()
+
+    def _fsync_directory(self):
+        directory_fd = os.open(os.path.dirname(self.journal_file), os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+    def _summary(self, config_id: str, data: dict) -> ConnectionConfigSummary:
+        return ConnectionConfigSummary(
+            config_id=config_id,
+            **{key: value for key, value in data.items() if key != 'connection_info'}
+        )
+
+
+class _CompactionSuperseded(Exception):
+    pass
+
+
+def _get_journal(journal_file: str, **options) -> ConfigurationJournal:
+    with _journals_lock:
+        journal = _journals.get(journal_file)
+        if journal is None:
+            journal = ConfigurationJournal(journal_file, **options)
+            _journals[journal_file] = journal
+        return journal
+
+
+@RepositoryFactory.register('journal')
+class JournalRepository(BaseRepository):
+    """
+    Repository on top of an append-only journal, for cheap durable writes under high churn.
+    Repository instances of the same file share one journal; other processes may write the
+    file too, their changes are picked up when the generation is read.
+    """
+
+    def __init__(self):
+        settings = SettingsService()
+        journal_file = os.path.abspath(settings.get('journal_file', 'data/configurations.jsonl'))
+        self.journal = _get_journal(
+            journal_file,
+            garbage_ratio=float(settings.get('journal_compaction_garbage_ratio', 0.5)),
+            min_compaction_records=int(settings.get('journal_compaction_min_records', 1000)),
+            fsync=str(settings.get('journal_fsync', 'true')).lower() == 'true',
+        )
+        self.codec = ConnectionInfoCodec.from_settings()
+
+    def save_configuration(self, config_id, connection_info: ConnectionConfigCreate) -> None:
+        self.journal.put(config_id, self.codec.encode_record(connection_info, utc_now()))
+
+    def save_configurations(self, connection_configs: Dict[str, ConnectionConfigCreate]) -> None:
+        now = utc_now()
+        self.journal.put_many({
+            config_id: self.codec.encode_record(connection_config, now)
+            for config_id, connection_config in connection_configs.items()
+        })
+
+    def get_configuration(self, config_id) -> Optional[ConnectionConfigRead]:
+        config_data = self.journal.get(config_id)
+        if config_data:
+            return self.codec.decode_record(config_id, config_data)
+        else:
+            return None
+
+    def get_configurations(self):
+        return {
+            config_id: {**config_data, 'connection_info': self.codec.decode_text(config_data.get('connection_info'))}
+            for config_id, config_data in self.journal.items()
+        }
+
+    def iter_configurations(self, after_config_id: Optional[str] = None) -> Iterator[ConnectionConfigRead]:
+        for config_id, config_data in sorted(self.journal.items()):
+            if after_config_id is None or config_id > after_config_id:
+                yield self.codec.decode_record(config_id, config_data)
+
+    def restore_configurations(self, configurations: List[ConnectionConfigRead]) -> None:
+        if not configurations:
+            return
+        self.journal.put_many({
+            configuration.config_id: self.codec.encode_record(
+                configuration, format_timestamp(configuration.created_at), format_timestamp(configuration.updated_at)
+            )
+            for configuration in configurations
+        }, keep_created_at=False)
+
+    def list_configurations(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        page = paginate(self.journal.summaries().values(), query)
+        if query.include_connection_info:
+            page.items = [
+                item.model_copy(update={'connection_info': self.codec.decode_text((self.journal.get(item.config_id) or {}).get('connection_info'))})
+                for item in page.items
+            ]
+        return page
+
+    def list_duplicate_targets(self) -> List[DuplicateTargetGroup]:
+        return group_duplicate_targets(
+            (self.codec.record_fingerprint(config_data), config_data.get('orchestrator_type'), config_id)
+            for config_id, config_data in self.journal.items()
+        )
+
+    def get_generation(self) -> int:
+        return self.journal.generation
+
+    def get_changes_since(self, generation: int) -> Optional[Set[str]]:
+        return self.journal.changes_since(generation)
+
+    def clear_all_configurations(self):
+        self.journal.clear()
+        return True
+
+    def delete_configuration(self, config_id):
+        return self.journal.delete(config_id)
+
+    def delete_configurations(self, config_ids: List[str]) -> int:
+        return self.journal.delete_many(config_ids)
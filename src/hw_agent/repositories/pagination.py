@@ -0,0 +1,104 @@
+# src/hw_agent/repositories/pagination.py
+
+import base64
+import heapq
+import json
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Any, Iterable, Optional, Tuple
+
+from hw_agent.models.connection_config_models import ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigSummary
+
+# Upper bound of every string starting with a given prefix
+_PREFIX_UPPER_BOUND = '\U0010ffff'
+
+
+def format_timestamp(value: Optional[datetime]) -> Optional[str]:
+    """
+    Timestamps are stored as UTC ISO-8601 strings with a fixed precision, so that their string
+    order is their time order. Naive datetimes are taken as UTC.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec='microseconds')
+
+
+def utc_now() -> str:
+    return format_timestamp(datetime.now(timezone.utc))
+
+
+def name_prefix_bounds(prefix: str) -> Tuple[str, str]:
+    return prefix, prefix + _PREFIX_UPPER_BOUND
+
+
+def encode_cursor(query: ConnectionConfigQuery, sort_value: Any, config_id: str) -> str:
+    """Opaque keyset cursor: the sort key of the last item of the page."""
+    payload = json.dumps([query.sort_by, query.order, sort_value, config_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, Any, str]:
+    try:
+        sort_by, order, sort_value, config_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError("cursor is not valid")
+    return sort_by, order, sort_value, config_id
+
+
+def summary_sort_value(summary: ConnectionConfigSummary, sort_by: str) -> str:
+    if sort_by in ('name', 'contact'):
+        return getattr(summary.metadata, sort_by)
+    if sort_by == 'orchestrator_type':
+        return summary.orchestrator_type.value
+    return format_timestamp(getattr(summary, sort_by)) or ''
+
+
+def matches_query(summary: ConnectionConfigSummary, query: ConnectionConfigQuery) -> bool:
+    if query.orchestrator_type and summary.orchestrator_type != query.orchestrator_type:
+        return False
+    if query.name is not None and not summary.metadata.name.startswith(query.name):
+        return False
+    if query.contact is not None and summary.metadata.contact != query.contact:
+        return False
+    for field, lower, upper in (
+        ('created_at', query.created_after, query.created_before),
+        ('updated_at', query.updated_after, query.updated_before),
+    ):
+        if lower is None and upper is None:
+            continue
+        value = format_timestamp(getattr(summary, field)) or ''
+        if lower is not None and value < format_timestamp(lower):
+            return False
+        if upper is not None and value >= format_timestamp(upper):
+            return False
+    return True
+
+
+def paginate(summaries: Iterable[ConnectionConfigSummary], query: ConnectionConfigQuery) -> ConnectionConfigPage:
+    """
+    Filters, sorts and pages configurations held in memory, with the same semantics as the
+    SQL implementation of the SQLite repository. Only limit + 1 items are kept while scanning.
+    """
+    descending = query.order == 'desc'
+    after = None
+    if query.cursor:
+        _, _, sort_value, config_id = decode_cursor(query.cursor)
+        after = (sort_value, config_id)
+
+    keyed = (
+        ((summary_sort_value(summary, query.sort_by), summary.config_id), summary)
+        for summary in summaries if matches_query(summary, query)
+    )
+    if after is not None:
+        keyed = ((key, summary) for key, summary in keyed if (key < after if descending else key > after))
+    select = heapq.nlargest if descending else heapq.nsmallest
+    selected = select(query.limit + 1, keyed, key=itemgetter(0))
+
+    page = selected[:query.limit]
+    next_cursor = None
+    if len(selected) > query.limit:
+        (sort_value, config_id), _ = page[-1]
+        next_cursor = encode_cursor(query, sort_value, config_id)
+    return ConnectionConfigPage(items=[summary for _, summary in page], next_cursor=next_cursor)
@@ -1,8 +1,12 @@
+from typing import List
+
+from hw_agent.repositories.async_base_repository import AsyncBaseRepository, ThreadedAsyncRepository
 from hw_agent.repositories.base_repository import BaseRepository
 
 
 class RepositoryFactory:
     _registry = {}
+    _async_registry = {}
 
     @classmethod
     def register(cls, key):
@@ -11,9 +15,32 @@ class RepositoryFactory:
             return repository_cls
         return decorator
 
+    @classmethod
+    def register_async(cls, key):
+        """Registers the async implementation of a repository type, built from its synchronous repository."""
+        def decorator(repository_cls):
+            cls._async_registry[key] = repository_cls
+            return repository_cls
+        return decorator
+
+    @classmethod
+    def supported_types(cls) -> List[str]:
+        return sorted(cls._registry)
+
     @classmethod
     def create_repository(cls, repository_type) -> BaseRepository:
         repository_cls = cls._registry.get(repository_type)
         if repository_cls is None:
             raise ValueError(f"Unsupported repository type: {repository_type}. Please, check the environment variable REPOSITORY_TYPE")
         return repository_cls()
+
+    @classmethod
+    def create_async_repository(cls, repository_type, repository: BaseRepository) -> AsyncBaseRepository:
+        """
+        Creates the async repository on top of the storage of `repository`. Types without an
+        async implementation run the calls of `repository` in worker threads.
+        """
+        repository_cls = cls._async_registry.get(repository_type)
+        if repository_cls is None:
+            return ThreadedAsyncRepository(repository)
+        return repository_cls(repository)
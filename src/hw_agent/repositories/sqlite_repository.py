@@ -2,82 +2,518 @@
 
 import sqlite3
 import os
-from typing import Optional
+import weakref
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from hw_agent.core.orchestrator_type import OrchestratorType
+from hw_agent.core.target_fingerprint import compute_target_fingerprint, group_duplicate_targets
 from hw_agent.repositories.base_repository import BaseRepository
+from hw_agent.repositories.connection_info_codec import ConnectionInfoCodec
 from hw_agent.repositories.repository_factory import RepositoryFactory
 from hw_agent.services.settings_service import SettingsService
-from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigRead
-from threading import Lock
+from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigRead, ConnectionConfigSummary, DuplicateTargetGroup
+from hw_agent.repositories.pagination import decode_cursor, encode_cursor, format_timestamp, name_prefix_bounds, summary_sort_value, utc_now
+from hw_agent.utils.logger import get_logger
+from threading import Lock, local
 import json
 
+_SUMMARY_COLUMNS = 'c.config_id, c.orchestrator_type, c.name, c.description, c.contact, c.location, c.created_at, c.updated_at, c.target_fingerprint'
+
+_INDEXED_COLUMNS = [
+    ('orchestrator_type', 'created_at', 'config_id'),
+    ('name', 'config_id'),
+    ('contact', 'config_id'),
+    ('created_at', 'config_id'),
+    ('updated_at', 'config_id'),
+    ('target_fingerprint', 'config_id'),
+]
+
+_MIGRATION_BATCH_SIZE = 1000
+
+_EXPORT_BATCH_SIZE = 500
+
+# Statements shared by SQLiteRepository and the aiosqlite based AsyncSQLiteRepository
+
+GET_CONFIGURATION_SQL = f'''
+    SELECT {_SUMMARY_COLUMNS}, i.connection_info
+    FROM configurations c JOIN configuration_connection_info i ON i.config_id = c.config_id
+    WHERE c.config_id = ?
+'''
+
+# created_at is kept when a configuration is replaced
+UPSERT_CONFIGURATION_SQL = '''
+    INSERT INTO configurations (config_id, orchestrator_type, name, description, contact, location, created_at, updated_at, target_fingerprint)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(config_id) DO UPDATE SET
+        orchestrator_type = excluded.orchestrator_type,
+        name = excluded.name,
+        description = excluded.description,
+        contact = excluded.contact,
+        location = excluded.location,
+        updated_at = excluded.updated_at,
+        target_fingerprint = excluded.target_fingerprint
+'''
+
+# Replaces the configuration, created_at included
+RESTORE_CONFIGURATION_SQL = '''
+    INSERT OR REPLACE INTO configurations (config_id, orchestrator_type, name, description, contact, location, created_at, updated_at, target_fingerprint)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+UPSERT_CONNECTION_INFO_SQL = '''
+    INSERT OR REPLACE INTO configuration_connection_info (config_id, connection_info)
+    VALUES (?, ?)
+'''
+
+DELETE_CONFIGURATION_SQL = (
+    'DELETE FROM configurations WHERE config_id = ?',
+    'DELETE FROM configuration_connection_info WHERE config_id = ?',
+)
+
+CLEAR_CONFIGURATIONS_SQL = (
+    'DELETE FROM configurations',
+    'DELETE FROM configuration_connection_info',
+)
+
+GENERATION_SQL = "SELECT value FROM repository_meta WHERE key = 'generation'"
+
+BUMP_GENERATION_SQL = "UPDATE repository_meta SET value = value + 1 WHERE key = 'generation'"
+
+
+def upsert_parameters(config_id: str, connection_config: ConnectionConfigCreate, timestamp: str,
+                      codec: ConnectionInfoCodec, created_at: Optional[str] = None) -> Tuple[tuple, tuple]:
+    """Parameters of UPSERT_CONFIGURATION_SQL (or RESTORE_CONFIGURATION_SQL) and UPSERT_CONNECTION_INFO_SQL."""
+    metadata = connection_config.metadata
+    configuration_row = (
+        config_id, str(connection_config.orchestrator_type), metadata.name, metadata.description,
+        metadata.contact, metadata.location, created_at or timestamp, timestamp,
+        compute_target_fingerprint(connection_config.orchestrator_type, connection_config.connection_info),
+    )
+    return configuration_row, (config_id, codec.encode(connection_config.connection_info))
+
+
+def build_list_query(query: ConnectionConfigQuery) -> Tuple[str, tuple]:
+    """
+    Builds the SELECT of one page of configurations. One row more than the page size is
+    fetched, to know whether there is a next page.
+    """
+    conditions, parameters = [], []
+    if query.orchestrator_type:
+        # There are only a few orchestrator types: unless the (orchestrator_type, created_at)
+        # index gives the requested order, '+' makes SQLite walk the sort index instead of
+        # sorting every configuration of that type
+        column = 'c.orchestrator_type' if query.sort_by == 'created_at' else '+c.orchestrator_type'
+        conditions.append(f'{column} = ?')
+        parameters.append(query.orchestrator_type.value)
+    if query.name is not None:
+        # A range instead of LIKE, so the name index is used
+        conditions.append('c.name >= ? AND c.name < ?')
+        parameters.extend(name_prefix_bounds(query.name))
+    if query.contact is not None:
+        conditions.append('c.contact = ?')
+        parameters.append(query.contact)
+    for column, lower, upper in (
+        ('created_at', query.created_after, query.created_before),
+        ('updated_at', query.updated_after, query.updated_before),
+    ):
+        if lower is not None:
+            conditions.append(f'c.{column} >= ?')
+            parameters.append(format_timestamp(lower))
+        if upper is not None:
+            conditions.append(f'c.{column} < ?')
+            parameters.append(format_timestamp(upper))
+
+    # sort_by and order are restricted to known values by ConnectionConfigQuery
+    direction = 'DESC' if query.order == 'desc' else 'ASC'
+    if query.cursor:
+        _, _, sort_value, config_id = decode_cursor(query.cursor)
+        conditions.append(f'(c.{query.sort_by}, c.config_id) {"<" if direction == "DESC" else ">"} (?, ?)')
+        parameters.extend((sort_value, config_id))
+
+    columns = _SUMMARY_COLUMNS
+    source = 'configurations c'
+    if query.include_connection_info:
+        columns += ', i.connection_info'
+        source += ' JOIN configuration_connection_info i ON i.config_id = c.config_id'
+    where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+
+    sql = f'''
+        SELECT {columns} FROM {source} {where}
+        ORDER BY c.{query.sort_by} {direction}, c.config_id {direction}
+        LIMIT ?
+    '''
+    return sql, (*parameters, query.limit + 1)
+
+
+def rows_to_page(rows: list, query: ConnectionConfigQuery, codec: ConnectionInfoCodec) -> ConnectionConfigPage:
+    """Turns the rows selected by build_list_query into a page and its next cursor."""
+    items = [
+        ConnectionConfigSummary(**row_to_dict(row, query.include_connection_info, codec))
+        for row in rows[:query.limit]
+    ]
+    next_cursor = None
+    if len(rows) > query.limit:
+        last = items[-1]
+        next_cursor = encode_cursor(query, summary_sort_value(last, query.sort_by), last.config_id)
+    return ConnectionConfigPage(items=items, next_cursor=next_cursor)
+
+
+def row_to_dict(row, include_connection_info: bool, codec: Optional[ConnectionInfoCodec] = None) -> dict:
+    config_id, orchestrator_type, name, description, contact, location, created_at, updated_at, target_fingerprint = row[:9]
+    data = {
+        'config_id': config_id,
+        'orchestrator_type': orchestrator_type,
+        'metadata': {'name': name, 'description': description, 'contact': contact, 'location': location},
+        'created_at': created_at,
+        'updated_at': updated_at,
+        'target_fingerprint': target_fingerprint,
+    }
+    if include_connection_info:
+        # Only decompressed here, when the connection info is returned
+        data['connection_info'] = codec.decode(row[9])
+    return data
+
+
+class _ThreadReader:
+    """Holds the reader connection of one thread, in its thread-local storage."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+
+def _close_reader(connection: sqlite3.Connection, connections: Set[sqlite3.Connection], lock: Lock):
+    with lock:
+        connections.discard(connection)
+    connection.close()
+
+
 @RepositoryFactory.register('sqlite')
 class SQLiteRepository(BaseRepository):
-    _lock = Lock()
+    """
+    SQLite repository in WAL mode. Readers never block the writer nor each other:
+
+    - every thread reads through its own connection (opened on first use, query_only, closed
+      once the thread ends)
+    - all writes go through a single writer connection, serialized by a lock
+    """
 
     def __init__(self):
+        self.logger = get_logger(self.__class__.__name__)
         settings = SettingsService()
         db_file = settings.get('sqlite_db_file', 'data/configurations.db')
         self.db_file = os.path.abspath(db_file)
+        self.busy_timeout_ms = int(settings.get('sqlite_busy_timeout_ms', 5000))
+        self.cache_size_kib = int(settings.get('sqlite_cache_size_kib', 16384))
+        self.mmap_size_bytes = int(settings.get('sqlite_mmap_size_bytes', 268435456))
+        self.codec = ConnectionInfoCodec.from_settings()
         # Ensure the configs directory exists
         os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
-        self.connection = sqlite3.connect(self.db_file, check_same_thread=False)
+
+        self._write_lock = Lock()
+        self._readers = local()
+        self._reader_connections: Set[sqlite3.Connection] = set()
+        self._reader_connections_lock = Lock()
+
+        self.connection = self._connect()
+        # WAL is persistent in the database file, so readers opened later use it too
+        self.connection.execute('PRAGMA journal_mode=WAL')
         self._initialize_db()
 
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_file, check_same_thread=False, timeout=self.busy_timeout_ms / 1000)
+        for pragma in self.connection_pragmas(read_only):
+            connection.execute(pragma)
+        return connection
+
+    def connection_pragmas(self, read_only: bool = False) -> List[str]:
+        """PRAGMAs run on every new connection, also by the async repository."""
+        pragmas = [
+            # In WAL mode NORMAL only syncs at checkpoints; a crash can lose the last commits, never corrupt the file
+            'PRAGMA synchronous=NORMAL',
+            f'PRAGMA busy_timeout={self.busy_timeout_ms}',
+            # A negative cache_size is in KiB instead of pages
+            f'PRAGMA cache_size=-{self.cache_size_kib}',
+            f'PRAGMA mmap_size={self.mmap_size_bytes}',
+            'PRAGMA temp_store=MEMORY',
+        ]
+        if read_only:
+            pragmas.append('PRAGMA query_only=ON')
+        return pragmas
+
+    def _get_reader(self) -> sqlite3.Connection:
+        reader = getattr(self._readers, 'reader', None)
+        if reader is None:
+            reader = _ThreadReader(self._connect(read_only=True))
+            self._readers.reader = reader
+            with self._reader_connections_lock:
+                self._reader_connections.add(reader.connection)
+            # The thread-local storage of a thread is dropped when it ends, and its reader with it.
+            # The finalizer does not reference the repository, which it would keep alive.
+            weakref.finalize(
+                reader, _close_reader, reader.connection, self._reader_connections, self._reader_connections_lock
+            )
+        return reader.connection
+
+    def close(self):
+        with self._reader_connections_lock:
+            for connection in self._reader_connections:
+                connection.close()
+            self._reader_connections.clear()
+        with self._write_lock:
+            self.connection.close()
+
     def _initialize_db(self):
-        with self._lock:
+        with self._write_lock:
             cursor = self.connection.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS configurations (
-                    config_id TEXT PRIMARY KEY,
-                    connection_info TEXT
-                )
-            ''')
+            # Schema changes and the migration are applied all together or not at all
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                self._create_schema(cursor)
+            except Exception:
+                self.connection.rollback()
+                raise
             self.connection.commit()
 
+    def _create_schema(self, cursor):
+        legacy = self._is_legacy_schema(cursor)
+        if legacy:
+            cursor.execute('ALTER TABLE configurations RENAME TO configurations_legacy')
+        # Listing only reads the metadata table; connection info is stored apart
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS configurations (
+                config_id TEXT PRIMARY KEY,
+                orchestrator_type TEXT NOT NULL,
+                name TEXT NOT NULL,
+                description TEXT,
+                contact TEXT NOT NULL,
+                location TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                target_fingerprint TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS configuration_connection_info (
+                config_id TEXT PRIMARY KEY,
+                connection_info TEXT NOT NULL
+            )
+        ''')
+        # Bumped by every write transaction, so other workers can detect changes
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS repository_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute("INSERT OR IGNORE INTO repository_meta (key, value) VALUES ('generation', 0)")
+        fingerprints_missing = not legacy and 'target_fingerprint' not in self._table_columns(cursor, 'configurations')
+        if fingerprints_missing:
+            cursor.execute('ALTER TABLE configurations ADD COLUMN target_fingerprint TEXT')
+        # Every index ends with config_id, the tie-breaker of keyset pagination
+        for columns in _INDEXED_COLUMNS:
+            index_name = 'idx_configurations_' + '_'.join(columns[:-1])
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON configurations ({", ".join(columns)})')
+        if legacy:
+            self._migrate_legacy_table(cursor)
+            self._bump_generation(cursor)
+        if fingerprints_missing:
+            self._add_target_fingerprints(cursor)
+            self._bump_generation(cursor)
+
+    def _is_legacy_schema(self, cursor) -> bool:
+        columns = self._table_columns(cursor, 'configurations')
+        return bool(columns) and 'orchestrator_type' not in columns
+
+    def _table_columns(self, cursor, table: str) -> set:
+        return {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+
+    def _add_target_fingerprints(self, cursor):
+        """Computes the target fingerprint of the configurations stored before it existed."""
+        rows = self.connection.execute('''
+            SELECT c.config_id, c.orchestrator_type, i.connection_info
+            FROM configurations c JOIN configuration_connection_info i ON i.config_id = c.config_id
+        ''')
+        while batch := rows.fetchmany(_MIGRATION_BATCH_SIZE):
+            cursor.executemany(
+                'UPDATE configurations SET target_fingerprint = ? WHERE config_id = ?',
+                [
+                    (compute_target_fingerprint(orchestrator_type, self.codec.decode(connection_info)), config_id)
+                    for config_id, orchestrator_type, connection_info in batch
+                ]
+            )
+        self.logger.info("Added the target fingerprint of the stored configurations.")
+
+    def _migrate_legacy_table(self, cursor):
+        """
+        Moves the rows of the former single JSON column table into the normalized tables, in the
+        same transaction as the schema change. Rows that cannot be read are kept in
+        configurations_legacy.
+        """
+        migrated_at = utc_now()
+        failed = 0
+        rows = self.connection.execute('SELECT config_id, connection_info FROM configurations_legacy')
+        while batch := rows.fetchmany(_MIGRATION_BATCH_SIZE):
+            for config_id, connection_info_json in batch:
+                try:
+                    connection_config = ConnectionConfigCreate(**json.loads(connection_info_json))
+                except Exception as e:
+                    self.logger.error(f"Configuration '{config_id}' could not be migrated: {e}")
+                    failed += 1
+                    continue
+                self._upsert(cursor, config_id, connection_config, migrated_at)
+        if failed:
+            cursor.execute('DELETE FROM configurations_legacy WHERE config_id IN (SELECT config_id FROM configurations)')
+            self.logger.warning(f"{failed} configurations were left in the configurations_legacy table.")
+        else:
+            cursor.execute('DROP TABLE configurations_legacy')
+        self.logger.info("Migrated configurations to the normalized schema.")
+
+    def _upsert(self, cursor, config_id: str, connection_config: ConnectionConfigCreate, timestamp: str):
+        configuration_row, connection_info_row = upsert_parameters(config_id, connection_config, timestamp, self.codec)
+        cursor.execute(UPSERT_CONFIGURATION_SQL, configuration_row)
+        cursor.execute(UPSERT_CONNECTION_INFO_SQL, connection_info_row)
+
+    def _bump_generation(self, cursor):
+        cursor.execute(BUMP_GENERATION_SQL)
+
+    def get_generation(self) -> int:
+        row = self._get_reader().execute(GENERATION_SQL).fetchone()
+        return row[0]
+
     def save_configuration(self, config_id, connection_info: ConnectionConfigCreate) -> None:
-        with self._lock:
+        with self._write_lock:
             cursor = self.connection.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO configurations (config_id, connection_info)
-                VALUES (?, ?)
-            ''', (config_id, json.dumps(connection_info.model_dump(mode="json"))))
+            try:
+                self._upsert(cursor, config_id, connection_info, utc_now())
+                self._bump_generation(cursor)
+            except Exception:
+                self.connection.rollback()
+                raise
             self.connection.commit()
 
-    def get_configuration(self, config_id) -> Optional[ConnectionConfigRead]:
-        with self._lock:
+    def save_configurations(self, connection_configs: Dict[str, ConnectionConfigCreate]) -> None:
+        with self._write_lock:
             cursor = self.connection.cursor()
-            cursor.execute('''
-                SELECT connection_info FROM configurations WHERE config_id = ?
-            ''', (config_id,))
-            row = cursor.fetchone()
-            if row:
-                connection_info_json = row[0]
-                connection_info_data = json.loads(connection_info_json)
-                # Add the config_id to the data
-                connection_info_data['config_id'] = config_id
-                
-                # Instantiate ConnectionConfigRead using automatic mapping
-                return ConnectionConfigRead(**connection_info_data)           
-            else:
-                return None
+            timestamp = utc_now()
+            try:
+                for config_id, connection_config in connection_configs.items():
+                    self._upsert(cursor, config_id, connection_config, timestamp)
+                self._bump_generation(cursor)
+            except Exception:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+
+    def get_configuration(self, config_id) -> Optional[ConnectionConfigRead]:
+        cursor = self._get_reader().cursor()
+        cursor.execute(GET_CONFIGURATION_SQL, (config_id,))
+        row = cursor.fetchone()
+        if row:
+            # Instantiate ConnectionConfigRead using automatic mapping
+            return ConnectionConfigRead(**row_to_dict(row, include_connection_info=True, codec=self.codec))
+        else:
+            return None
+
     def get_configurations(self):
-        with self._lock:
+        cursor = self._get_reader().cursor()
+        cursor.execute(f'''
+            SELECT {_SUMMARY_COLUMNS}, i.connection_info
+            FROM configurations c JOIN configuration_connection_info i ON i.config_id = c.config_id
+        ''')
+        configurations = {}
+        for row in cursor:
+            data = row_to_dict(row, include_connection_info=True, codec=self.codec)
+            configurations[data['config_id']] = {
+                key: data[key] for key in ('metadata', 'orchestrator_type', 'connection_info')
+            }
+        return configurations
+
+    def restore_configurations(self, configurations: List[ConnectionConfigRead]) -> None:
+        with self._write_lock:
             cursor = self.connection.cursor()
-            cursor.execute('SELECT config_id, connection_info FROM configurations')
-            rows = cursor.fetchall()
-            return {config_id: json.loads(connection_info) for config_id, connection_info in rows}
-        
+            try:
+                for configuration in configurations:
+                    configuration_row, connection_info_row = upsert_parameters(
+                        configuration.config_id, configuration, format_timestamp(configuration.updated_at) or utc_now(),
+                        self.codec, created_at=format_timestamp(configuration.created_at),
+                    )
+                    cursor.execute(RESTORE_CONFIGURATION_SQL, configuration_row)
+                    cursor.execute(UPSERT_CONNECTION_INFO_SQL, connection_info_row)
+                self._bump_generation(cursor)
+            except Exception:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+
+    def iter_configurations(self, after_config_id: Optional[str] = None) -> Iterator[ConnectionConfigRead]:
+        # Batches are read by config_id, each with the reader of the thread asking for it:
+        # a streaming response may resume the iteration on a different thread
+        last_config_id = after_config_id or ''
+        while True:
+            rows = self._get_reader().execute(f'''
+                SELECT {_SUMMARY_COLUMNS}, i.connection_info
+                FROM configurations c JOIN configuration_connection_info i ON i.config_id = c.config_id
+                WHERE c.config_id > ? ORDER BY c.config_id LIMIT ?
+            ''', (last_config_id, _EXPORT_BATCH_SIZE)).fetchall()
+            for row in rows:
+                yield ConnectionConfigRead(**row_to_dict(row, include_connection_info=True, codec=self.codec))
+            if len(rows) < _EXPORT_BATCH_SIZE:
+                return
+            last_config_id = rows[-1][0]
+
+    def list_configurations(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        sql, parameters = build_list_query(query)
+        rows = self._get_reader().execute(sql, parameters).fetchall()
+        return rows_to_page(rows, query, self.codec)
+
+    def list_duplicate_targets(self) -> List[DuplicateTargetGroup]:
+        rows = self._get_reader().execute('''
+            SELECT target_fingerprint, orchestrator_type, config_id FROM configurations
+            WHERE target_fingerprint IN (
+                SELECT target_fingerprint FROM configurations
+                WHERE target_fingerprint IS NOT NULL
+                GROUP BY target_fingerprint HAVING COUNT(*) > 1
+            )
+        ''').fetchall()
+        return group_duplicate_targets(rows)
+
     def clear_all_configurations(self):
-        with self._lock:
+        with self._write_lock:
+            cursor = self.connection.cursor()
+            try:
+                for statement in CLEAR_CONFIGURATIONS_SQL:
+                    cursor.execute(statement)
+                self._bump_generation(cursor)
+            except Exception:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+
+    def delete_configurations(self, config_ids: List[str]) -> int:
+        with self._write_lock:
             cursor = self.connection.cursor()
-            cursor.execute('DELETE FROM configurations')
-            self.connection.commit()    
-        
+            try:
+                parameters = [(config_id,) for config_id in config_ids]
+                cursor.executemany(DELETE_CONFIGURATION_SQL[0], parameters)
+                deleted = cursor.rowcount
+                for statement in DELETE_CONFIGURATION_SQL[1:]:
+                    cursor.executemany(statement, parameters)
+                self._bump_generation(cursor)
+            except Exception:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+            return deleted
+
     def delete_configuration(self, config_id):
-        with self._lock:
+        with self._write_lock:
             cursor = self.connection.cursor()
-            cursor.execute('DELETE FROM configurations WHERE config_id = ?', (config_id,))
+            try:
+                for statement in DELETE_CONFIGURATION_SQL:
+                    cursor.execute(statement, (config_id,))
+                self._bump_generation(cursor)
+            except Exception:
+                self.connection.rollback()
+                raise
             self.connection.commit()
-            
-            return True
\ No newline at end of file
+
+            return True
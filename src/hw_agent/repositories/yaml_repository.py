@@ -1,73 +1,194 @@
 # src/hw_agent/repositories/yaml_repository.py
 
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+import tempfile
 import yaml
 import os
-from threading import Lock
+from threading import RLock
+from hw_agent.core.target_fingerprint import group_duplicate_targets
 from hw_agent.repositories.base_repository import BaseRepository
+from hw_agent.repositories.connection_info_codec import ConnectionInfoCodec
 from hw_agent.repositories.repository_factory import RepositoryFactory
 from hw_agent.services.settings_service import SettingsService
-from hw_agent.models.connection_config_models import ConnectionConfigRead, ConnectionConfigCreate
+from hw_agent.models.connection_config_models import ConnectionConfigRead, ConnectionConfigCreate, ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigSummary, DuplicateTargetGroup
+from hw_agent.repositories.pagination import format_timestamp, paginate, utc_now
+
+# libyaml bindings are several times faster, when they are available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+@dataclass
+class _YAMLSnapshot:
+    # (inode, mtime_ns, size) of the file the configurations were parsed from
+    signature: Optional[Tuple[int, int, int]]
+    configurations: Dict[str, dict]
+    # Built on the first listing and dropped with the snapshot
+    summaries: Optional[Dict[str, ConnectionConfigSummary]] = field(default=None)
+
 
 @RepositoryFactory.register('yaml')
 class YAMLRepository(BaseRepository):
-    _lock = Lock()
+    """
+    YAML file repository with the parsed file kept in memory.
+
+    Lookups are dict hits on the current snapshot; the file is only parsed again when its
+    inode, mtime or size changes, e.g. after a write by another instance or process. Writes
+    replace the file atomically (temp file, fsync, rename), so a crash never leaves it truncated.
+    """
+    # Reentrant: writers hold it while reading the current snapshot
+    _lock = RLock()
 
     def __init__(self):
         settings = SettingsService()
         config_file = settings.get('yaml_config_file', 'data/configurations.yaml')
         self.config_file = os.path.abspath(config_file)
+        self.codec = ConnectionInfoCodec.from_settings()
         # Ensure the configs directory exists
         os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+        self._snapshot = _YAMLSnapshot(signature=None, configurations={})
         # Initialize the YAML file if it doesn't exist
-        if not os.path.exists(self.config_file):
-            with open(self.config_file, 'w') as f:
-                yaml.dump({}, f)
+        with self._lock:
+            if not os.path.exists(self.config_file):
+                self._write_all({})
 
     def save_configuration(self, config_id, connection_info: ConnectionConfigCreate) -> None:
         with self._lock:
-            data = self._read_all()
-            data[config_id] = connection_info.model_dump(mode="json")
-            with open(self.config_file, 'w') as f:
-                yaml.dump(data, f)
+            data = dict(self._read_all())
+            now = utc_now()
+            created_at = data.get(config_id, {}).get('created_at', now)
+            data[config_id] = self.codec.encode_record(connection_info, created_at, now)
+            self._write_all(data)
 
-    def get_configuration(self, config_id) -> Optional[ConnectionConfigRead]:
+    def save_configurations(self, connection_configs: Dict[str, ConnectionConfigCreate]) -> None:
         with self._lock:
-            configurations = self._read_all()
-            config_data = configurations.get(config_id)
-            if config_data:
-                # Add the config_id to the data
-                config_data['config_id'] = config_id
-                # Instantiate ConnectionConfigRead using automatic mapping
-                return ConnectionConfigRead(**config_data)
-            else:
-                return None        
-        
-
-    def _read_all(self):
-        with open(self.config_file, 'r') as f:
-            data = yaml.safe_load(f) or {}
-        return data
+            data = dict(self._read_all())
+            now = utc_now()
+            for config_id, connection_config in connection_configs.items():
+                created_at = data.get(config_id, {}).get('created_at', now)
+                data[config_id] = self.codec.encode_record(connection_config, created_at, now)
+            self._write_all(data)
+
+    def get_configuration(self, config_id) -> Optional[ConnectionConfigRead]:
+        config_data = self._read_all().get(config_id)
+        if config_data:
+            return self.codec.decode_record(config_id, config_data)
+        else:
+            return None
+
+    def _read_all(self) -> Dict[str, dict]:
+        """
+        Returns the configurations of the current snapshot. Snapshots are never modified, writers
+        replace them, so readers do not need the lock unless the file has to be parsed again.
+        """
+        snapshot = self._snapshot
+        if self._file_signature() != snapshot.signature:
+            with self._lock:
+                snapshot = self._refresh()
+        return snapshot.configurations
+
+    def _refresh(self) -> _YAMLSnapshot:
+        # Called with the lock held; another thread may have reloaded the file meanwhile
+        signature = self._file_signature()
+        if signature != self._snapshot.signature:
+            with open(self.config_file, 'r') as f:
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
+            self._snapshot = _YAMLSnapshot(signature=signature, configurations=data)
+        return self._snapshot
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _write_all(self, data: Dict[str, dict]):
+        """Replaces the file atomically and makes the new content the current snapshot."""
+        directory = os.path.dirname(self.config_file)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.configurations-', suffix='.yaml')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                yaml.dump(data, f, Dumper=_YAML_DUMPER)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_file)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        # Persist the rename itself
+        directory_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+        self._snapshot = _YAMLSnapshot(signature=self._file_signature(), configurations=data)
+
+    def list_duplicate_targets(self) -> List[DuplicateTargetGroup]:
+        return group_duplicate_targets(
+            (self.codec.record_fingerprint(config_data), config_data.get('orchestrator_type'), config_id)
+            for config_id, config_data in self._read_all().items()
+        )
+
+    def get_generation(self) -> int:
+        # The file signature changes with every write, whichever process made it
+        self._read_all()
+        return hash(self._snapshot.signature)
 
     def get_configurations(self):
+        return {
+            config_id: {**config_data, 'connection_info': self.codec.decode_text(config_data.get('connection_info'))}
+            for config_id, config_data in self._read_all().items()
+        }
+
+    def iter_configurations(self, after_config_id: Optional[str] = None) -> Iterator[ConnectionConfigRead]:
+        # The snapshot is never modified, writes during the iteration do not affect it
+        configurations = self._read_all()
+        for config_id in sorted(configurations):
+            if after_config_id is None or config_id > after_config_id:
+                yield self.codec.decode_record(config_id, configurations[config_id])
+
+    def restore_configurations(self, configurations: List[ConnectionConfigRead]) -> None:
         with self._lock:
-            data = self._read_all()
-            return data
-        
+            data = dict(self._read_all())
+            for configuration in configurations:
+                data[configuration.config_id] = self.codec.encode_record(
+                    configuration, format_timestamp(configuration.created_at), format_timestamp(configuration.updated_at)
+                )
+            self._write_all(data)
+
+    def list_configurations(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        self._read_all()
+        snapshot = self._snapshot
+        if snapshot.summaries is None:
+            snapshot.summaries = {
+                config_id: ConnectionConfigSummary(
+                    config_id=config_id,
+                    **{key: value for key, value in config_data.items() if key != 'connection_info'}
+                )
+                for config_id, config_data in snapshot.configurations.items()
+            }
+        page = paginate(snapshot.summaries.values(), query)
+        if query.include_connection_info:
+            page.items = [
+                item.model_copy(update={'connection_info': self.codec.decode_text(snapshot.configurations[item.config_id].get('connection_info'))})
+                for item in page.items
+            ]
+        return page
+
     def clear_all_configurations(self):
         with self._lock:
-            data = {}
-            with open(self.config_file, 'w') as f:
-                yaml.dump(data, f)
+            self._write_all({})
         return True
-    
+
     def delete_configuration(self, config_id):
+        return self.delete_configurations([config_id]) == 1
+
+    def delete_configurations(self, config_ids: List[str]) -> int:
         with self._lock:
             data = self._read_all()
-            if config_id in data:
-                del data[config_id]
-                with open(self.config_file, 'w') as f:
-                    yaml.dump(data, f)
-                return True
-            else:
-                return False
\ No newline at end of file
+            deleted = set(config_ids) & data.keys()
+            if deleted:
+                self._write_all({key: value for key, value in data.items() if key not in deleted})
+            return len(deleted)
@@ -0,0 +1,19 @@
+# src/hw_agent/api/admin_router.py
+
+from fastapi import APIRouter, status
+from hw_agent.models.migration_models import RepositoryMigrationReport, RepositoryMigrationRequest
+from hw_agent.services.migration_service import RepositoryMigrationService
+
+router = APIRouter(prefix="/admin", tags=["Administration"])
+
+@router.post("/migrations", response_model=RepositoryMigrationReport, summary="Copy the configurations into another repository type",
+             status_code=status.HTTP_200_OK)
+def migrate_repository(migration_request: RepositoryMigrationRequest):
+    """
+    Streams every configuration of the `source` repository type into the `target` one, in
+    batches, while the agent keeps serving. An interrupted migration continues where it
+    stopped unless `resume` is false. The report tells whether both repositories were found
+    identical, by count and hash; run it again right before switching REPOSITORY_TYPE to
+    copy the changes made meanwhile.
+    """
+    return RepositoryMigrationService().migrate(migration_request)
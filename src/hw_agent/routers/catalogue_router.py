@@ -1,6 +1,10 @@
 # src/hw_agent/api/catalogue_router.py
 
-from fastapi import APIRouter, Depends, status
+import json
+from typing import Annotated, AsyncIterator, Literal, Optional
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from hw_agent.models.catalogue_models import BulkPublishRequest, BulkPublishResult, CatalogueMirrorStatistics
 from hw_agent.models.computational_asset import ComputationalAsset
 from hw_agent.services.catalogue_service import CatalogueService
 
@@ -13,17 +17,69 @@ def get_catalogue_service():
 
 @router.get("/computational-assets/{asset_id}",  status_code=status.HTTP_200_OK,
             summary="Retrieve a computational asset from the Metadata Catalogue.")
-def get_computational_asset(asset_id: str, catalogue_service: CatalogueService = Depends(get_catalogue_service)):
-    return catalogue_service.get_computational_asset(asset_id)
+async def get_computational_asset(asset_id: str, catalogue_service: CatalogueService = Depends(get_catalogue_service)):
+    """
+    Answered from the local mirror of the catalogue while its copy is recent enough, otherwise
+    after checking with the catalogue whether the asset changed.
+    """
+    return await catalogue_service.get_computational_asset_async(asset_id)
+
+
+@router.get("/mirror/statistics", response_model=CatalogueMirrorStatistics, status_code=status.HTTP_200_OK,
+            summary="Statistics of the local mirror of the Metadata Catalogue.")
+def get_mirror_statistics(catalogue_service: CatalogueService = Depends(get_catalogue_service)):
+    return catalogue_service.get_mirror_statistics()
 
 
 @router.post("/computational-assets", status_code=status.HTTP_201_CREATED,
             summary="Post a computational asset to the Metadata Catalogue.")
-def create_computational_asset(computational_asset: ComputationalAsset, catalogue_service: CatalogueService = Depends(get_catalogue_service)):
-    return catalogue_service.create_computational_asset(computational_asset)
+async def create_computational_asset(computational_asset: ComputationalAsset, catalogue_service: CatalogueService = Depends(get_catalogue_service)):
+    return await catalogue_service.create_computational_asset_async(computational_asset)
+
+
+@router.post("/computational-assets:bulk", response_model=BulkPublishResult, status_code=status.HTTP_200_OK,
+            summary="Post many computational assets to the Metadata Catalogue.")
+async def publish_computational_assets(publish_request: BulkPublishRequest, catalogue_service: CatalogueService = Depends(get_catalogue_service)):
+    """
+    Publishes the given `assets` and the assets collected from the given `config_ids`, with at
+    most `concurrency` items in progress and `rate_per_second` requests per second. The answer
+    has the status of each item, in the order of the request: the assets first, then the
+    config_ids.
+    """
+    return await catalogue_service.publish_computational_assets(publish_request)
 
 
 @router.get("/computational-assets", status_code=status.HTTP_200_OK,
             summary="Get all computational assets from the Metadata Catalogue.")
-def get_all_computational_assets(catalogue_service: CatalogueService = Depends(get_catalogue_service)):
-    return catalogue_service.get_all_computational_assets()
\ No newline at end of file
+async def get_all_computational_assets(format: Literal['json', 'ndjson'] = 'json',
+                                       page_size: Annotated[Optional[int], Query(ge=1, le=1000)] = None,
+                                       catalogue_service: CatalogueService = Depends(get_catalogue_service)):
+    """
+    Streams every asset of the catalogue, as a JSON array or as NDJSON, while it is read page by
+    page (`page_size` assets per request to the catalogue). An error reading the first page is
+    answered as usual; an error on a later page ends the stream early.
+    """
+    assets = catalogue_service.iter_computational_assets_async(page_size)
+    # The first page is read before answering, to report an unreachable catalogue with a status
+    first_asset = await anext(assets, None)
+    media_type = 'application/x-ndjson' if format == 'ndjson' else 'application/json'
+    return StreamingResponse(_stream_assets(first_asset, assets, format), media_type=media_type)
+
+
+async def _stream_assets(first_asset: Optional[dict], assets: AsyncIterator[dict], stream_format: str) -> AsyncIterator[str]:
+    try:
+        if stream_format == 'ndjson':
+            if first_asset is not None:
+                yield json.dumps(first_asset) + '\n'
+                async for asset in assets:
+                    yield json.dumps(asset) + '\n'
+        elif first_asset is None:
+            yield '[]'
+        else:
+            yield '[' + json.dumps(first_asset)
+            async for asset in assets:
+                yield ',' + json.dumps(asset)
+            yield ']'
+    finally:
+        # A client that disconnects stops the prefetch of the next page
+        await assets.aclose()
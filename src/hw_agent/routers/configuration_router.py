@@ -1,22 +1,27 @@
 # src/hw_agent/api/configuration_router.py
 
+import asyncio
 import json
-from typing import Any, Dict
-from fastapi import APIRouter, HTTPException, Request, Response, status
+from typing import Annotated, Any, Iterator, List, Literal
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import yaml
 from hw_agent.core.orchestrator_type import OrchestratorType
 from hw_agent.exceptions.custom_exceptions import ConfigurationNotFoundError
-from hw_agent.models.connection_config_models import ConnectionConfigResponse, ConnectionConfigCreate, ConnectionConfigRead
+from hw_agent.models.connection_config_models import BulkImportResult, ConfigurationCacheStatistics, ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigResponse, ConnectionConfigCreate, ConnectionConfigRead, DuplicateTargetGroup
 from hw_agent.services.repository_service import RepositoryService
 from hw_agent.core.plugin_manager import PluginManager
 
 router = APIRouter(prefix="/configurations", tags=["Configurations"])
 repository_service = RepositoryService()
 
+# libyaml bindings are several times faster, when they are available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
-@router.post("/{orchestrator_type}", response_model=ConnectionConfigResponse, status_code=status.HTTP_201_CREATED)
-async def store_configuration(orchestrator_type: OrchestratorType, request: Request):
+
+async def _read_configuration_body(request: Request) -> dict:
     # Determine the content type
     content_type = request.headers.get('Content-Type', '')
     if 'application/json' in content_type:
@@ -38,39 +43,151 @@ async def store_configuration(orchestrator_type: OrchestratorType, request: Requ
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid payload. Expected a dictionary"
         )
+    return body
+
+
+@router.post("/{orchestrator_type}", response_model=ConnectionConfigResponse, status_code=status.HTTP_201_CREATED)
+async def store_configuration(orchestrator_type: OrchestratorType, request: Request):
+    body = await _read_configuration_body(request)
 
     # Bind the connection information to the model
     connection = ConnectionConfigCreate(**body)
 
-    config_id = repository_service.save_configuration(connection)
+    config_id = await repository_service.save_configuration_async(connection)
     return ConnectionConfigResponse(config_id=config_id, orchestrator_type=orchestrator_type)
 
 
+@router.post("/{orchestrator_type}/validate", status_code=status.HTTP_200_OK,
+             summary="Validate a configuration without storing it")
+async def validate_configuration(orchestrator_type: OrchestratorType, request: Request):
+    """
+    Validates the connection info against the plugin's connection schema. On failure, every
+    validation error is returned at once, not only the first one.
+    """
+    body = await _read_configuration_body(request)
+    connection = ConnectionConfigCreate(**body)
+    PluginManager().validate_connection_info(connection.connection_info, connection.orchestrator_type)
+    return {"valid": True}
+
+
+def _parse_bulk_body(content_type: str, raw_body: bytes) -> List[Any]:
+    """
+    Parses NDJSON (one configuration per line), multi-document YAML or a JSON array. An NDJSON
+    line that is not valid JSON becomes its parsing error, so the other lines still get imported.
+    """
+    if 'ndjson' in content_type or 'jsonl' in content_type:
+        documents = []
+        for line in raw_body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                documents.append(json.loads(line))
+            except ValueError as e:
+                documents.append(ValueError(f"Invalid JSON: {e}"))
+        return documents
+    if 'application/x-yaml' in content_type or 'text/yaml' in content_type:
+        try:
+            return [document for document in yaml.load_all(raw_body, Loader=_YAML_LOADER) if document is not None]
+        except yaml.YAMLError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid YAML: {e}")
+    if 'application/json' in content_type:
+        try:
+            documents = json.loads(raw_body)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON: {e}")
+        if not isinstance(documents, list):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid payload. Expected a list")
+        return documents
+    raise HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail="Unsupported Content-Type. Supported types are application/x-ndjson, application/x-yaml and application/json."
+    )
+
+
+@router.post("/bulk/import", response_model=BulkImportResult, status_code=status.HTTP_200_OK,
+             summary="Import many configurations at once")
+async def import_configurations(request: Request, all_or_nothing: bool = False):
+    """
+    Imports configurations from NDJSON, multi-document YAML or a JSON array. Every configuration
+    is validated first, then the valid ones are stored in a single transaction. The result
+    reports the config_id or the validation errors of each configuration, in document order.
+    With all_or_nothing, nothing is stored if any configuration is invalid.
+    """
+    content_type, raw_body = request.headers.get('Content-Type', ''), await request.body()
+    # Parsing, validation and the store transaction are blocking: kept off the event loop
+    return await asyncio.to_thread(_import_bulk_body, content_type, raw_body, all_or_nothing)
+
+
+def _import_bulk_body(content_type: str, raw_body: bytes, all_or_nothing: bool) -> BulkImportResult:
+    return repository_service.import_configurations(_parse_bulk_body(content_type, raw_body), all_or_nothing)
+
+
+def _export_lines(export_format: str) -> Iterator[str]:
+    for configuration in repository_service.iter_configurations():
+        document = configuration.model_dump(mode="json")
+        if export_format == 'yaml':
+            yield yaml.dump(document, Dumper=_YAML_DUMPER, explicit_start=True)
+        else:
+            yield json.dumps(document) + '\n'
+
+
+@router.get("/bulk/export", status_code=status.HTTP_200_OK, summary="Export every configuration")
+def export_configurations(format: Literal['ndjson', 'yaml'] = 'ndjson'):
+    """
+    Streams every configuration, connection info included, as NDJSON or multi-document YAML.
+    The output can be imported again with POST /configurations/bulk/import.
+    """
+    media_type = 'application/x-yaml' if format == 'yaml' else 'application/x-ndjson'
+    return StreamingResponse(_export_lines(format), media_type=media_type)
+
+
+@router.get("/cache/statistics", response_model=ConfigurationCacheStatistics, status_code=status.HTTP_200_OK,
+            summary="Statistics of the configuration cache")
+def get_cache_statistics():
+    return repository_service.get_cache_statistics()
+
+
+@router.get("/duplicates", response_model=List[DuplicateTargetGroup], status_code=status.HTTP_200_OK,
+            summary="List configurations registered more than once for the same target")
+def list_duplicate_targets():
+    """
+    Groups the configurations whose connection info points to the same infrastructure with the
+    same identity, e.g. the same Kubernetes API server and user, or the same OpenStack auth_url,
+    region, project and credentials. The broker collects the data of each group only once.
+    """
+    return repository_service.list_duplicate_targets()
+
+
 @router.get("/{config_id}", response_model=ConnectionConfigRead, status_code=status.HTTP_200_OK)
-def get_configuration(config_id: str):
-    config = repository_service.get_configuration(config_id)
+async def get_configuration(config_id: str):
+    config = await repository_service.get_configuration_async(config_id)
     if not config:
         raise ConfigurationNotFoundError(
             f"Configuration with ID {config_id} not found.")
     return config
 
 
-@router.get("/", response_model=Dict[str, Any], status_code=status.HTTP_200_OK)
-def list_configurations():
-    return repository_service.get_configurations()
+@router.get("/", response_model=ConnectionConfigPage, status_code=status.HTTP_200_OK)
+async def list_configurations(query: Annotated[ConnectionConfigQuery, Query()]):
+    """
+    Lists the configurations one page at a time. Filters and sorting are applied by the
+    repository; pass the returned next_cursor to get the following page. Connection info is
+    only returned when include_connection_info is set.
+    """
+    return await repository_service.list_configurations_async(query)
 
 
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT, summary="Delete all configurations")
-def delete_all_configurations():
+async def delete_all_configurations():
     """
     Deletes all stored configurations.
     """
-    repository_service.clear_all_configurations()
+    await repository_service.clear_all_configurations_async()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.delete("/{config_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a configuration")
-def delete_configuration(config_id: str):
+async def delete_configuration(config_id: str):
     """Delete a configuration by its ID."""
-    repository_service.delete_configuration(config_id)
+    await repository_service.delete_configuration_async(config_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
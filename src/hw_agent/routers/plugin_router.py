@@ -3,7 +3,7 @@
 from typing import List
 from fastapi import APIRouter, Depends, status
 from hw_agent.core.plugin_manager import PluginManager
-from hw_agent.models.plugin_models import PluginDefinition
+from hw_agent.models.plugin_models import PluginDefinition, PluginDiagnosticsReport, PluginReloadStatistics
 
 router = APIRouter(prefix="/plugins", tags=["Plugins"])
 plugin_manager = PluginManager()
@@ -15,3 +15,23 @@ def get_all_plugins():
 @router.post("/reload", summary="Reload all available plugins", status_code=status.HTTP_200_OK)
 def reload_plugins():
     return plugin_manager.reload_plugins()
+
+@router.get("/diagnostics", response_model=PluginDiagnosticsReport, summary="Get the load time of each plugin",
+            status_code=status.HTTP_200_OK)
+def get_diagnostics():
+    """
+    Reports, for each plugin, the time spent parsing its config.yaml, validating it, importing
+    its module and creating the instance. Import times are only known once a plugin has been used
+    (or pre-warmed with `PrewarmPlugins`).
+    """
+    return plugin_manager.get_diagnostics()
+
+@router.get("/reload/statistics", response_model=PluginReloadStatistics, summary="Get plugin reload statistics",
+            status_code=status.HTTP_200_OK)
+def get_reload_statistics():
+    return plugin_manager.get_reload_statistics()
+
+@router.post("/{orchestrator_type}/reload", response_model=PluginDefinition, summary="Reload a single plugin",
+             status_code=status.HTTP_200_OK)
+def reload_plugin(orchestrator_type: str):
+    return plugin_manager.reload_plugin_by_orchestrator_type(orchestrator_type)
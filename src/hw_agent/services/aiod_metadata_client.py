@@ -1,5 +1,9 @@
 # src/hw_agent/services/aiod_metadata_client.py
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, Optional
+import httpx
 from hw_agent.dependencies import get_setting_service
 from hw_agent.exceptions.custom_exceptions import APIRequestError, AuthenticationError
 from hw_agent.models.computational_asset import ComputationalAsset
@@ -8,8 +12,20 @@ from hw_agent.services.settings_service import SettingsService
 import requests
 
 from hw_agent.utils.api_request import APIRequest
+from hw_agent.utils.async_api_request import AsyncAPIRequest
 from hw_agent.utils.logger import get_logger
 
+def _page_size() -> int:
+    return int(get_setting_service().get('catalogue_page_size', 100))
+
+
+def _auth_headers(token: str) -> dict:
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}"
+    }
+
+
 class AIODMetadataClient:
     def __init__(self):
         settings = get_setting_service()
@@ -33,6 +49,8 @@ class AIODMetadataClient:
         self.api_request = APIRequest(
             base_url=self.aiod_api_base_url
         )
+        # Assets per request when walking the catalogue
+        self.page_size = _page_size()
         
         self.logger = get_logger(self.__class__.__name__)
 
@@ -40,37 +58,26 @@ class AIODMetadataClient:
         endpoint = "/computational_assets/v1"
         json_data = asset_data.model_dump(mode="json")
 
-        # Get the token using KeycloakClient
-        token = self.keycloak_client.get_keycloak_token()
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}"
-        }
-
-        return self.api_request.make_request(
-            method='POST',
-            endpoint=endpoint,
-            headers=headers,
-            json=json_data
-        )
+        return self._authorized_request('POST', endpoint, json_data)
 
     def update_asset(self, asset_id, asset_data: ComputationalAsset):
         endpoint = f"/computational_assets/v1/{asset_id}"
         json_data = asset_data.model_dump(mode="json")
-        token = self.keycloak_client.get_keycloak_token()
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}"
-        }
-
-        response = self.api_request.make_request(
-            method='PUT',
-            endpoint=endpoint,
-            headers=headers,
-            json=json_data
-        )
 
-        return response
+        return self._authorized_request('PUT', endpoint, json_data)
+
+    def _authorized_request(self, method, endpoint, json_data):
+        # Get the token using KeycloakClient
+        token = self.keycloak_client.get_keycloak_token()
+        try:
+            return self.api_request.make_request(method=method, endpoint=endpoint, headers=_auth_headers(token), json=json_data)
+        except APIRequestError as e:
+            # The token may have been revoked or rotated before its expiry: one new token, one retry
+            if e.status_code != 401:
+                raise
+            self.logger.warning(f"The catalogue rejected the token on {method} {endpoint}, refreshing it")
+            token = self.keycloak_client.refresh_token(rejected_token=token)
+            return self.api_request.make_request(method=method, endpoint=endpoint, headers=_auth_headers(token), json=json_data)
 
     def get_asset(self, asset_id):
         endpoint = f"/computational_assets/v1/{asset_id}"
@@ -81,10 +88,132 @@ class AIODMetadataClient:
         )
         
     def get_all_assets(self):
-        endpoint = "/computational_assets/v1"
+        return list(self.iter_assets())
+
+    def iter_assets(self, page_size: int = None) -> Iterator[dict]:
+        """
+        Yields every asset of the catalogue, one offset/limit page in memory at a time. The
+        next page is requested in a background thread while the current one is consumed.
+        """
+        page_size = page_size or self.page_size
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="catalogue-prefetch") as executor:
+            next_page = executor.submit(self._get_assets_page, 0, page_size)
+            offset = 0
+            try:
+                while next_page is not None:
+                    page = next_page.result()
+                    offset += page_size
+                    next_page = executor.submit(self._get_assets_page, offset, page_size) if len(page) == page_size else None
+                    yield from page
+            finally:
+                # The consumer stopped early: the prefetched page is dropped
+                if next_page is not None:
+                    next_page.cancel()
 
+    def _get_assets_page(self, offset: int, limit: int) -> list:
         return self.api_request.make_request(
             method='GET',
-            endpoint=endpoint
+            endpoint="/computational_assets/v1",
+            params={"offset": offset, "limit": limit}
+        )
+
+
+class AsyncAIODMetadataClient:
+    """
+    Same operations as AIODMetadataClient, as coroutines on the shared async client: many
+    requests to the catalogue can be in flight at once from one worker, multiplexed on one
+    HTTP/2 connection when possible. A Keycloak client can be shared with the synchronous
+    client, so that both use the same token.
+    """
+    def __init__(self, keycloak_client: KeycloakClient = None):
+        settings = get_setting_service()
+        self.aiod_api_base_url = settings.get('aiod_api_base_url')
+
+        if not self.aiod_api_base_url:
+            raise ValueError("AIOD base URL key must be set in env file under the key AIOD_API_BASE_URL")
+
+        self.keycloak_client = keycloak_client or KeycloakClient(
+            auth_url=settings.get('aiod_keycloak_auth_url'),
+            realm=settings.get('aiod_keycloak_realm'),
+            client_id=settings.get('aiod_keycloak_client_id'),
+            client_secret=settings.get('aiod_keycloak_client_secret')
+        )
+        self.api_request = AsyncAPIRequest(base_url=self.aiod_api_base_url)
+        self.page_size = _page_size()
+        self.logger = get_logger(self.__class__.__name__)
+
+    async def get_token(self) -> str:
+        # A valid token is read from memory, only a request for a new one goes to a thread
+        return self.keycloak_client.cached_token() or await asyncio.to_thread(self.keycloak_client.get_keycloak_token)
+
+    async def create_computational_asset(self, asset_data: ComputationalAsset):
+        return await self._authorized_request('POST', "/computational_assets/v1", asset_data.model_dump(mode="json"))
+
+    async def update_asset(self, asset_id, asset_data: ComputationalAsset):
+        return await self._authorized_request('PUT', f"/computational_assets/v1/{asset_id}", asset_data.model_dump(mode="json"))
+
+    async def _authorized_request(self, method, endpoint, json_data):
+        token = await self.get_token()
+        try:
+            return await self.api_request.make_request(method=method, endpoint=endpoint, headers=_auth_headers(token), json=json_data)
+        except APIRequestError as e:
+            if e.status_code != 401:
+                raise
+            # Concurrent requests rejected with the same token share a single refresh
+            self.logger.warning(f"The catalogue rejected the token on {method} {endpoint}, refreshing it")
+            token = await asyncio.to_thread(self.keycloak_client.refresh_token, token)
+            return await self.api_request.make_request(method=method, endpoint=endpoint, headers=_auth_headers(token), json=json_data)
+
+    async def get_asset(self, asset_id):
+        return await self.api_request.make_request(
+            method='GET',
+            endpoint=f"/computational_assets/v1/{asset_id}"
+        )
+
+    async def get_asset_if_changed(self, asset_id, etag: str = None, last_modified: str = None) -> Optional[httpx.Response]:
+        """
+        Conditional GET of an asset: None if the catalogue answers that the copy with these
+        validators is still current (304), the response with the asset and its validators
+        otherwise.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = await self.api_request.send(
+            method='GET',
+            endpoint=f"/computational_assets/v1/{asset_id}",
+            headers=headers
+        )
+        return None if response.status_code == 304 else response
+
+    async def get_all_assets(self):
+        return [asset async for asset in self.iter_assets()]
+
+    async def iter_assets(self, page_size: int = None) -> AsyncIterator[dict]:
+        """
+        Yields every asset of the catalogue, one offset/limit page in memory at a time. The
+        request of the next page is in flight while the current one is consumed.
+        """
+        page_size = page_size or self.page_size
+        next_page = asyncio.create_task(self._get_assets_page(0, page_size))
+        offset = 0
+        try:
+            while next_page is not None:
+                page = await next_page
+                offset += page_size
+                next_page = asyncio.create_task(self._get_assets_page(offset, page_size)) if len(page) == page_size else None
+                for asset in page:
+                    yield asset
+        finally:
+            # The consumer stopped early: the prefetched page is dropped
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _get_assets_page(self, offset: int, limit: int) -> list:
+        return await self.api_request.make_request(
+            method='GET',
+            endpoint="/computational_assets/v1",
+            params={"offset": offset, "limit": limit}
         )
-    
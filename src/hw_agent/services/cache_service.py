@@ -10,5 +10,8 @@ class CacheService:
     def retrieve_plugin(self, plugin_name):
         return self.cache.get(plugin_name)
     
+    def remove_plugin(self, plugin_name):
+        self.cache.pop(plugin_name, None)
+
     def clear_plugins(self):
         self.cache.clear()
@@ -0,0 +1,186 @@
+# src/hw_agent/services/catalogue_mirror.py
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from hw_agent.dependencies import get_setting_service
+from hw_agent.exceptions.custom_exceptions import APIRequestError
+from hw_agent.models.catalogue_models import CatalogueMirrorStatistics
+from hw_agent.utils.logger import get_logger
+
+
+@dataclass
+class MirroredAsset:
+    asset: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # Wall-clock time the catalogue last sent or confirmed this copy, kept across restarts
+    checked_at: float
+
+
+class CatalogueMirror:
+    """
+    Local copy of the catalogue assets looked up by id.
+
+    A copy checked less than `max_age_seconds` ago is returned without asking the catalogue.
+    An older one is revalidated with a conditional GET (If-None-Match / If-Modified-Since):
+    the catalogue answers 304 without the asset while it did not change. Concurrent lookups of
+    the same asset share one request.
+
+    The copies are kept in memory, at most `max_entries` of them, least recently used first
+    out. With a `db_file`, they are also stored in SQLite: after a restart, or after an
+    eviction from memory, the asset is revalidated instead of downloaded again.
+
+    `invalidate` also detaches a request already in flight for the asset: its answer may
+    predate the change that caused the invalidation, so it is not stored.
+    """
+
+    def __init__(self, aiod_client, max_age_seconds: float = 60, max_entries: int = 10000, db_file: Optional[str] = None):
+        self.aiod_client = aiod_client
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, MirroredAsset]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # Bumped by every invalidation of an asset; answers requested before are not stored
+        self._versions: Dict[str, int] = {}
+        self._statistics = CatalogueMirrorStatistics(max_age_seconds=max_age_seconds, max_entries=max_entries, persistent=bool(db_file))
+        self._db = self._open_db(db_file) if db_file else None
+        self._db_lock = threading.Lock()
+        self.logger = get_logger(self.__class__.__name__)
+
+    @classmethod
+    def from_settings(cls, aiod_client) -> "CatalogueMirror":
+        settings = get_setting_service()
+        return cls(
+            aiod_client,
+            max_age_seconds=float(settings.get('catalogue_mirror_max_age_seconds', 60)),
+            max_entries=int(settings.get('catalogue_mirror_max_entries', 10000)),
+            db_file=settings.get('catalogue_mirror_db_file') or None,
+        )
+
+    async def get(self, asset_id: str) -> Any:
+        entry = await self._lookup(asset_id)
+        if entry is not None and time.time() - entry.checked_at < self.max_age_seconds:
+            self._statistics.hits += 1
+            return entry.asset
+
+        revalidation = self._in_flight.get(asset_id)
+        if revalidation is None:
+            revalidation = asyncio.ensure_future(self._revalidate(asset_id, entry, self._versions.get(asset_id, 0)))
+            self._in_flight[asset_id] = revalidation
+            revalidation.add_done_callback(lambda done: self._forget_in_flight(asset_id, done))
+        # A caller that gives up does not cancel the request the others wait for
+        return await asyncio.shield(revalidation)
+
+    async def invalidate(self, asset_id: str):
+        """Forgets an asset, e.g. after it was updated through the agent."""
+        self._versions[asset_id] = self._versions.get(asset_id, 0) + 1
+        # Later lookups start their own request instead of joining the outdated one
+        self._in_flight.pop(asset_id, None)
+        self._entries.pop(asset_id, None)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_execute, 'DELETE FROM catalogue_assets WHERE asset_id = ?', (asset_id,))
+
+    def get_statistics(self) -> CatalogueMirrorStatistics:
+        return self._statistics.model_copy(update={'size': len(self._entries)})
+
+    def close(self):
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+
+    def _forget_in_flight(self, asset_id: str, revalidation: asyncio.Future):
+        if self._in_flight.get(asset_id) is revalidation:
+            del self._in_flight[asset_id]
+
+    async def _revalidate(self, asset_id: str, entry: Optional[MirroredAsset], version: int) -> Any:
+        try:
+            response = await self.aiod_client.get_asset_if_changed(
+                asset_id,
+                etag=entry.etag if entry else None,
+                last_modified=entry.last_modified if entry else None,
+            )
+        except APIRequestError as e:
+            if e.status_code in (404, 410) and self._versions.get(asset_id, 0) == version:
+                await self.invalidate(asset_id)
+            raise
+
+        if response is None and entry is not None:
+            self._statistics.revalidated += 1
+            entry.checked_at = time.time()
+        else:
+            self._statistics.fetched += 1
+            entry = MirroredAsset(
+                asset=response.json(),
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                checked_at=time.time(),
+            )
+        if self._versions.get(asset_id, 0) == version:
+            await self._store(asset_id, entry)
+        return entry.asset
+
+    async def _lookup(self, asset_id: str) -> Optional[MirroredAsset]:
+        entry = self._entries.get(asset_id)
+        if entry is not None:
+            self._entries.move_to_end(asset_id)
+            return entry
+        if self._db is None:
+            return None
+        row = await asyncio.to_thread(
+            self._db_fetchone, 'SELECT asset, etag, last_modified, checked_at FROM catalogue_assets WHERE asset_id = ?', (asset_id,)
+        )
+        if row is None:
+            return None
+        entry = MirroredAsset(json.loads(row[0]), row[1], row[2], row[3])
+        self._remember(asset_id, entry)
+        return entry
+
+    async def _store(self, asset_id: str, entry: MirroredAsset):
+        self._remember(asset_id, entry)
+        if self._db is not None:
+            await asyncio.to_thread(
+                self._db_execute,
+                'INSERT OR REPLACE INTO catalogue_assets (asset_id, asset, etag, last_modified, checked_at) VALUES (?, ?, ?, ?, ?)',
+                (asset_id, json.dumps(entry.asset), entry.etag, entry.last_modified, entry.checked_at),
+            )
+
+    def _remember(self, asset_id: str, entry: MirroredAsset):
+        self._entries[asset_id] = entry
+        self._entries.move_to_end(asset_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._statistics.evictions += 1
+
+    def _open_db(self, db_file: str) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
+        # Used from worker threads, one statement at a time under the lock
+        connection = sqlite3.connect(db_file, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('''
+            CREATE TABLE IF NOT EXISTS catalogue_assets (
+                asset_id TEXT PRIMARY KEY,
+                asset TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                checked_at REAL NOT NULL
+            )
+        ''')
+        connection.commit()
+        return connection
+
+    def _db_fetchone(self, sql: str, parameters: tuple):
+        with self._db_lock:
+            return self._db.execute(sql, parameters).fetchone()
+
+    def _db_execute(self, sql: str, parameters: tuple):
+        with self._db_lock:
+            with self._db:
+                self._db.execute(sql, parameters)
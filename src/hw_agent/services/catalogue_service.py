@@ -1,17 +1,35 @@
 
 
+import asyncio
+import time
+from typing import AsyncIterator, Optional
 from hw_agent.core.singleton_meta import SingletonMeta
+from hw_agent.dependencies import get_setting_service
+from hw_agent.models.catalogue_models import BulkPublishItemResult, BulkPublishRequest, BulkPublishResult, CatalogueMirrorStatistics
 from hw_agent.models.computational_asset import ComputationalAsset
-from hw_agent.services.aiod_metadata_client import AIODMetadataClient
+from hw_agent.services.aiod_metadata_client import AIODMetadataClient, AsyncAIODMetadataClient
+from hw_agent.services.catalogue_mirror import CatalogueMirror
+from hw_agent.utils.logger import get_logger
+from hw_agent.utils.rate_limiter import AsyncRateLimiter
 
 
 class CatalogueService(metaclass=SingletonMeta):
     def __init__(self):
         self.aiod_client = AIODMetadataClient()
+        # For the async routers, with the same Keycloak token
+        self.async_aiod_client = AsyncAIODMetadataClient(keycloak_client=self.aiod_client.keycloak_client)
+        # Assets looked up by id, revalidated with conditional requests
+        self.mirror = CatalogueMirror.from_settings(self.async_aiod_client)
+        settings = get_setting_service()
+        self.publish_concurrency = int(settings.get('catalogue_publish_concurrency', 16))
+        rate = settings.get('catalogue_publish_rate_per_second')
+        self.publish_rate_per_second = float(rate) if rate not in (None, '') else None
+        self.logger = get_logger(self.__class__.__name__)
 
     def get_computational_asset(self, asset_id: str) -> ComputationalAsset:
         """
         Retrieves a computational asset based on the provided asset_id from the Metadata Catalogue.
+        Always asks the catalogue: only get_computational_asset_async is answered from the mirror.
         """
         return self.aiod_client.get_asset(asset_id)
     
@@ -29,3 +47,86 @@ class CatalogueService(metaclass=SingletonMeta):
         """
         return self.aiod_client.get_all_assets()
 
+    async def get_computational_asset_async(self, asset_id: str) -> ComputationalAsset:
+        """
+        Answered from the local mirror of the catalogue, at most CATALOGUE_MIRROR_MAX_AGE_SECONDS
+        old, or revalidated with the catalogue.
+        """
+        return await self.mirror.get(asset_id)
+
+    async def create_computational_asset_async(self, computational_asset: ComputationalAsset):
+        return await self.async_aiod_client.create_computational_asset(computational_asset)
+
+    async def update_computational_asset_async(self, asset_id: str, computational_asset: ComputationalAsset):
+        try:
+            return await self.async_aiod_client.update_asset(asset_id, computational_asset)
+        finally:
+            # Even a failed update may have been applied
+            await self.mirror.invalidate(asset_id)
+
+    def get_mirror_statistics(self) -> CatalogueMirrorStatistics:
+        return self.mirror.get_statistics()
+
+    def close(self):
+        """Stops the background refresh of the Keycloak token and closes the mirror database."""
+        self.aiod_client.keycloak_client.close()
+        self.mirror.close()
+
+    async def get_all_computational_assets_async(self) -> list[ComputationalAsset]:
+        return await self.async_aiod_client.get_all_assets()
+
+    def iter_computational_assets_async(self, page_size: int = None) -> AsyncIterator[dict]:
+        """
+        Iterates over every computational asset of the Metadata Catalogue, page by page.
+        """
+        return self.async_aiod_client.iter_assets(page_size)
+
+    async def publish_computational_assets(self, publish_request: BulkPublishRequest) -> BulkPublishResult:
+        """
+        Publishes many assets to the Metadata Catalogue: the given ones, and the ones collected
+        and transformed from the given config_ids. At most `concurrency` items are handled at
+        once and requests start at most `rate_per_second` times per second. Every request uses
+        the token in memory and the pooled connections of the async client. A failed item does
+        not stop the others, its status tells where and why it failed.
+        """
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(publish_request.concurrency or self.publish_concurrency)
+        rate_limiter = AsyncRateLimiter(publish_request.rate_per_second or self.publish_rate_per_second)
+        # An authentication error fails the whole batch before anything is sent. The items then
+        # read the same token from memory, or the one replacing it if the catalogue rejects it
+        await self.async_aiod_client.get_token()
+
+        async def publish(index: int, asset: Optional[ComputationalAsset], config_id: Optional[str]) -> BulkPublishItemResult:
+            result = BulkPublishItemResult(index=index, config_id=config_id, status='failed')
+            async with semaphore:
+                if asset is None:
+                    try:
+                        asset = await asyncio.to_thread(self._collect_asset, config_id)
+                    except Exception as e:
+                        result.stage, result.error = 'collect', str(e) or e.__class__.__name__
+                        return result
+                await rate_limiter.acquire()
+                try:
+                    result.response = await self.async_aiod_client.create_computational_asset(asset)
+                except Exception as e:
+                    result.stage, result.error = 'publish', str(e) or e.__class__.__name__
+                    return result
+            result.status = 'published'
+            return result
+
+        items = [(asset, None) for asset in publish_request.assets] + [(None, config_id) for config_id in publish_request.config_ids]
+        results = await asyncio.gather(*(publish(index, asset, config_id) for index, (asset, config_id) in enumerate(items)))
+
+        published = sum(result.status == 'published' for result in results)
+        self.logger.info(f"Published {published} of {len(results)} computational assets")
+        return BulkPublishResult(
+            published=published,
+            failed=len(results) - published,
+            duration_seconds=time.perf_counter() - start,
+            items=results,
+        )
+
+    def _collect_asset(self, config_id: str) -> ComputationalAsset:
+        # Imported here: the broker is only needed, and only built, to publish configurations
+        from hw_agent.core.broker import Broker
+        return Broker().fetch_and_transform(config_id)
@@ -0,0 +1,78 @@
+# src/hw_agent/services/configuration_cache.py
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Optional, Set
+
+from hw_agent.models.connection_config_models import ConfigurationCacheStatistics, ConnectionConfigRead
+
+
+class ConfigurationCache:
+    """
+    Bounded LRU cache of validated configurations.
+
+    Every entry belongs to a repository generation. When the repository reports a different
+    generation, i.e. it was written by this or another worker, the configurations changed
+    since are dropped, or the whole cache if the repository cannot tell which ones.
+    Cached objects are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, ConnectionConfigRead]" = OrderedDict()
+        self._generation: Optional[int] = None
+        self._lock = Lock()
+        self._statistics = ConfigurationCacheStatistics(max_size=max_size)
+
+    def sync(self, generation: int, changes_since: Optional[Callable[[int], Optional[Set[str]]]] = None):
+        """
+        Drops the entries changed since they were cached, if the repository generation changed.
+        `changes_since` returns the config_ids changed after a generation, or None if unknown.
+        """
+        with self._lock:
+            if generation != self._generation:
+                if self._entries:
+                    self._statistics.generation_changes += 1
+                    changed = changes_since(self._generation) if changes_since and self._generation is not None else None
+                    if changed is None:
+                        self._entries.clear()
+                    else:
+                        for config_id in changed:
+                            self._entries.pop(config_id, None)
+                self._generation = generation
+
+    def get(self, config_id: str) -> Optional[ConnectionConfigRead]:
+        with self._lock:
+            config = self._entries.get(config_id)
+            if config is None:
+                self._statistics.misses += 1
+                return None
+            self._entries.move_to_end(config_id)
+            self._statistics.hits += 1
+            return config
+
+    def put(self, config_id: str, config: ConnectionConfigRead, generation: int):
+        """Caches a configuration read at `generation`, unless the repository changed since."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[config_id] = config
+            self._entries.move_to_end(config_id)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._statistics.evictions += 1
+
+    def invalidate(self, config_id: Optional[str] = None):
+        """Drops one configuration, or every configuration."""
+        with self._lock:
+            if config_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(config_id, None)
+            self._statistics.invalidations += 1
+
+    def get_statistics(self) -> ConfigurationCacheStatistics:
+        with self._lock:
+            return self._statistics.model_copy(update={"size": len(self._entries), "generation": self._generation})
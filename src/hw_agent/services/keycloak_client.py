@@ -1,30 +1,93 @@
+import threading
 import time
 import requests
 
+from hw_agent.dependencies import get_http_session, get_setting_service
+from hw_agent.exceptions.custom_exceptions import AuthenticationError
+from hw_agent.utils.http_session import http_timeout
 from hw_agent.utils.logger import get_logger
 
-class AuthenticationError(Exception):
-    pass
-
 class KeycloakClient:
-    def __init__(self, auth_url, realm, client_id, client_secret):
+    """
+    Client credentials token of the agent.
+
+    The token is returned from memory while it is valid. Only one thread at a time requests a
+    new one, the others wait for it and use it. Once a token has lived `refresh_fraction` of
+    its lifetime, a background thread replaces it, so that callers never wait for Keycloak
+    while the agent is busy. A token rejected by the catalogue is replaced with
+    `refresh_token`.
+    """
+    def __init__(self, auth_url, realm, client_id, client_secret, session: requests.Session = None, timeout=None, refresh_fraction: float = None):
         self.aiod_keycloak_auth_url = auth_url
         self.aiod_keycloak_realm = realm
         self.aiod_keycloak_client_id = client_id
         self.aiod_keycloak_client_secret = client_secret
-        self.token = None
-        self.token_expires_at = 0  # Initialize with 0 to force token retrieval
-        
+        # Token and expiry time, replaced together so that readers never pair a token with the
+        # expiry of another one. The expiry of 0 forces the first retrieval
+        self._token_state = (None, 0)
+        # Token requests are POSTs: only connection errors are retried
+        self.session = session or get_http_session()
+        self.timeout = timeout or http_timeout(get_setting_service())
+        # Share of the token lifetime after which it is refreshed in the background (0 disables it)
+        self.refresh_fraction = refresh_fraction if refresh_fraction is not None else float(
+            get_setting_service().get('keycloak_refresh_fraction', 0.75)
+        )
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer = None
+        self._closed = False
+
         self.logger = get_logger(self.__class__.__name__)
 
     def get_keycloak_token(self):
-        current_time = time.time()
+        token = self.cached_token()
+        if token:
+            return token
+
+        with self._refresh_lock:
+            # Another thread may have requested it while this one waited
+            token = self.cached_token()
+            if token:
+                return token
+            return self._request_token()
+
+    @property
+    def token(self):
+        return self._token_state[0]
+
+    @property
+    def token_expires_at(self):
+        return self._token_state[1]
 
-        # Check if the token exists and is still valid
-        if self.token and current_time < self.token_expires_at:
-            return self.token
+    def cached_token(self):
+        """The current token if it is still valid, without ever calling Keycloak."""
+        token, expires_at = self._token_state
+        if token and time.time() < expires_at:
+            return token
+        return None
 
-        # Request a new token if no valid token exists or token has expired
+    def refresh_token(self, rejected_token=None):
+        """
+        Replaces the token, e.g. after the catalogue answered 401 to `rejected_token`. If the
+        token was already replaced since, by another caller that got the same 401, the new one
+        is returned without asking Keycloak again.
+        """
+        with self._refresh_lock:
+            token = self.cached_token()
+            if rejected_token is not None and token and token != rejected_token:
+                return token
+            return self._request_token()
+
+    def close(self):
+        """Stops the background refresh; tokens are still requested when callers need one."""
+        # Under the lock, so that a refresh in progress does not schedule the next one
+        with self._refresh_lock:
+            self._closed = True
+            if self._refresh_timer:
+                self._refresh_timer.cancel()
+
+    def _request_token(self):
+        # Request a new token, the caller holds the refresh lock
+        current_time = time.time()
         token_url = f"{self.aiod_keycloak_auth_url}/realms/{self.aiod_keycloak_realm}/protocol/openid-connect/token"
 
         payload = {
@@ -39,20 +102,39 @@ class KeycloakClient:
         }
 
         try:
-            response = requests.post(token_url, data=payload, headers=headers)
+            response = self.session.post(token_url, data=payload, headers=headers, timeout=self.timeout)
             response.raise_for_status()
 
             token_data = response.json()
-            self.token = token_data["access_token"]
+            token = token_data["access_token"]
 
             # Calculate token expiration time (current time + expires_in seconds)
             expires_in = token_data.get("expires_in", 60)  # Default to 60 seconds if not provided
-            self.token_expires_at = current_time + expires_in - 10  # Subtract 10 seconds as a buffer
+            # Subtract 10 seconds as a buffer
+            self._token_state = (token, current_time + expires_in - 10)
+            self._schedule_refresh(expires_in)
 
-            return self.token
+            return token
         except requests.exceptions.HTTPError as e:
             self.logger.error("Failed to get keycloak token. HTTPError:", exc_info=True)
             raise AuthenticationError(f"HTTP error getting token: {response.status_code} - {e}")
         except Exception as e:
             self.logger.error("Failed to get keycloak token. Exception:", exc_info=True)
             raise AuthenticationError(f"Error getting token: {e}")
+
+    def _schedule_refresh(self, expires_in):
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+        if not self.refresh_fraction or self._closed:
+            return
+        self._refresh_timer = threading.Timer(expires_in * self.refresh_fraction, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _background_refresh(self):
+        try:
+            with self._refresh_lock:
+                self._request_token()
+        except AuthenticationError:
+            # The current token stays until it expires, the next caller then asks again
+            self.logger.warning("Background refresh of the keycloak token failed")
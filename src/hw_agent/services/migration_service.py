@@ -0,0 +1,180 @@
+# src/hw_agent/services/migration_service.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from itertools import chain, islice
+from typing import Iterator, List, Optional
+
+from hw_agent.core.singleton_meta import SingletonMeta
+from hw_agent.dependencies import get_setting_service
+from hw_agent.exceptions.custom_exceptions import RepositoryMigrationInProgressError
+from hw_agent.models.connection_config_models import ConnectionConfigRead
+from hw_agent.models.migration_models import RepositoryMigrationProgress, RepositoryMigrationReport, RepositoryMigrationRequest
+from hw_agent.repositories.base_repository import BaseRepository
+from hw_agent.repositories.repository_factory import RepositoryFactory
+from hw_agent.utils.logger import get_logger
+
+# Compared and hashed: the timestamps are not, records written before they existed have none
+_COMPARED_FIELDS = {'config_id', 'metadata', 'orchestrator_type', 'connection_info'}
+
+
+def configuration_digest(configuration: ConnectionConfigRead) -> bytes:
+    canonical = json.dumps(configuration.model_dump(mode='json', include=_COMPARED_FIELDS), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).digest()
+
+
+def _batches(configurations: Iterator[ConnectionConfigRead], batch_size: int) -> Iterator[List[ConnectionConfigRead]]:
+    while batch := list(islice(configurations, batch_size)):
+        yield batch
+
+
+class RepositoryMigrationService(metaclass=SingletonMeta):
+    """
+    Copies the configurations of one repository type into another while the agent keeps
+    serving from the source.
+
+    The copy streams the source in config_id order, `batch_size` configurations at a time, and
+    records the last config_id written in a progress file: an interrupted migration continues
+    after it. Verification passes then walk both repositories side by side, again batch by
+    batch, copying configurations that changed or were added in the source meanwhile and
+    deleting the ones removed from it. The migration is verified once a pass finds both
+    repositories identical, by count and by hash, while the source did not change.
+
+    Running a completed migration again only does the verification: it is the cheap catch-up
+    to run right before switching REPOSITORY_TYPE to the target.
+    """
+
+    def __init__(self):
+        self.logger = get_logger(self.__class__.__name__)
+        self.progress_dir = get_setting_service().get('migration_progress_dir', 'data')
+        self._lock = threading.Lock()
+
+    def migrate(self, request: RepositoryMigrationRequest) -> RepositoryMigrationReport:
+        if not self._lock.acquire(blocking=False):
+            raise RepositoryMigrationInProgressError("A repository migration is already running, wait for it to finish.")
+        try:
+            source = RepositoryFactory.create_repository(request.source)
+            try:
+                target = RepositoryFactory.create_repository(request.target)
+                try:
+                    return self._migrate(request, source, target)
+                finally:
+                    target.close()
+            finally:
+                source.close()
+        finally:
+            self._lock.release()
+
+    def progress_file(self, source: str, target: str) -> str:
+        return os.path.join(self.progress_dir, f'migration-{source}-to-{target}.json')
+
+    def _migrate(self, request: RepositoryMigrationRequest, source: BaseRepository, target: BaseRepository) -> RepositoryMigrationReport:
+        start = time.perf_counter()
+        progress_file = self.progress_file(request.source, request.target)
+        progress = self._load_progress(progress_file) if request.resume else None
+        if progress is None:
+            progress = RepositoryMigrationProgress(source=request.source, target=request.target)
+        report = RepositoryMigrationReport(source=request.source, target=request.target)
+
+        if progress.phase == 'copy':
+            report.resumed_after = progress.last_config_id
+            for batch in _batches(source.iter_configurations(after_config_id=progress.last_config_id), request.batch_size):
+                target.restore_configurations(batch)
+                progress.last_config_id = batch[-1].config_id
+                progress.copied += len(batch)
+                self._save_progress(progress_file, progress)
+            progress.phase = 'verify'
+            self._save_progress(progress_file, progress)
+        report.copied = progress.copied
+
+        for _ in range(request.max_rounds):
+            generation = source.get_generation()
+            differences = self._verify(source, target, request.batch_size, report)
+            report.rounds += 1
+            report.verified = differences == 0 and source.get_generation() == generation
+            if report.verified:
+                break
+
+        if report.verified:
+            progress.phase = 'completed'
+            self._save_progress(progress_file, progress)
+        report.duration_seconds = time.perf_counter() - start
+        self.logger.info(
+            f"Migration from {request.source} to {request.target}: {report.copied} copied, {report.updated} updated, "
+            f"{report.deleted} deleted, verified: {report.verified} after {report.rounds} round(s)"
+        )
+        return report
+
+    def _verify(self, source: BaseRepository, target: BaseRepository, batch_size: int, report: RepositoryMigrationReport) -> int:
+        """
+        Walks one batch of the source at a time with the target configurations of the same
+        config_id range, fixing the target where they differ. Returns the differences found;
+        the counts and hashes in the report are the ones of this pass.
+
+        The target is read by a single iteration for the whole pass: starting one per batch
+        costs a sort of the whole store each time for the YAML and journal repositories.
+        Fixes only touch config_ids the iteration has already passed.
+        """
+        source_hash, target_hash = hashlib.sha256(), hashlib.sha256()
+        source_count = target_count = differences = 0
+        target_configurations = target.iter_configurations()
+        pending: Optional[ConnectionConfigRead] = next(target_configurations, None)
+
+        for batch in _batches(source.iter_configurations(), batch_size):
+            batch_last = batch[-1].config_id
+            target_digests = {}
+            while pending is not None and pending.config_id <= batch_last:
+                target_digests[pending.config_id] = digest = configuration_digest(pending)
+                target_hash.update(digest)
+                pending = next(target_configurations, None)
+            target_count += len(target_digests)
+            changed = []
+            for configuration in batch:
+                digest = configuration_digest(configuration)
+                source_hash.update(digest)
+                if target_digests.pop(configuration.config_id, None) != digest:
+                    changed.append(configuration)
+            # Only the changed configurations and the extra ones of this range are written
+            if changed:
+                target.restore_configurations(changed)
+            differences += self._delete_extra(target, target_digests, report) + len(changed)
+            report.updated += len(changed)
+            source_count += len(batch)
+
+        # Target configurations after the last one of the source
+        remaining = target_configurations if pending is None else chain([pending], target_configurations)
+        for batch in _batches(remaining, batch_size):
+            extra = {configuration.config_id: configuration_digest(configuration) for configuration in batch}
+            for digest in extra.values():
+                target_hash.update(digest)
+            target_count += len(extra)
+            differences += self._delete_extra(target, extra, report)
+
+        report.source_count, report.target_count = source_count, target_count
+        report.source_hash, report.target_hash = source_hash.hexdigest(), target_hash.hexdigest()
+        return differences
+
+    def _delete_extra(self, target: BaseRepository, extra: dict, report: RepositoryMigrationReport) -> int:
+        if extra:
+            target.delete_configurations(list(extra))
+        report.deleted += len(extra)
+        return len(extra)
+
+    def _load_progress(self, progress_file: str) -> Optional[RepositoryMigrationProgress]:
+        if not os.path.exists(progress_file):
+            return None
+        with open(progress_file, 'r') as file:
+            return RepositoryMigrationProgress.model_validate_json(file.read())
+
+    def _save_progress(self, progress_file: str, progress: RepositoryMigrationProgress):
+        # Replaced atomically: an interruption leaves the previous progress, never half of it
+        os.makedirs(os.path.dirname(progress_file) or '.', exist_ok=True)
+        temporary_file = f'{progress_file}.tmp'
+        with open(temporary_file, 'w') as file:
+            file.write(progress.model_dump_json())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_file, progress_file)
@@ -1,14 +1,17 @@
 # src/hw_agent/services/repository_service.py
 
+from typing import Any, Iterable, Iterator, List
+from pydantic import ValidationError
 from hw_agent.core.singleton_meta import SingletonMeta
-from hw_agent.exceptions.custom_exceptions import ConfigurationNotFoundError
+from hw_agent.exceptions.custom_exceptions import ConfigurationNotFoundError, ConnectionConfigurationError
 from hw_agent.repositories.repository_factory import RepositoryFactory
+from hw_agent.services.configuration_cache import ConfigurationCache
 from hw_agent.dependencies import get_setting_service
 from hw_agent.utils.helpers import generate_unique_id
-from hw_agent.models.connection_config_models import ConnectionConfigCreate, ConnectionConfigRead
+from hw_agent.models.connection_config_models import BulkImportItemResult, BulkImportResult, ConfigurationCacheStatistics, ConnectionConfigCreate, ConnectionConfigPage, ConnectionConfigQuery, ConnectionConfigRead, DuplicateTargetGroup
 from hw_agent.core.plugin_manager import PluginManager
 
-class RepositoryService:
+class RepositoryService(metaclass=SingletonMeta):
     def __init__(self):
 
         settings = get_setting_service()
@@ -16,9 +19,26 @@ class RepositoryService:
         # Get the repository type from the settings, by default use YAML
         repository_type = settings.get('repository_type', 'yaml')            
         self.repository = RepositoryFactory.create_repository(repository_type)
+        # Same storage, for the async routers
+        self.async_repository = RepositoryFactory.create_async_repository(repository_type, self.repository)
+
+        # Validated configurations, shared by the broker and the routers (0 disables the cache)
+        self.configuration_cache = ConfigurationCache(int(settings.get('configuration_cache_size', 1024)))
 
     def save_configuration(self, connection_info: ConnectionConfigCreate):
-        
+        config_id = self._validate_new_configuration(connection_info)
+        self.repository.save_configuration(config_id, connection_info)
+        self.configuration_cache.invalidate(config_id)
+        return config_id
+
+    async def save_configuration_async(self, connection_info: ConnectionConfigCreate):
+        config_id = self._validate_new_configuration(connection_info)
+        await self.async_repository.save_configuration(config_id, connection_info)
+        self.configuration_cache.invalidate(config_id)
+        return config_id
+
+    def _validate_new_configuration(self, connection_info: ConnectionConfigCreate) -> str:
+        """Validates a configuration to be stored and returns its new config_id."""
         # Check if Connection Info is provided
         if connection_info is None:
             raise ValueError("Connection info is required.")
@@ -28,21 +48,106 @@ class RepositoryService:
             plugin_manager = PluginManager()
             plugin_manager.validate_connection_info(connection_info.connection_info, connection_info.orchestrator_type)
         
-        config_id = generate_unique_id()
-        self.repository.save_configuration(config_id, connection_info)
-        return config_id
+        return generate_unique_id()
+
+    def import_configurations(self, documents: Iterable[Any], all_or_nothing: bool = False) -> BulkImportResult:
+        """
+        Validates every document first, then stores the valid ones with a single repository
+        write. A document that could not be parsed is passed as the exception raised by the
+        parser. With all_or_nothing, nothing is stored if any document is invalid.
+        """
+        plugin_manager = PluginManager()
+        results, valid_configs = [], {}
+        for index, document in enumerate(documents):
+            try:
+                if isinstance(document, Exception):
+                    raise document
+                if not isinstance(document, dict):
+                    raise ValueError("Invalid configuration. Expected a dictionary")
+                connection_config = ConnectionConfigCreate(**document)
+                plugin_manager.validate_connection_info(connection_config.connection_info, connection_config.orchestrator_type)
+            except Exception as e:
+                results.append(BulkImportItemResult(index=index, status='invalid', errors=self._describe_errors(e)))
+                continue
+            config_id = generate_unique_id()
+            valid_configs[config_id] = connection_config
+            results.append(BulkImportItemResult(index=index, status='created', config_id=config_id))
+
+        invalid = len(results) - len(valid_configs)
+        if all_or_nothing and invalid:
+            for result in results:
+                if result.status == 'created':
+                    result.status, result.config_id = 'skipped', None
+            valid_configs = {}
+        elif valid_configs:
+            self.repository.save_configurations(valid_configs)
+            for config_id in valid_configs:
+                self.configuration_cache.invalidate(config_id)
+
+        return BulkImportResult(
+            created=len(valid_configs),
+            invalid=invalid,
+            skipped=len(results) - len(valid_configs) - invalid,
+            items=results,
+        )
+
+    def _describe_errors(self, exception: Exception) -> list:
+        if isinstance(exception, ValidationError):
+            return [{"location": list(error["loc"]), "message": error["msg"]} for error in exception.errors()]
+        if isinstance(exception, ConnectionConfigurationError) and exception.errors:
+            return [{"location": ["connection_info", *error["location"]], "message": error["message"]} for error in exception.errors]
+        return [{"location": [], "message": str(exception)}]
+
+    def iter_configurations(self) -> Iterator[ConnectionConfigRead]:
+        return self.repository.iter_configurations()
 
     def get_configuration(self, config_id) -> ConnectionConfigRead:
+        # The generation is read first: a configuration read after a concurrent write is
+        # then cached under the previous generation and dropped on the next lookup
+        generation = self.repository.get_generation()
+        self.configuration_cache.sync(generation, self.repository.get_changes_since)
+        config = self.configuration_cache.get(config_id)
+        if config:
+            return config
+
         config = self.repository.get_configuration(config_id)
         if not config:
             raise ConfigurationNotFoundError(f"Configuration with ID {config_id} not found.")
+        self.configuration_cache.put(config_id, config, generation)
         return config
+
+    async def get_configuration_async(self, config_id) -> ConnectionConfigRead:
+        generation = await self.async_repository.get_generation()
+        self.configuration_cache.sync(generation, self.repository.get_changes_since)
+        config = self.configuration_cache.get(config_id)
+        if config:
+            return config
+
+        config = await self.async_repository.get_configuration(config_id)
+        if not config:
+            raise ConfigurationNotFoundError(f"Configuration with ID {config_id} not found.")
+        self.configuration_cache.put(config_id, config, generation)
+        return config
+
+    def list_duplicate_targets(self) -> List[DuplicateTargetGroup]:
+        return self.repository.list_duplicate_targets()
+
+    def get_cache_statistics(self) -> ConfigurationCacheStatistics:
+        return self.configuration_cache.get_statistics()
     
     def get_configurations(self):
         return self.repository.get_configurations()
 
+    def list_configurations(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        return self.repository.list_configurations(query)
+
+    async def list_configurations_async(self, query: ConnectionConfigQuery) -> ConnectionConfigPage:
+        return await self.async_repository.list_configurations(query)
+
     def clear_all_configurations(self):
-        return self.repository.clear_all_configurations()
+        cleared = self.repository.clear_all_configurations()
+        self.configuration_cache.invalidate()
+        return cleared
     
     
     def delete_configuration(self, config_id):
@@ -52,4 +157,24 @@ class RepositoryService:
         if not config:
             raise ConfigurationNotFoundError(f"Configuration with ID {config_id} not found.")
         
-        return self.repository.delete_configuration(config_id)
\ No newline at end of file
+        deleted = self.repository.delete_configuration(config_id)
+        self.configuration_cache.invalidate(config_id)
+        return deleted
+
+    async def delete_configuration_async(self, config_id):
+        config = await self.async_repository.get_configuration(config_id)
+        if not config:
+            raise ConfigurationNotFoundError(f"Configuration with ID {config_id} not found.")
+
+        deleted = await self.async_repository.delete_configuration(config_id)
+        self.configuration_cache.invalidate(config_id)
+        return deleted
+
+    async def clear_all_configurations_async(self):
+        cleared = await self.async_repository.clear_all_configurations()
+        self.configuration_cache.invalidate()
+        return cleared
+
+    async def close_async(self):
+        """Closes the connections of the async repository, on application shutdown."""
+        await self.async_repository.close()
@@ -2,16 +2,21 @@
 
 import requests
 
+from hw_agent.dependencies import get_http_session, get_setting_service
 from hw_agent.exceptions.custom_exceptions import APIRequestError
+from hw_agent.utils.http_session import http_timeout
 from hw_agent.utils.logger import get_logger
 
 
 class APIRequest:
     """
-    Utility class for making API requests.
+    Utility class for making API requests, through the shared session of the agent unless
+    another one is given.
     """
-    def __init__(self, base_url):
+    def __init__(self, base_url, session: requests.Session = None, timeout=None):
         self.base_url = base_url
+        self.session = session or get_http_session()
+        self.timeout = timeout or http_timeout(get_setting_service())
         self.logger = get_logger(self.__class__.__name__)
 
     def make_request(self, method, endpoint, headers=None, **kwargs):
@@ -20,11 +25,11 @@ class APIRequest:
         headers.setdefault("User-Agent", "Mozilla/5.0")
 
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=headers,
-                timeout=kwargs.get('timeout', 10),
+                timeout=kwargs.get('timeout', self.timeout),
                 params=kwargs.get('params'),
                 data=kwargs.get('data'),
                 json=kwargs.get('json')
@@ -39,7 +44,7 @@ class APIRequest:
         except requests.exceptions.HTTPError as http_err:
             error_msg = f"HTTP error occurred: {response.status_code} - {response.text}"
             self.logger.error(error_msg)
-            raise APIRequestError(error_msg) from http_err
+            raise APIRequestError(error_msg, status_code=response.status_code) from http_err
 
         except requests.exceptions.Timeout as timeout_err:
             error_msg = "The request timed out"
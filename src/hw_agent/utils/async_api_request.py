@@ -0,0 +1,124 @@
+# src/hw_agent/utils/async_api_request.py
+
+import asyncio
+import random
+
+import httpx
+
+from hw_agent.dependencies import get_async_http_client, get_setting_service
+from hw_agent.exceptions.custom_exceptions import APIRequestError
+from hw_agent.utils.http_session import RETRY_STATUSES
+from hw_agent.utils.logger import get_logger
+
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS', 'TRACE'})
+
+
+class AsyncAPIRequest:
+    """
+    Async counterpart of APIRequest, through the shared async client of the agent unless
+    another one is given. Failed calls are retried like the synchronous session does:
+    connection errors for every method, read errors and RETRY_STATUSES for idempotent ones,
+    waiting an exponential backoff with jitter, or the Retry-After of the server.
+    """
+    def __init__(self, base_url, client: httpx.AsyncClient = None):
+        settings = get_setting_service()
+        self.base_url = base_url
+        self._client = client
+        self.retries = int(settings.get('http_retries', 3))
+        self.backoff_factor = float(settings.get('http_backoff_factor', 0.5))
+        self.backoff_jitter = float(settings.get('http_backoff_jitter', 0.5))
+        self.backoff_max = float(settings.get('http_backoff_max_seconds', 10))
+        self.logger = get_logger(self.__class__.__name__)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Looked up on every call: the shared client is recreated after being closed
+        return self._client or get_async_http_client()
+
+    async def make_request(self, method, endpoint, headers=None, **kwargs):
+        response = await self.send(method, endpoint, headers, **kwargs)
+        if 'application/json' not in response.headers.get('Content-Type', ''):
+            return response.content
+        try:
+            return response.json()
+        except ValueError as err:
+            error_msg = f"An unexpected error occurred: {err}"
+            self.logger.error(error_msg)
+            raise APIRequestError(error_msg) from err
+
+    async def send(self, method, endpoint, headers=None, **kwargs) -> httpx.Response:
+        """
+        Sends the request and returns the response itself, for callers that need its headers.
+        A 304 answer to a conditional request is returned like a success.
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = headers or {}
+        headers.setdefault("User-Agent", "Mozilla/5.0")
+        method = method.upper()
+
+        try:
+            response = await self._send_with_retries(method, url, headers, kwargs)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+
+        except httpx.HTTPStatusError as http_err:
+            error_msg = f"HTTP error occurred: {response.status_code} - {response.text}"
+            self.logger.error(error_msg)
+            raise APIRequestError(error_msg, status_code=response.status_code) from http_err
+
+        except httpx.TimeoutException as timeout_err:
+            error_msg = "The request timed out"
+            self.logger.error(error_msg)
+            raise APIRequestError(error_msg) from timeout_err
+
+        except httpx.HTTPError as req_err:
+            error_msg = f"Request exception occurred: {req_err}"
+            self.logger.error(error_msg)
+            raise APIRequestError(error_msg) from req_err
+
+        except Exception as err:
+            error_msg = f"An unexpected error occurred: {err}"
+            self.logger.error(error_msg)
+            raise APIRequestError(error_msg) from err
+
+    async def _send_with_retries(self, method, url, headers, kwargs) -> httpx.Response:
+        idempotent = method in _IDEMPOTENT_METHODS
+        for retry in range(self.retries + 1):
+            last_attempt = retry == self.retries
+            try:
+                response = await self.client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=kwargs.get('params'),
+                    data=kwargs.get('data'),
+                    json=kwargs.get('json'),
+                    **({'timeout': kwargs['timeout']} if 'timeout' in kwargs else {}),
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # Nothing reached the server, safe to send again whatever the method
+                if last_attempt:
+                    raise
+                await asyncio.sleep(self._backoff(retry + 1))
+                continue
+            except (httpx.ReadError, httpx.ReadTimeout, httpx.RemoteProtocolError):
+                if last_attempt or not idempotent:
+                    raise
+                await asyncio.sleep(self._backoff(retry + 1))
+                continue
+
+            if last_attempt or not idempotent or response.status_code not in RETRY_STATUSES:
+                return response
+            await response.aclose()
+            await asyncio.sleep(self._retry_after(response) or self._backoff(retry + 1))
+
+    def _backoff(self, retry: int) -> float:
+        delay = self.backoff_factor * 2 ** (retry - 1) + random.uniform(0, self.backoff_jitter)
+        return min(delay, self.backoff_max)
+
+    def _retry_after(self, response: httpx.Response):
+        try:
+            return min(float(response.headers['Retry-After']), self.backoff_max)
+        except (KeyError, ValueError):
+            return None
@@ -0,0 +1,73 @@
+# src/hw_agent/utils/http_session.py
+
+from typing import Tuple
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from hw_agent.services.settings_service import SettingsService
+
+try:
+    import h2
+except ImportError:
+    # Optional: without it the async client speaks HTTP/1.1 only
+    h2 = None
+
+# Transient answers of the catalogue, Keycloak or a proxy in front of them
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_http_session(settings: SettingsService) -> requests.Session:
+    """
+    Session with a pool of keep-alive connections per host, shared by every client of the
+    agent so that consecutive calls reuse the same TCP and TLS connection.
+
+    Failed calls are retried with exponential backoff plus a random jitter. Connection errors
+    are retried for every method, since nothing reached the server. Read errors and the
+    statuses of RETRY_STATUSES are only retried for idempotent methods: a POST that may have
+    been processed is never sent twice. A Retry-After header from the server is honoured.
+    """
+    retry = Retry(
+        total=int(settings.get('http_retries', 3)),
+        backoff_factor=float(settings.get('http_backoff_factor', 0.5)),
+        backoff_jitter=float(settings.get('http_backoff_jitter', 0.5)),
+        backoff_max=float(settings.get('http_backoff_max_seconds', 10)),
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        # The last response is returned, for the caller to report its status and body
+        raise_on_status=False,
+    )
+    pool_size = int(settings.get('http_pool_size', 10))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def http_timeout(settings: SettingsService) -> Tuple[float, float]:
+    """(connect, read) timeouts, in seconds, of every call made with the shared session."""
+    return (
+        float(settings.get('http_connect_timeout_seconds', 5)),
+        float(settings.get('http_read_timeout_seconds', 10)),
+    )
+
+
+def create_async_http_client(settings: SettingsService) -> httpx.AsyncClient:
+    """
+    Async client for the event loop of the API: up to HTTP_ASYNC_MAX_CONNECTIONS pooled
+    keep-alive connections and, when the h2 package is installed and the server agrees on it
+    during the TLS handshake, HTTP/2, which multiplexes concurrent requests on one connection.
+    Retries are done by AsyncAPIRequest, with the same settings as the synchronous session.
+    """
+    connect_timeout, read_timeout = http_timeout(settings)
+    max_connections = int(settings.get('http_async_max_connections', 100))
+    http2 = str(settings.get('http2', 'auto')).lower()
+    return httpx.AsyncClient(
+        http2=h2 is not None if http2 == 'auto' else http2 == 'true',
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+    )
@@ -0,0 +1,29 @@
+# src/hw_agent/utils/rate_limiter.py
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """
+    Spaces the start of operations by at least 1 / rate_per_second seconds, whichever
+    coroutine asks, so that a burst of concurrent calls never exceeds the rate. A rate of None
+    does not limit.
+    """
+
+    def __init__(self, rate_per_second: Optional[float]):
+        self.interval = 1 / rate_per_second if rate_per_second else 0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        # Each caller reserves the next slot under the lock and waits for it outside
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
@@ -1,18 +1,36 @@
 # src/hw_agent/main.py
 
 import argparse
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import uvicorn
 from hw_agent.routers.configuration_router import router as config_router
 from hw_agent.routers.computational_data_router import router as computational_data_router
 from hw_agent.routers.plugin_router import router as plugin_router
 from hw_agent.routers.catalogue_router import router as catalogue_router 
+from hw_agent.routers.admin_router import router as admin_router
 from hw_agent.exceptions.error_handling import add_exception_handlers
+from hw_agent.services.catalogue_service import CatalogueService
+from hw_agent.services.repository_service import RepositoryService
+from hw_agent.dependencies import close_async_http_client
 from fastapi.middleware.cors import CORSMiddleware
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Connections of the async repository run in their own threads
+    await RepositoryService().close_async()
+    # Not created when the catalogue was never used, its settings may be missing
+    catalogue_service = CatalogueService.existing_instance()
+    if catalogue_service is not None:
+        catalogue_service.close()
+    # Pooled connections of the catalogue client belong to this event loop
+    await close_async_http_client()
+
+
 # Create the FastAPI app instance
-app = FastAPI(description="HW Agent Plugins API", version="1.0.0", title="HW Agent Plugins API")
+app = FastAPI(description="HW Agent Plugins API", version="1.0.0", title="HW Agent Plugins API", lifespan=lifespan)
 
 # Add custom exception handlers
 add_exception_handlers(app)
@@ -29,6 +47,7 @@ app.include_router(config_router)
 app.include_router(computational_data_router)
 app.include_router(plugin_router)
 app.include_router(catalogue_router)
+app.include_router(admin_router)
 
 
 def main():
@@ -0,0 +1,35 @@
+# src/migrate.py
+
+import argparse
+import sys
+from hw_agent.models.migration_models import RepositoryMigrationRequest
+from hw_agent.services.migration_service import RepositoryMigrationService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Copy the stored configurations from one repository type to another.")
+    parser.add_argument("--source", required=True, help="Repository type to copy from, e.g. 'yaml'.")
+    parser.add_argument("--target", required=True, help="Repository type to copy to, e.g. 'sqlite'.")
+    parser.add_argument("--batch-size", type=int, default=500, help="Configurations read and written at once.")
+    parser.add_argument("--max-rounds", type=int, default=3, help="Verification passes before giving up on a source that keeps changing.")
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the progress of a previous run and copy every configuration again."
+    )
+    args = parser.parse_args()
+
+    report = RepositoryMigrationService().migrate(RepositoryMigrationRequest(
+        source=args.source,
+        target=args.target,
+        batch_size=args.batch_size,
+        max_rounds=args.max_rounds,
+        resume=not args.restart,
+    ))
+    print(report.model_dump_json(indent=2))
+    # Non-zero when the repositories could not be verified identical
+    sys.exit(0 if report.verified else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from typing import Optional
+
+import pytest
+
+from hw_agent.core.singleton_meta import SingletonMeta
+from hw_agent.models.connection_config_models import ConnectionConfigCreate
+from hw_agent.repositories.sqlite_repository import SQLiteRepository
+from hw_agent.services.repository_service import RepositoryService
+
+# Valid for the connection schema of the hpc plugin, so the services accept it too
+HPC_CONNECTION_INFO = {"ssh_credentials": {"login_node": "login.example.org", "user": "ops", "private_key": "a2V5"}}
+
+
+def build_configuration(name: str = "cluster", orchestrator_type: str = "hpc",
+                        connection_info: Optional[dict] = None) -> ConnectionConfigCreate:
+    return ConnectionConfigCreate(
+        metadata={"name": name, "description": "test", "contact": "ops@example.org"},
+        orchestrator_type=orchestrator_type,
+        connection_info=HPC_CONNECTION_INFO if connection_info is None else connection_info,
+    )
+
+
+@pytest.fixture
+def forget_singleton():
+    """Forgets the instance of a singleton class, right away and again after the test."""
+    forgotten = []
+
+    def forget(singleton_class: type):
+        SingletonMeta._instances.pop(singleton_class, None)
+        forgotten.append(singleton_class)
+
+    yield forget
+    for singleton_class in forgotten:
+        SingletonMeta._instances.pop(singleton_class, None)
+
+
+@pytest.fixture
+def repository_files(tmp_path, monkeypatch):
+    """Points every repository type at its own file in tmp_path."""
+    monkeypatch.setenv("SQLITE_DB_FILE", str(tmp_path / "configurations.db"))
+    monkeypatch.setenv("YAML_CONFIG_FILE", str(tmp_path / "configurations.yaml"))
+    monkeypatch.setenv("JOURNAL_FILE", str(tmp_path / "configurations.jsonl"))
+    return tmp_path
+
+
+@pytest.fixture
+def sqlite_repository(repository_files):
+    repository = SQLiteRepository()
+    yield repository
+    repository.close()
+
+
+@pytest.fixture
+def create_repository_service(repository_files, monkeypatch, forget_singleton):
+    """
+    Creates a new RepositoryService of the given type, the settings given as keyword arguments.
+    RepositoryService is a singleton, so every call replaces the previous instance.
+    """
+    def create(repository_type: str = "sqlite", **settings) -> RepositoryService:
+        monkeypatch.setenv("REPOSITORY_TYPE", repository_type)
+        for key, value in settings.items():
+            monkeypatch.setenv(key.upper(), str(value))
+        forget_singleton(RepositoryService)
+        return RepositoryService()
+
+    return create
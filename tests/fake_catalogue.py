@@ -0,0 +1,104 @@
+import json
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeCatalogue(ThreadingHTTPServer):
+    """
+    Local stand-in for the Metadata Catalogue and Keycloak. Answers with the queued statuses
+    first, then 200, after `delay` seconds, and records every request. Assets whose name is in
+    `rejected_names` are answered with 422, requests with a token in `revoked_tokens` with 401.
+    Tokens are 'token-1', 'token-2'... valid for `expires_in` seconds. A GET with offset and
+    limit answers with that page of `assets`, a GET of an asset id with the asset and its
+    ETag, or with 304 if the If-None-Match of the request is still its ETag.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeCatalogueHandler)
+        self.statuses = []
+        self.requests = []
+        self.rejected_names = set()
+        self.delay = 0
+        self.tokens_issued = 0
+        self.expires_in = 300
+        self.revoked_tokens = set()
+        self.assets = []
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeCatalogueHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._answer()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._answer(body)
+
+    def _answer(self, body=b""):
+        server = self.server
+        with server.lock:
+            # The client port identifies the connection the request came on
+            server.requests.append((self.command, self.path, self.client_address[1]))
+            status = server.statuses.pop(0) if server.statuses else 200
+            if self.path.endswith("/openid-connect/token"):
+                server.tokens_issued += 1
+            token = f"token-{server.tokens_issued}"
+            if self.headers.get("Authorization", "").removeprefix("Bearer ") in server.revoked_tokens:
+                status = 401
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.delay)
+        if body.startswith(b"{") and json.loads(body).get("name") in server.rejected_names:
+            status = 422
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        asset = next((asset for asset in server.assets if url.path == f"/computational_assets/v1/{asset['id']}"), None)
+        etag = None
+        if "offset" in query:
+            offset, limit = int(query["offset"][0]), int(query["limit"][0])
+            answer = json.dumps(server.assets[offset:offset + limit]).encode()
+        elif asset is not None:
+            answer = json.dumps(asset).encode()
+            etag = f'"{zlib.crc32(answer)}"'
+            if status == 200 and self.headers.get("If-None-Match") == etag:
+                status, answer = 304, b""
+        elif url.path.startswith("/computational_assets/v1/") and server.assets:
+            status = 404
+            answer = json.dumps({"detail": "Not found"}).encode()
+        else:
+            answer = json.dumps({"path": self.path, "access_token": token, "expires_in": server.expires_in}).encode()
+        with server.lock:
+            server.in_flight -= 1
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(answer)))
+        self.end_headers()
+        self.wfile.write(answer)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_fake_catalogue():
+    server = FakeCatalogue()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from hw_agent.exceptions.custom_exceptions import ConfigurationNotFoundError
+from hw_agent.models.connection_config_models import ConnectionConfigQuery
+from hw_agent.repositories.async_base_repository import ThreadedAsyncRepository
+from hw_agent.repositories.async_sqlite_repository import AsyncSQLiteRepository
+from tests.conftest import build_configuration
+
+
+@pytest.fixture
+def repositories(sqlite_repository, monkeypatch):
+    monkeypatch.setenv("SQLITE_ASYNC_READERS", "2")
+    return sqlite_repository, AsyncSQLiteRepository(sqlite_repository)
+
+
+def run(async_repository, coroutine):
+    async def run_and_close():
+        try:
+            return await coroutine
+        finally:
+            await async_repository.close()
+    return asyncio.run(run_and_close())
+
+
+class TestAsyncSQLiteRepository:
+
+    def test_writes_are_shared_with_the_synchronous_repository(self, repositories):
+        repository, async_repository = repositories
+
+        async def scenario():
+            await async_repository.save_configuration("config-1", build_configuration("first"))
+            repository.save_configuration("config-2", build_configuration("second"))
+            return (
+                await async_repository.get_configuration("config-2"),
+                await async_repository.get_generation(),
+            )
+
+        configuration, generation = run(async_repository, scenario())
+        assert configuration.metadata.name == "second"
+        assert repository.get_configuration("config-1").metadata.name == "first"
+        assert generation == repository.get_generation() == 2
+
+    def test_concurrent_reads_and_listing(self, repositories):
+        _, async_repository = repositories
+
+        async def scenario():
+            await async_repository.save_configurations(
+                {f"config-{index:02d}": build_configuration(f"cluster-{index:02d}") for index in range(30)}
+            )
+            configurations = await asyncio.gather(
+                *(async_repository.get_configuration(f"config-{index:02d}") for index in range(30))
+            )
+            page = await async_repository.list_configurations(ConnectionConfigQuery(sort_by="name", limit=10))
+            return configurations, page
+
+        configurations, page = run(async_repository, scenario())
+        assert [configuration.metadata.name for configuration in configurations] == [f"cluster-{index:02d}" for index in range(30)]
+        assert [item.config_id for item in page.items] == [f"config-{index:02d}" for index in range(10)]
+        assert page.next_cursor
+
+    def test_delete_and_clear(self, repositories):
+        repository, async_repository = repositories
+
+        async def scenario():
+            await async_repository.save_configurations({"a": build_configuration("a"), "b": build_configuration("b")})
+            await async_repository.delete_configuration("a")
+            remaining = await async_repository.get_configuration("a"), await async_repository.get_configuration("b")
+            await async_repository.clear_all_configurations()
+            return remaining
+
+        assert run(async_repository, scenario())[0] is None
+        assert repository.get_configurations() == {}
+
+
+    def test_sync_and_async_writes_share_one_writer(self, repositories):
+        repository, async_repository = repositories
+
+        def save_in_thread(index):
+            repository.save_configuration(f"sync-{index}", build_configuration(f"sync-{index}"))
+
+        async def scenario():
+            await asyncio.gather(
+                *(asyncio.to_thread(save_in_thread, index) for index in range(10)),
+                *(async_repository.save_configuration(f"async-{index}", build_configuration(f"async-{index}")) for index in range(10)),
+            )
+            return await async_repository.get_generation()
+
+        assert run(async_repository, scenario()) == 20
+        assert len(repository.get_configurations()) == 20
+
+    def test_repository_outlives_its_event_loop(self, repositories):
+        repository, async_repository = repositories
+
+        async def save_concurrently(prefix):
+            await asyncio.gather(
+                *(async_repository.save_configuration(f"{prefix}-{index}", build_configuration(prefix)) for index in range(5))
+            )
+
+        # Like the repository of the service singleton, used by one event loop after the other
+        run(async_repository, save_concurrently("first"))
+        run(async_repository, save_concurrently("second"))
+
+        assert len(repository.get_configurations()) == 10
+
+
+class TestAsyncRepositoryService:
+
+    def test_sqlite_uses_aiosqlite(self, create_repository_service):
+        service = create_repository_service("sqlite")
+        assert isinstance(service.async_repository, AsyncSQLiteRepository)
+
+        async def scenario():
+            try:
+                config_id = await service.save_configuration_async(build_configuration("first"))
+                first = await service.get_configuration_async(config_id)
+                await service.delete_configuration_async(config_id)
+                with pytest.raises(ConfigurationNotFoundError):
+                    await service.get_configuration_async(config_id)
+                return first
+            finally:
+                await service.close_async()
+
+        assert asyncio.run(scenario()).metadata.name == "first"
+
+    def test_other_types_run_in_threads(self, create_repository_service):
+        service = create_repository_service("journal")
+        assert isinstance(service.async_repository, ThreadedAsyncRepository)
+
+        async def scenario():
+            config_id = await service.save_configuration_async(build_configuration("first"))
+            return await service.get_configuration_async(config_id)
+
+        assert asyncio.run(scenario()).metadata.name == "first"
@@ -0,0 +1,62 @@
+import asyncio
+from types import SimpleNamespace
+
+from hw_agent.plugins.hpc.async_ssh import AsyncSSHCollector, SSHTarget, run_coroutine
+from hw_agent.plugins.hpc.facts_cache import STALENESS_PROBE_COMMAND, SSHFactsCache
+
+
+class TestAsyncSSHCollector:
+
+    def test_collect_many_is_bounded_and_keeps_order(self, mocker):
+        collector = AsyncSSHCollector(max_concurrency=10)
+        state = {"open": 0, "peak": 0}
+
+        async def fake_collect(target, live_inventory):
+            state["open"] += 1
+            state["peak"] = max(state["peak"], state["open"])
+            await asyncio.sleep(0.01)
+            state["open"] -= 1
+            return {"facts": {"host": target.host}, "clusters": None}
+
+        mocker.patch.object(collector, "_collect", side_effect=fake_collect)
+        targets = [SSHTarget(f"login{i}", "user", "secret") for i in range(200)]
+
+        results = run_coroutine(collector.collect_many(targets))
+
+        assert [r["facts"]["host"] for r in results] == [t.host for t in targets]
+        assert state["peak"] == 10
+
+    def test_slow_host_times_out_without_affecting_others(self, mocker):
+        collector = AsyncSSHCollector(host_timeout=0.05)
+
+        async def fake_collect(target, live_inventory):
+            if target.host == "slow":
+                await asyncio.sleep(1)
+            return {"facts": "ok", "clusters": None}
+
+        mocker.patch.object(collector, "_collect", side_effect=fake_collect)
+
+        results = run_coroutine(collector.collect_many([SSHTarget("slow", "u", "p"), SSHTarget("fast", "u", "p")]))
+
+        assert results[0] == {"facts": None, "clusters": None}
+        assert results[1]["facts"] == "ok"
+
+    def test_failed_probe_is_probed_again(self, mocker):
+        collector = AsyncSSHCollector(facts_cache=SSHFactsCache(ttl_seconds=60))
+        outputs = {STALENESS_PROBE_COMMAND: (0, "boot-1\n"), "lscpu": (1, ""), "hostnamectl": (0, "Kernel: 6.1\n")}
+        commands = []
+
+        async def run(command, check):
+            commands.append(command)
+            exit_status, stdout = outputs[command]
+            return SimpleNamespace(exit_status=exit_status, stdout=stdout)
+
+        connection = mocker.Mock(run=run)
+        connection.get_server_host_key.return_value.get_fingerprint.return_value = "SHA256:aaa"
+
+        first = run_coroutine(collector._retrieve_facts(connection, "login1"))
+        run_coroutine(collector._retrieve_facts(connection, "login1"))
+
+        assert first == {"lscpu": None, "hostnamectl": "Kernel: 6.1\n"}
+        assert commands.count("lscpu") == 2
+
@@ -0,0 +1,39 @@
+import pytest
+
+
+def build_document(name: str, port=22) -> dict:
+    return {
+        "metadata": {"name": name, "description": "test", "contact": "ops@example.org"},
+        "orchestrator_type": "slurm",
+        "connection_info": {"host": "login.example.org", "port": port},
+    }
+
+
+@pytest.fixture
+def repository_service(create_repository_service):
+    return create_repository_service("journal")
+
+
+class TestBulkImport:
+
+    def test_valid_documents_are_stored_and_invalid_ones_reported(self, repository_service):
+        result = repository_service.import_configurations([
+            build_document("first"),
+            build_document("second", port="ssh"),
+            ValueError("Invalid JSON"),
+            build_document("third"),
+        ])
+
+        assert (result.created, result.invalid, result.skipped) == (2, 2, 0)
+        assert [item.status for item in result.items] == ["created", "invalid", "invalid", "created"]
+        assert result.items[1].errors == [{"location": ["connection_info", "port"], "message": "'ssh' is not of type 'integer'"}]
+        assert repository_service.get_configuration(result.items[3].config_id).metadata.name == "third"
+
+    def test_all_or_nothing_stores_nothing_on_errors(self, repository_service):
+        result = repository_service.import_configurations(
+            [build_document("first"), {"metadata": {}}], all_or_nothing=True
+        )
+
+        assert (result.created, result.invalid, result.skipped) == (0, 1, 1)
+        assert result.items[0].config_id is None
+        assert list(repository_service.iter_configurations()) == []
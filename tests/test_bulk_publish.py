@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from hw_agent.dependencies import close_async_http_client
+from hw_agent.exceptions.custom_exceptions import ConfigurationNotFoundError
+from hw_agent.models.catalogue_models import BulkPublishRequest
+from hw_agent.models.computational_asset import ComputationalAsset
+from hw_agent.services.catalogue_service import CatalogueService
+from tests.fake_catalogue import serve_fake_catalogue
+
+
+@pytest.fixture
+def catalogue(monkeypatch, forget_singleton):
+    with serve_fake_catalogue() as server:
+        monkeypatch.setenv("AIOD_API_BASE_URL", server.base_url)
+        monkeypatch.setenv("AIOD_KEYCLOAK_AUTH_URL", server.base_url)
+        monkeypatch.setenv("AIOD_KEYCLOAK_REALM", "aiod")
+        forget_singleton(CatalogueService)
+        yield server
+
+
+def publish(publish_request: BulkPublishRequest):
+    async def publish_and_close():
+        try:
+            return await CatalogueService().publish_computational_assets(publish_request)
+        finally:
+            await close_async_http_client()
+    return asyncio.run(publish_and_close())
+
+
+def asset_posts(catalogue):
+    return [request for request in catalogue.requests if request[1] == "/computational_assets/v1"]
+
+
+class TestBulkPublish:
+
+    def test_concurrency_is_bounded_and_the_token_reused(self, catalogue):
+        catalogue.delay = 0.02
+        assets = [ComputationalAsset(name=f"cluster-{index}") for index in range(12)]
+
+        result = publish(BulkPublishRequest(assets=assets, concurrency=3))
+
+        assert (result.published, result.failed) == (12, 0)
+        assert [item.index for item in result.items] == list(range(12))
+        assert len(asset_posts(catalogue)) == 12
+        assert catalogue.max_in_flight <= 3
+        assert [path for _, path, _ in catalogue.requests].count("/realms/aiod/protocol/openid-connect/token") == 1
+
+    def test_rate_is_capped(self, catalogue):
+        result = publish(BulkPublishRequest(assets=[ComputationalAsset(name=f"cluster-{index}") for index in range(5)], rate_per_second=25))
+
+        assert result.published == 5
+        # Five requests spaced by 40 ms
+        assert result.duration_seconds >= 0.16
+
+    def test_items_fail_independently(self, catalogue, mocker):
+        catalogue.rejected_names = {"rejected"}
+
+        def collect(config_id):
+            if config_id == "unknown":
+                raise ConfigurationNotFoundError("Configuration not found")
+            return ComputationalAsset(name=f"collected-{config_id}")
+
+        mocker.patch.object(CatalogueService, "_collect_asset", side_effect=collect)
+        result = publish(BulkPublishRequest(
+            assets=[ComputationalAsset(name="rejected"), ComputationalAsset(name="accepted")],
+            config_ids=["config-1", "unknown"],
+        ))
+
+        assert (result.published, result.failed) == (2, 2)
+        assert [(item.status, item.stage, item.config_id) for item in result.items] == [
+            ("failed", "publish", None),
+            ("published", None, None),
+            ("published", None, "config-1"),
+            ("failed", "collect", "unknown"),
+        ]
+        assert "422" in result.items[0].error
+        assert len(asset_posts(catalogue)) == 3
+
+    def test_requires_items(self):
+        with pytest.raises(ValueError):
+            BulkPublishRequest()
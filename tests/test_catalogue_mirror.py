@@ -0,0 +1,133 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from hw_agent.dependencies import close_async_http_client
+from hw_agent.exceptions.custom_exceptions import APIRequestError
+from hw_agent.services.aiod_metadata_client import AsyncAIODMetadataClient
+from hw_agent.services.catalogue_mirror import CatalogueMirror
+from hw_agent.services.catalogue_service import CatalogueService
+from tests.fake_catalogue import serve_fake_catalogue
+
+
+@pytest.fixture
+def catalogue(monkeypatch):
+    with serve_fake_catalogue() as server:
+        server.assets = [{"id": index, "name": f"cluster-{index}"} for index in range(5)]
+        monkeypatch.setenv("AIOD_API_BASE_URL", server.base_url)
+        yield server
+
+
+def run(scenario):
+    async def run_and_close():
+        try:
+            return await scenario
+        finally:
+            await close_async_http_client()
+    return asyncio.run(run_and_close())
+
+
+def asset_gets(catalogue):
+    return [path for method, path, _ in catalogue.requests if method == "GET"]
+
+
+class TestCatalogueMirror:
+
+    def test_fresh_copies_are_served_locally(self, catalogue):
+        mirror = CatalogueMirror(AsyncAIODMetadataClient(), max_age_seconds=60)
+
+        async def scenario():
+            return [await mirror.get("1") for _ in range(3)]
+
+        assert run(scenario()) == [{"id": 1, "name": "cluster-1"}] * 3
+        assert asset_gets(catalogue) == ["/computational_assets/v1/1"]
+        statistics = mirror.get_statistics()
+        assert (statistics.fetched, statistics.hits, statistics.revalidated) == (1, 2, 0)
+
+    def test_stale_copies_are_revalidated(self, catalogue):
+        mirror = CatalogueMirror(AsyncAIODMetadataClient(), max_age_seconds=0)
+
+        async def scenario():
+            first, unchanged = await mirror.get("1"), await mirror.get("1")
+            catalogue.assets[1] = {"id": 1, "name": "renamed"}
+            return first, unchanged, await mirror.get("1")
+
+        first, unchanged, changed = run(scenario())
+
+        assert first == unchanged == {"id": 1, "name": "cluster-1"}
+        assert changed == {"id": 1, "name": "renamed"}
+        statistics = mirror.get_statistics()
+        assert (statistics.fetched, statistics.revalidated) == (2, 1)
+
+    def test_concurrent_lookups_share_one_request(self, catalogue):
+        catalogue.delay = 0.05
+        mirror = CatalogueMirror(AsyncAIODMetadataClient(), max_age_seconds=60)
+
+        async def scenario():
+            return await asyncio.gather(*(mirror.get("2") for _ in range(10)))
+
+        assert run(scenario()) == [{"id": 2, "name": "cluster-2"}] * 10
+        assert len(asset_gets(catalogue)) == 1
+
+    def test_lookups_in_flight_during_an_invalidation_are_not_stored(self, catalogue):
+        catalogue.delay = 0.05
+        mirror = CatalogueMirror(AsyncAIODMetadataClient(), max_age_seconds=60)
+
+        async def scenario():
+            outdated = asyncio.ensure_future(mirror.get("2"))
+            await asyncio.sleep(0.01)
+            await mirror.invalidate("2")
+            catalogue.assets[2] = {"id": 2, "name": "renamed"}
+            await outdated
+            return await mirror.get("2"), await mirror.get("2")
+
+        assert run(scenario()) == ({"id": 2, "name": "renamed"},) * 2
+        assert len(asset_gets(catalogue)) == 2
+
+    def test_sqlite_copies_survive_a_restart(self, catalogue, tmp_path):
+        db_file = str(tmp_path / "catalogue.db")
+        first_mirror = CatalogueMirror(AsyncAIODMetadataClient(), max_age_seconds=0, db_file=db_file)
+        run(first_mirror.get("3"))
+        first_mirror.close()
+
+        restarted_mirror = CatalogueMirror(AsyncAIODMetadataClient(), max_age_seconds=0, db_file=db_file)
+        try:
+            assert run(restarted_mirror.get("3")) == {"id": 3, "name": "cluster-3"}
+            statistics = restarted_mirror.get_statistics()
+            assert (statistics.fetched, statistics.revalidated) == (0, 1)
+        finally:
+            restarted_mirror.close()
+
+    def test_catalogue_service_closes_the_mirror_database(self, catalogue, monkeypatch, tmp_path, forget_singleton):
+        monkeypatch.setenv("CATALOGUE_MIRROR_DB_FILE", str(tmp_path / "catalogue.db"))
+        forget_singleton(CatalogueService)
+        service = CatalogueService()
+
+        service.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            service.mirror._db.execute("SELECT 1")
+
+    def test_deleted_assets_are_forgotten(self, catalogue):
+        mirror = CatalogueMirror(AsyncAIODMetadataClient(), max_age_seconds=0)
+        run(mirror.get("4"))
+        catalogue.assets.pop()
+
+        with pytest.raises(APIRequestError):
+            run(mirror.get("4"))
+        assert mirror.get_statistics().size == 0
+
+    def test_least_recently_used_copies_are_evicted(self, catalogue):
+        mirror = CatalogueMirror(AsyncAIODMetadataClient(), max_age_seconds=60, max_entries=2)
+
+        async def scenario():
+            for asset_id in ("0", "1", "0", "2"):
+                await mirror.get(asset_id)
+
+        run(scenario())
+
+        statistics = mirror.get_statistics()
+        assert (statistics.size, statistics.evictions) == (2, 1)
+        assert run(mirror.get("0")) == {"id": 0, "name": "cluster-0"}
+        assert mirror.get_statistics().hits == 2
@@ -0,0 +1,105 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from hw_agent.dependencies import close_async_http_client
+from hw_agent.exceptions.error_handling import add_exception_handlers
+from hw_agent.routers.catalogue_router import router as catalogue_router
+from hw_agent.services.aiod_metadata_client import AIODMetadataClient, AsyncAIODMetadataClient
+from hw_agent.services.catalogue_service import CatalogueService
+from tests.fake_catalogue import serve_fake_catalogue
+
+
+@pytest.fixture
+def catalogue(monkeypatch, forget_singleton):
+    with serve_fake_catalogue() as server:
+        server.assets = [{"id": index, "name": f"cluster-{index}"} for index in range(250)]
+        monkeypatch.setenv("AIOD_API_BASE_URL", server.base_url)
+        monkeypatch.setenv("CATALOGUE_PAGE_SIZE", "100")
+        forget_singleton(CatalogueService)
+        yield server
+
+
+def page_requests(catalogue):
+    return [path for method, path, _ in catalogue.requests if method == "GET"]
+
+
+class TestAssetIteration:
+
+    def test_async_iteration_walks_every_page(self, catalogue):
+        async def collect():
+            try:
+                return [asset async for asset in AsyncAIODMetadataClient().iter_assets()]
+            finally:
+                await close_async_http_client()
+
+        assert [asset["id"] for asset in asyncio.run(collect())] == list(range(250))
+        assert page_requests(catalogue) == [
+            "/computational_assets/v1?offset=0&limit=100",
+            "/computational_assets/v1?offset=100&limit=100",
+            "/computational_assets/v1?offset=200&limit=100",
+        ]
+
+    def test_next_page_is_prefetched(self, catalogue):
+        catalogue.delay = 0.05
+
+        async def consume_slowly():
+            assets = AsyncAIODMetadataClient().iter_assets()
+            try:
+                await anext(assets)
+                await asyncio.sleep(0.2)
+                return len(page_requests(catalogue))
+            finally:
+                await assets.aclose()
+                await close_async_http_client()
+
+        assert asyncio.run(consume_slowly()) == 2
+
+    def test_sync_iteration_stops_early(self, catalogue):
+        assets = AIODMetadataClient().iter_assets(page_size=50)
+
+        assert [next(assets)["id"] for _ in range(60)] == list(range(60))
+        assets.close()
+        # The first two pages, and the prefetch of the third unless it was cancelled in time
+        assert len(page_requests(catalogue)) in (2, 3)
+
+
+class TestAssetStreaming:
+
+    @pytest.fixture
+    def client(self, catalogue):
+        @asynccontextmanager
+        async def lifespan(app):
+            yield
+            await close_async_http_client()
+
+        app = FastAPI(lifespan=lifespan)
+        add_exception_handlers(app)
+        app.include_router(catalogue_router)
+        with TestClient(app) as client:
+            yield client
+
+    def test_json_array(self, client):
+        response = client.get("/catalogue/computational-assets")
+
+        assert response.status_code == 200
+        assert [asset["id"] for asset in response.json()] == list(range(250))
+
+    def test_ndjson(self, client):
+        response = client.get("/catalogue/computational-assets", params={"format": "ndjson", "page_size": 30})
+
+        assert [json.loads(line)["id"] for line in response.text.splitlines()] == list(range(250))
+
+    def test_empty_catalogue(self, client, catalogue):
+        catalogue.assets = []
+
+        assert client.get("/catalogue/computational-assets").json() == []
+
+    def test_unreachable_catalogue_is_reported(self, client, catalogue):
+        catalogue.statuses = [404]
+
+        assert client.get("/catalogue/computational-assets").status_code == 400
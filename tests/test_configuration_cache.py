@@ -0,0 +1,54 @@
+import pytest
+
+from hw_agent.repositories.sqlite_repository import SQLiteRepository
+from hw_agent.services.configuration_cache import ConfigurationCache
+from tests.conftest import build_configuration
+
+
+@pytest.fixture
+def repository_service(create_repository_service):
+    return create_repository_service("sqlite", configuration_cache_size=2)
+
+
+class TestConfigurationCache:
+
+    def test_lru_eviction(self):
+        cache = ConfigurationCache(max_size=2)
+        cache.sync(1)
+        for config_id in ("a", "b"):
+            cache.put(config_id, config_id, generation=1)
+        cache.get("a")
+        cache.put("c", "c", generation=1)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        statistics = cache.get_statistics()
+        assert (statistics.hits, statistics.misses, statistics.evictions, statistics.size) == (2, 1, 1, 2)
+
+    def test_entries_of_an_older_generation_are_not_cached(self):
+        cache = ConfigurationCache(max_size=2)
+        cache.sync(2)
+        cache.put("a", "a", generation=1)
+        assert cache.get("a") is None
+
+    def test_repeated_lookups_are_served_from_the_cache(self, repository_service, mocker):
+        config_id = repository_service.save_configuration(build_configuration("first"))
+        read = mocker.spy(repository_service.repository, "get_configuration")
+
+        for _ in range(5):
+            assert repository_service.get_configuration(config_id).metadata.name == "first"
+
+        assert read.call_count == 1
+        assert repository_service.get_cache_statistics().hit_rate == 0.8
+
+    def test_changes_by_another_worker_are_detected(self, repository_service):
+        config_id = repository_service.save_configuration(build_configuration("first"))
+        repository_service.get_configuration(config_id)
+
+        # Another worker writes the same database through its own repository
+        other_worker = SQLiteRepository()
+        other_worker.save_configuration(config_id, build_configuration("renamed"))
+        other_worker.close()
+
+        assert repository_service.get_configuration(config_id).metadata.name == "renamed"
+        assert repository_service.get_cache_statistics().generation_changes == 1
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+import yaml
+
+from hw_agent.models.connection_config_models import ConnectionConfigQuery
+from hw_agent.repositories.connection_info_codec import ConnectionInfoCodec
+from hw_agent.repositories.sqlite_repository import SQLiteRepository
+from hw_agent.repositories.yaml_repository import YAMLRepository
+from tests.conftest import build_configuration
+
+KUBECONFIG = {"kubeconfig": {"certificate-authority-data": "LS0tLS1CRUdJTi" * 400, "server": "https://k8s.example.org"}}
+
+
+
+class TestConnectionInfoCodec:
+
+    @pytest.mark.parametrize("algorithm", ["zlib", "zstd"])
+    def test_round_trip(self, algorithm):
+        if algorithm == "zstd":
+            pytest.importorskip("zstandard")
+        codec = ConnectionInfoCodec(algorithm)
+
+        encoded = codec.encode(KUBECONFIG)
+        assert encoded.startswith(algorithm.encode() + b":")
+        assert len(encoded) < len(json.dumps(KUBECONFIG)) / 10
+        assert codec.decode(encoded) == KUBECONFIG
+
+        encoded_text = codec.encode_text(KUBECONFIG)
+        assert encoded_text.startswith(f"{algorithm}:")
+        assert codec.decode_text(encoded_text) == KUBECONFIG
+
+    def test_small_and_legacy_values_stay_plain(self):
+        codec = ConnectionInfoCodec("zlib")
+        small = {"host": "login.example.org"}
+
+        assert codec.encode(small) == json.dumps(small)
+        assert codec.encode_text(small) == small
+        assert codec.decode(json.dumps(small)) == small
+        assert codec.decode_text(small) == small
+
+    def test_any_stored_tag_is_readable(self):
+        encoded = ConnectionInfoCodec("zlib").encode(KUBECONFIG)
+        assert ConnectionInfoCodec("none").decode(encoded) == KUBECONFIG
+
+    def test_text_record_round_trip(self):
+        codec = ConnectionInfoCodec(algorithm="zlib")
+        configuration = build_configuration(orchestrator_type="kubernetes", connection_info=KUBECONFIG)
+        record = codec.encode_record(configuration, "2024-01-01T00:00:00Z")
+        assert record["connection_info"].startswith("zlib:")
+        assert record["updated_at"] == record["created_at"]
+
+        read = codec.decode_record("config-1", record)
+        assert read.config_id == "config-1"
+        assert read.connection_info == KUBECONFIG
+        assert read.target_fingerprint == record["target_fingerprint"]
+
+        # Records stored before fingerprints existed get the same one computed on read
+        legacy = {key: value for key, value in record.items() if key != "target_fingerprint"}
+        assert codec.record_fingerprint(legacy) == record["target_fingerprint"]
+
+
+class TestCompressedRepositories:
+
+    def test_sqlite_stores_a_blob_decoded_only_on_fetch(self, repository_files, monkeypatch, mocker):
+        monkeypatch.setenv("CONNECTION_INFO_COMPRESSION", "zlib")
+        repository = SQLiteRepository()
+        try:
+            repository.save_configuration("config-1", build_configuration(orchestrator_type="kubernetes", connection_info=KUBECONFIG))
+            stored = repository.connection.execute("SELECT connection_info FROM configuration_connection_info").fetchone()[0]
+            assert stored.startswith(b"zlib:")
+
+            decode = mocker.spy(repository.codec, "decode")
+            assert repository.list_configurations(ConnectionConfigQuery()).items[0].connection_info is None
+            assert decode.call_count == 0
+
+            assert repository.get_configuration("config-1").connection_info == KUBECONFIG
+            assert decode.call_count == 1
+        finally:
+            repository.close()
+
+    def test_yaml_stores_a_tagged_string(self, repository_files, monkeypatch):
+        config_file = repository_files / "configurations.yaml"
+        monkeypatch.setenv("CONNECTION_INFO_COMPRESSION", "zlib")
+        repository = YAMLRepository()
+        repository.save_configuration("config-1", build_configuration(orchestrator_type="kubernetes", connection_info=KUBECONFIG))
+
+        stored = yaml.safe_load(config_file.read_text())["config-1"]["connection_info"]
+        assert stored.startswith("zlib:")
+        assert repository.get_configuration("config-1").connection_info == KUBECONFIG
+        page = repository.list_configurations(ConnectionConfigQuery(include_connection_info=True))
+        assert page.items[0].connection_info == KUBECONFIG
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from hw_agent.exceptions.custom_exceptions import APIRequestError
+from hw_agent.models.computational_asset import ComputationalAsset
+from hw_agent.services.aiod_metadata_client import AsyncAIODMetadataClient
+from hw_agent.services.keycloak_client import KeycloakClient
+from hw_agent.services.settings_service import SettingsService
+from hw_agent.utils.api_request import APIRequest
+from hw_agent.utils.async_api_request import AsyncAPIRequest
+from hw_agent.utils.http_session import create_async_http_client, create_http_session
+from tests.fake_catalogue import serve_fake_catalogue
+
+
+@pytest.fixture
+def catalogue():
+    with serve_fake_catalogue() as server:
+        yield server
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setenv("HTTP_BACKOFF_FACTOR", "0")
+    monkeypatch.setenv("HTTP_BACKOFF_JITTER", "0")
+    session = create_http_session(SettingsService())
+    yield session
+    session.close()
+
+
+class TestSharedHTTPSession:
+
+    def test_connections_are_kept_alive(self, catalogue, session):
+        api_request = APIRequest(catalogue.base_url, session=session, timeout=(1, 5))
+
+        for index in range(3):
+            assert api_request.make_request("GET", f"/computational_assets/v1/{index}")["path"] == f"/computational_assets/v1/{index}"
+
+        assert len({port for _, _, port in catalogue.requests}) == 1
+
+    def test_idempotent_requests_are_retried(self, catalogue, session):
+        catalogue.statuses = [503, 502]
+        api_request = APIRequest(catalogue.base_url, session=session, timeout=(1, 5))
+
+        assert api_request.make_request("GET", "/computational_assets/v1")["path"] == "/computational_assets/v1"
+        assert len(catalogue.requests) == 3
+
+    def test_posts_are_not_retried_on_server_errors(self, catalogue, session):
+        catalogue.statuses = [503]
+        api_request = APIRequest(catalogue.base_url, session=session, timeout=(1, 5))
+
+        with pytest.raises(APIRequestError, match="503"):
+            api_request.make_request("POST", "/computational_assets/v1", json={"name": "asset"})
+        assert len(catalogue.requests) == 1
+
+    def test_retries_give_up_with_the_last_status(self, catalogue, session):
+        catalogue.statuses = [500] * 10
+        api_request = APIRequest(catalogue.base_url, session=session, timeout=(1, 5))
+
+        with pytest.raises(APIRequestError, match="500"):
+            api_request.make_request("GET", "/computational_assets/v1")
+        assert len(catalogue.requests) == 4
+
+    def test_keycloak_shares_the_session(self, catalogue, session):
+        keycloak_client = KeycloakClient(catalogue.base_url, "aiod", "agent", "secret", session=session, timeout=(1, 5))
+        api_request = APIRequest(catalogue.base_url, session=session, timeout=(1, 5))
+
+        assert keycloak_client.get_keycloak_token() == "token-1"
+        api_request.make_request("GET", "/computational_assets/v1")
+
+        assert catalogue.requests[0][:2] == ("POST", "/realms/aiod/protocol/openid-connect/token")
+        assert len({port for _, _, port in catalogue.requests}) == 1
+
+
+def run_with_client(scenario):
+    async def run_and_close():
+        async with create_async_http_client(SettingsService()) as client:
+            return await scenario(client)
+    return asyncio.run(run_and_close())
+
+
+class TestAsyncAPIRequest:
+
+    def test_concurrent_requests_share_the_pool(self, catalogue, session, monkeypatch):
+        monkeypatch.setenv("HTTP_ASYNC_MAX_CONNECTIONS", "4")
+
+        async def scenario(client):
+            api_request = AsyncAPIRequest(catalogue.base_url, client=client)
+            return await asyncio.gather(*(api_request.make_request("GET", f"/computational_assets/v1/{index}") for index in range(40)))
+
+        answers = run_with_client(scenario)
+
+        assert [answer["path"] for answer in answers] == [f"/computational_assets/v1/{index}" for index in range(40)]
+        assert len({port for _, _, port in catalogue.requests}) <= 4
+
+    def test_retries_follow_the_synchronous_rules(self, catalogue, session):
+        catalogue.statuses = [503, 503]
+
+        async def scenario(client):
+            api_request = AsyncAPIRequest(catalogue.base_url, client=client)
+            answer = await api_request.make_request("GET", "/computational_assets/v1")
+            catalogue.statuses = [503]
+            with pytest.raises(APIRequestError, match="503"):
+                await api_request.make_request("POST", "/computational_assets/v1", json={"name": "asset"})
+            return answer
+
+        assert run_with_client(scenario)["path"] == "/computational_assets/v1"
+        assert [method for method, _, _ in catalogue.requests] == ["GET", "GET", "GET", "POST"]
+
+    def test_async_metadata_client_publishes_with_the_keycloak_token(self, catalogue, session, monkeypatch):
+        monkeypatch.setenv("AIOD_API_BASE_URL", catalogue.base_url)
+        keycloak_client = KeycloakClient(catalogue.base_url, "aiod", "agent", "secret", session=session, timeout=(1, 5))
+
+        async def scenario(client):
+            aiod_client = AsyncAIODMetadataClient(keycloak_client=keycloak_client)
+            aiod_client.api_request = AsyncAPIRequest(catalogue.base_url, client=client)
+            return await aiod_client.create_computational_asset(ComputationalAsset(name="cluster"))
+
+        assert run_with_client(scenario)["path"] == "/computational_assets/v1"
+        assert [request[:2] for request in catalogue.requests] == [
+            ("POST", "/realms/aiod/protocol/openid-connect/token"),
+            ("POST", "/computational_assets/v1"),
+        ]
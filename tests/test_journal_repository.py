@@ -0,0 +1,193 @@
+import pytest
+
+from hw_agent.models.connection_config_models import ConnectionConfigQuery
+from hw_agent.repositories.journal_repository import ConfigurationJournal, JournalRepository
+from tests.conftest import HPC_CONNECTION_INFO, build_configuration
+
+
+class TestConfigurationJournal:
+
+    def test_replay_restores_the_latest_state(self, tmp_path):
+        journal_file = str(tmp_path / "journal.jsonl")
+        journal = ConfigurationJournal(journal_file)
+        journal.put("config-1", {"name": "first"})
+        journal.put("config-2", {"name": "second"})
+        journal.put("config-1", {"name": "renamed"})
+        journal.delete("config-2")
+        journal.close()
+
+        replayed = ConfigurationJournal(journal_file)
+        assert replayed.items() == [("config-1", {"name": "renamed"})]
+        assert replayed.record_count == 4
+
+    def test_torn_last_record_is_discarded(self, tmp_path):
+        journal_file = tmp_path / "journal.jsonl"
+        journal = ConfigurationJournal(str(journal_file))
+        journal.put("config-1", {"name": "first"})
+        journal.close()
+        with open(journal_file, "ab") as f:
+            f.write(b'{"op":"put","config_id":"config-2","da')
+
+        replayed = ConfigurationJournal(str(journal_file))
+        replayed.put("config-3", {"name": "third"})
+        replayed.close()
+
+        assert [config_id for config_id, _ in ConfigurationJournal(str(journal_file)).items()] == ["config-1", "config-3"]
+
+    def test_compaction_keeps_live_configurations_only(self, tmp_path):
+        journal_file = str(tmp_path / "journal.jsonl")
+        journal = ConfigurationJournal(journal_file, garbage_ratio=0.5, min_compaction_records=10)
+        for index in range(10):
+            journal.put("config-1", {"name": f"version-{index}"})
+        journal.close()
+
+        assert journal.compactions == 1
+        replayed = ConfigurationJournal(journal_file)
+        assert replayed.items() == [("config-1", {"name": "version-9"})]
+        assert replayed.record_count < 10
+
+    def test_writes_during_compaction_are_kept(self, tmp_path, mocker):
+        journal_file = str(tmp_path / "journal.jsonl")
+        journal = ConfigurationJournal(journal_file, min_compaction_records=10**6)
+        journal.put("config-1", {"name": "first"})
+
+        encode = journal._encode
+
+        def write_during_compaction(record):
+            # The snapshot is being written: a concurrent writer appends to the old log
+            if record["config_id"] == "config-1" and not hasattr(write_during_compaction, "done"):
+                write_during_compaction.done = True
+                journal.put("config-2", {"name": "second"})
+            return encode(record)
+
+        mocker.patch.object(journal, "_encode", side_effect=write_during_compaction)
+        journal.compact()
+        journal.close()
+
+        assert dict(ConfigurationJournal(journal_file).items()) == {
+            "config-1": {"name": "first"},
+            "config-2": {"name": "second"},
+        }
+
+
+    def test_appends_of_another_process_are_picked_up(self, tmp_path):
+        journal_file = str(tmp_path / "journal.jsonl")
+        journal = ConfigurationJournal(journal_file)
+        other_process = ConfigurationJournal(journal_file)
+        journal.put("config-1", {"name": "first"})
+        journal.put("config-2", {"name": "second"})
+        generation = journal.generation
+
+        other_process.put("config-1", {"name": "renamed"})
+
+        assert journal.generation != generation
+        assert journal.get("config-1") == {"name": "renamed"}
+        assert journal.changes_since(generation) == {"config-1"}
+
+    def test_compaction_by_another_process_is_picked_up(self, tmp_path):
+        journal_file = str(tmp_path / "journal.jsonl")
+        journal = ConfigurationJournal(journal_file)
+        for index in range(3):
+            journal.put("config-1", {"name": f"version-{index}"})
+        journal.put("config-2", {"name": "second"})
+        generation = journal.generation
+
+        other_process = ConfigurationJournal(journal_file)
+        other_process.put("config-2", {"name": "renamed"})
+        other_process.compact()
+        journal.put("config-3", {"name": "third"})
+
+        assert dict(journal.items()) == {
+            "config-1": {"name": "version-2"},
+            "config-2": {"name": "renamed"},
+            "config-3": {"name": "third"},
+        }
+        assert journal.changes_since(generation) == {"config-2", "config-3"}
+        assert dict(ConfigurationJournal(journal_file).items()) == dict(journal.items())
+
+    def test_reads_during_a_reload_see_the_previous_state(self, tmp_path, mocker):
+        journal_file = str(tmp_path / "journal.jsonl")
+        journal = ConfigurationJournal(journal_file)
+        journal.put_many({f"config-{index}": {"name": f"cluster-{index}"} for index in range(3)})
+        other_process = ConfigurationJournal(journal_file)
+        other_process.put("config-3", {"name": "cluster-3"})
+        other_process.compact()
+
+        apply = ConfigurationJournal._apply
+        seen_during_reload = []
+
+        def apply_and_read(self, *args):
+            seen_during_reload.append(journal.get("config-0"))
+            return apply(self, *args)
+
+        mocker.patch.object(ConfigurationJournal, "_apply", apply_and_read)
+        journal.generation
+
+        assert seen_during_reload and all(seen == {"name": "cluster-0"} for seen in seen_during_reload)
+        assert journal.get("config-3") == {"name": "cluster-3"}
+        assert journal.record_count == 4
+
+    def test_clear_makes_older_changes_unknown(self, tmp_path):
+        journal = ConfigurationJournal(str(tmp_path / "journal.jsonl"))
+        journal.put("config-1", {"name": "first"})
+        generation = journal.generation
+
+        journal.clear()
+
+        assert journal.changes_since(generation) is None
+        assert journal.changes_since(journal.generation) == set()
+
+
+    def test_empty_batch_writes_nothing(self, tmp_path):
+        journal = ConfigurationJournal(str(tmp_path / "journal.jsonl"))
+        generation = journal.generation
+
+        journal.put_many({})
+
+        assert (journal.record_count, journal.generation) == (0, generation)
+
+
+class TestJournalRepository:
+
+    @pytest.fixture
+    def repository(self, repository_files):
+        return JournalRepository()
+
+    def test_instances_share_the_journal(self, repository):
+        repository.save_configuration("config-1", build_configuration("first"))
+        assert JournalRepository().get_configuration("config-1").metadata.name == "first"
+
+    def test_closed_journal_is_not_handed_out_again(self, repository):
+        repository.save_configuration("config-1", build_configuration("first"))
+        repository.journal.close()
+
+        reopened = JournalRepository()
+        assert reopened.journal is not repository.journal
+        assert reopened.get_configuration("config-1").metadata.name == "first"
+        reopened.save_configuration("config-2", build_configuration("second"))
+
+    def test_listing_follows_writes(self, repository):
+        for index in range(3):
+            repository.save_configuration(f"config-{index}", build_configuration(f"cluster-{index}"))
+        assert len(repository.list_configurations(ConnectionConfigQuery()).items) == 3
+
+        repository.delete_configuration("config-1")
+        repository.save_configuration("config-2", build_configuration("renamed"))
+        page = repository.list_configurations(ConnectionConfigQuery(sort_by="name", include_connection_info=True))
+        assert [item.metadata.name for item in page.items] == ["cluster-0", "renamed"]
+        assert page.items[0].connection_info == HPC_CONNECTION_INFO
+
+    def test_cache_drops_only_the_changed_configurations(self, repository, create_repository_service):
+        service = create_repository_service("journal")
+        for index in range(3):
+            repository.save_configuration(f"config-{index}", build_configuration(f"cluster-{index}"))
+        for index in range(3):
+            service.get_configuration(f"config-{index}")
+
+        # Written by another worker, through its own journal on the same file
+        other_worker = ConfigurationJournal(repository.journal.journal_file)
+        other_worker.put("config-1", repository.codec.encode_record(build_configuration("renamed"), "2024-01-01T00:00:00Z"))
+
+        assert service.get_configuration("config-1").metadata.name == "renamed"
+        statistics = service.get_cache_statistics()
+        assert (statistics.size, statistics.generation_changes) == (3, 1)
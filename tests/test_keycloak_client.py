@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from hw_agent.dependencies import close_async_http_client
+from hw_agent.models.catalogue_models import BulkPublishRequest
+from hw_agent.models.computational_asset import ComputationalAsset
+from hw_agent.services.aiod_metadata_client import AIODMetadataClient
+from hw_agent.services.catalogue_service import CatalogueService
+from hw_agent.services.keycloak_client import KeycloakClient
+from tests.fake_catalogue import serve_fake_catalogue
+
+TOKEN_PATH = "/realms/aiod/protocol/openid-connect/token"
+
+
+@pytest.fixture
+def catalogue(monkeypatch, forget_singleton):
+    with serve_fake_catalogue() as server:
+        monkeypatch.setenv("AIOD_API_BASE_URL", server.base_url)
+        monkeypatch.setenv("AIOD_KEYCLOAK_AUTH_URL", server.base_url)
+        monkeypatch.setenv("AIOD_KEYCLOAK_REALM", "aiod")
+        forget_singleton(CatalogueService)
+        yield server
+
+
+def build_client(catalogue, refresh_fraction=0):
+    return KeycloakClient(catalogue.base_url, "aiod", "agent", "secret", timeout=(1, 5), refresh_fraction=refresh_fraction)
+
+
+class TestKeycloakClient:
+
+    def test_concurrent_callers_share_one_request(self, catalogue):
+        catalogue.delay = 0.05
+        keycloak_client = build_client(catalogue)
+        tokens = []
+
+        threads = [threading.Thread(target=lambda: tokens.append(keycloak_client.get_keycloak_token())) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tokens == ["token-1"] * 10
+        assert catalogue.tokens_issued == 1
+
+    def test_token_is_refreshed_in_the_background(self, catalogue):
+        keycloak_client = build_client(catalogue, refresh_fraction=0.001)
+        try:
+            assert keycloak_client.get_keycloak_token() == "token-1"
+            deadline = time.monotonic() + 5
+            while keycloak_client.cached_token() == "token-1" and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            # Replaced without any caller asking for it, possibly more than once already
+            assert keycloak_client.cached_token() != "token-1"
+            assert catalogue.tokens_issued >= 2
+        finally:
+            keycloak_client.close()
+
+    def test_refresh_after_a_rejection_is_shared(self, catalogue):
+        keycloak_client = build_client(catalogue)
+        keycloak_client.get_keycloak_token()
+
+        assert keycloak_client.refresh_token(rejected_token="token-1") == "token-2"
+        assert keycloak_client.refresh_token(rejected_token="token-1") == "token-2"
+        assert catalogue.tokens_issued == 2
+
+
+class TestCatalogueServiceClose:
+
+    def test_close_stops_the_background_refresh(self, catalogue, monkeypatch):
+        monkeypatch.setenv("KEYCLOAK_REFRESH_FRACTION", "0.5")
+        service = CatalogueService()
+        keycloak_client = service.aiod_client.keycloak_client
+        keycloak_client.get_keycloak_token()
+        timer = keycloak_client._refresh_timer
+
+        service.close()
+
+        assert timer.finished.is_set()
+        # A refresh requested afterwards does not schedule the next one either
+        keycloak_client.refresh_token()
+        assert keycloak_client._refresh_timer is timer
+
+
+class TestRejectedTokens:
+
+    def test_sync_client_refreshes_once_and_retries(self, catalogue):
+        catalogue.revoked_tokens = {"token-1"}
+
+        AIODMetadataClient().create_computational_asset(ComputationalAsset(name="cluster"))
+
+        assert [path for _, path, _ in catalogue.requests] == [TOKEN_PATH, "/computational_assets/v1", TOKEN_PATH, "/computational_assets/v1"]
+
+    def test_bulk_publish_shares_the_refresh(self, catalogue):
+        catalogue.revoked_tokens = {"token-1"}
+
+        async def publish():
+            try:
+                return await CatalogueService().publish_computational_assets(
+                    BulkPublishRequest(assets=[ComputationalAsset(name=f"cluster-{index}") for index in range(8)], concurrency=8)
+                )
+            finally:
+                await close_async_http_client()
+
+        result = asyncio.run(publish())
+
+        assert result.published == 8
+        assert catalogue.tokens_issued == 2
@@ -0,0 +1,41 @@
+import json
+
+from hw_agent.core.manifest_cache import PluginManifestCache
+from hw_agent.models.plugin_models import PluginDefinition
+
+
+def _definition():
+    return PluginDefinition(name="test_plugin", orchestrator_type="kubernetes", module="plugin_module")
+
+
+class TestPluginManifestCache:
+
+    def test_definition_is_reused_only_for_unchanged_content(self, tmp_path):
+        cache_file = tmp_path / "manifest.json"
+        cache = PluginManifestCache(str(cache_file))
+        content_hash = PluginManifestCache.hash_content("name: test_plugin")
+        cache.put("test_plugin", content_hash, _definition())
+        cache.save()
+
+        reloaded = PluginManifestCache(str(cache_file))
+
+        assert reloaded.get("test_plugin", content_hash) == _definition()
+        assert reloaded.get("test_plugin", PluginManifestCache.hash_content("name: changed")) is None
+
+    def test_cache_is_discarded_when_the_definition_model_changes(self, tmp_path):
+        cache_file = tmp_path / "manifest.json"
+        content_hash = PluginManifestCache.hash_content("name: test_plugin")
+        cache_file.write_text(json.dumps({
+            "model_version": "previous-model",
+            "plugins": {"test_plugin": {"sha256": content_hash, "definition": _definition().model_dump_json()}},
+        }))
+
+        assert PluginManifestCache(str(cache_file)).get("test_plugin", content_hash) is None
+
+    def test_removed_plugins_are_dropped(self, tmp_path):
+        cache = PluginManifestCache(str(tmp_path / "manifest.json"))
+        cache.put("removed_plugin", "hash", _definition())
+
+        cache.retain(["other_plugin"])
+
+        assert cache.get("removed_plugin", "hash") is None
@@ -0,0 +1,128 @@
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from hw_agent.core.plugin_executor import PluginExecutor
+from hw_agent.exceptions.custom_exceptions import PluginExecutionTimeoutError
+from hw_agent.models.plugin_models import PluginExecutionPolicy
+
+
+class TestPluginExecutor:
+
+    def test_policy_rejects_invalid_values(self):
+        with pytest.raises(ValidationError):
+            PluginExecutionPolicy(timeout_seconds=0)
+        with pytest.raises(ValidationError):
+            PluginExecutionPolicy(retries=-1)
+
+    def test_timeout_raises_and_keeps_the_slot_until_the_run_ends(self):
+        release = threading.Event()
+        executor = PluginExecutor(PluginExecutionPolicy(timeout_seconds=0.1, max_concurrency=1), "test")
+
+        with pytest.raises(PluginExecutionTimeoutError):
+            executor.execute("a", release.wait)
+        # The first run is still going on, so there is no free slot
+        with pytest.raises(PluginExecutionTimeoutError):
+            executor.execute("b", lambda: "done")
+
+        release.set()
+        time.sleep(0.05)
+        assert executor.execute("b", lambda: "done") == "done"
+        executor.shutdown()
+
+    def test_max_concurrency_is_enforced(self):
+        executor = PluginExecutor(PluginExecutionPolicy(timeout_seconds=5, max_concurrency=2), "test")
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def operation():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        threads = [threading.Thread(target=executor.execute, args=(i, operation)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak[0] == 2
+        executor.shutdown()
+
+    def test_results_are_reused_within_ttl(self, mocker):
+        executor = PluginExecutor(PluginExecutionPolicy(timeout_seconds=None, result_ttl_seconds=60), "test")
+        operation = mocker.Mock(side_effect=["first", "second", "third"])
+
+        assert executor.execute("config-1", operation) == "first"
+        assert executor.execute("config-1", operation) == "first"
+        assert executor.execute("config-2", operation) == "second"
+
+        executor.invalidate("config-1")
+        assert executor.execute("config-1", operation) == "third"
+
+    def test_none_results_are_reused_too(self, mocker):
+        executor = PluginExecutor(PluginExecutionPolicy(result_ttl_seconds=60), "test")
+        operation = mocker.Mock(return_value=None)
+
+        assert executor.execute("config-1", operation) is None
+        assert executor.execute("config-1", operation) is None
+        assert operation.call_count == 1
+
+    def test_policy_is_opt_in(self):
+        policy = PluginExecutionPolicy()
+
+        assert (policy.timeout_seconds, policy.max_concurrency, policy.result_ttl_seconds) == (None, None, 0)
+
+    def test_failures_are_retried_with_backoff(self, mocker):
+        sleep = mocker.patch("hw_agent.core.plugin_executor.time.sleep")
+        executor = PluginExecutor(
+            PluginExecutionPolicy(timeout_seconds=None, retries=2, retry_backoff_seconds=1), "test"
+        )
+        operation = mocker.Mock(side_effect=[ConnectionError(), ConnectionError(), "ok"])
+
+        assert executor.execute("config-1", operation) == "ok"
+        assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+
+        operation = mocker.Mock(side_effect=ConnectionError())
+        with pytest.raises(ConnectionError):
+            executor.execute("config-2", operation)
+        assert operation.call_count == 3
+
+    def test_concurrent_calls_for_the_same_key_share_one_execution(self):
+        executor = PluginExecutor(PluginExecutionPolicy(timeout_seconds=None), "test")
+        started, release = threading.Event(), threading.Event()
+        calls, results = [], []
+
+        def operation():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "collected"
+
+        leader = threading.Thread(target=lambda: results.append(executor.execute("target", operation)))
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=lambda: results.append(executor.execute("target", operation))) for _ in range(3)]
+        for follower in followers:
+            follower.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["collected"] * 4
+        # Nothing is reused once the execution is over, without a result TTL
+        assert executor.execute("target", lambda: "again") == "again"
+
+    def test_shut_down_executor_runs_without_keeping_threads(self):
+        executor = PluginExecutor(PluginExecutionPolicy(timeout_seconds=5), "test")
+        executor.shutdown()
+
+        assert executor.execute("target", lambda: "collected") == "collected"
+        assert executor._thread_pool is None
@@ -1,5 +1,6 @@
 
 # Generated by Qodo Gen
+import importlib
 import os
 import pytest
 import yaml
@@ -103,4 +104,142 @@ class TestCodeUnderTest:
         assert result is None
         mock_logger.error.assert_called_once()
         assert "Error reading plugin definition" in mock_logger.error.call_args[0][0]
-        mock_open.assert_called_once_with(os.path.join(self.plugin_manager.plugins_dir, plugin_name, 'config.yaml'), 'r')
\ No newline at end of file
+        mock_open.assert_called_once_with(os.path.join(self.plugin_manager.plugins_dir, plugin_name, 'config.yaml'), 'r')
+
+class TestLazyPlugin:
+
+    def test_plugin_is_loaded_once_on_first_use(self, mocker):
+        from concurrent.futures import ThreadPoolExecutor
+        from hw_agent.core.lazy_plugin import LazyPlugin
+
+        plugin_def = PluginDefinition(name="test_plugin", orchestrator_type="kubernetes", module="plugin_module")
+        loader = mocker.Mock(return_value=DefaultPlugin())
+        lazy_plugin = LazyPlugin("test_plugin", plugin_def, loader)
+
+        # Registering the plugin does not import it
+        assert not lazy_plugin.is_loaded
+        loader.assert_not_called()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = list(executor.map(lambda _: lazy_plugin.get_instance(), range(32)))
+
+        loader.assert_called_once_with("test_plugin", plugin_def)
+        assert all(instance is instances[0] for instance in instances)
+        assert lazy_plugin.load_time_in_seconds is not None
+
+
+class TestConnectionInfoValidation:
+
+    def setup_method(self, method):
+        self.plugin_manager = PluginManager()
+
+    def test_validator_is_compiled_once_and_reports_all_errors(self, mocker):
+        from hw_agent.exceptions.custom_exceptions import ConnectionConfigurationError
+
+        schema = {
+            "type": "object",
+            "required": ["host", "port"],
+            "properties": {"host": {"type": "string"}, "port": {"type": "integer"}},
+        }
+        validator = self.plugin_manager._compile_connection_validator(schema)
+        compile_spy = mocker.spy(self.plugin_manager, "_compile_connection_validator")
+
+        assert self.plugin_manager._validate_connection_info(validator, {"host": "a", "port": 1}) == {"host": "a", "port": 1}
+        with pytest.raises(ConnectionConfigurationError) as exc_info:
+            self.plugin_manager._validate_connection_info(validator, {"host": 1, "port": "x"})
+
+        compile_spy.assert_not_called()
+        assert [e["location"] for e in exc_info.value.errors] == [["host"], ["port"]]
+
+    def test_invalid_connection_schema_is_rejected_at_load_time(self):
+        import jsonschema
+
+        with pytest.raises(jsonschema.SchemaError):
+            self.plugin_manager._compile_connection_validator({"type": "not-a-type"})
+
+
+class TestPluginReload:
+
+    def setup_method(self, method):
+        self.plugin_manager = PluginManager()
+
+    def test_reload_plugin_swaps_only_that_plugin(self):
+        registry_before = self.plugin_manager.plugins
+        swaps_before = self.plugin_manager.reload_statistics.swaps
+
+        self.plugin_manager.reload_plugin("sample_plugin")
+
+        registry_after = self.plugin_manager.plugins
+        # The old registry is untouched, in-flight readers keep a consistent view
+        assert registry_after is not registry_before
+        assert registry_before.keys() == registry_after.keys()
+        assert registry_after["slurm"] is not registry_before["slurm"]
+        assert all(registry_after[t] is registry_before[t] for t in registry_before if t != "slurm")
+        assert self.plugin_manager.reload_statistics.swaps == swaps_before + 1
+        assert self.plugin_manager.reload_statistics.last_reloaded_plugins == ["sample_plugin"]
+
+    def test_modules_are_imported_again_only_on_reload(self, mocker):
+        module = importlib.import_module("hw_agent.plugins.sample_plugin.sample_plugin")
+        # A manager that never reloaded, as right after startup
+        singletons = type(PluginManager)._instances
+        mocker.patch.dict(singletons)
+        singletons.pop(PluginManager, None)
+        plugin_manager = PluginManager()
+
+        # First use: the module already imported elsewhere is reused
+        assert isinstance(plugin_manager.get_plugin("slurm"), module.SamplePlugin)
+        assert importlib.import_module("hw_agent.plugins.sample_plugin.sample_plugin") is module
+
+        plugin_manager.reload_plugin("sample_plugin")
+
+        assert importlib.import_module("hw_agent.plugins.sample_plugin.sample_plugin") is not module
+
+    def test_replaced_plugin_releases_its_executor(self):
+        replaced = self.plugin_manager.plugins["slurm"]
+        executor = replaced.executor
+        executor.execute("config-1", lambda: "result")
+
+        self.plugin_manager.reload_plugin("sample_plugin")
+
+        assert executor._thread_pool is None
+        assert self.plugin_manager.plugins["slurm"].executor is not executor
+
+    def test_execution_keeps_the_version_it_looked_up(self, mocker):
+        replaced = self.plugin_manager.plugins["slurm"]
+        old_plugin = mocker.Mock()
+        old_plugin.fetch.return_value = "old result"
+
+        def reload_meanwhile():
+            self.plugin_manager.reload_plugin("sample_plugin")
+            return old_plugin
+
+        mocker.patch.object(replaced, "get_instance", side_effect=reload_meanwhile)
+        context = mocker.Mock(config_id="config-1")
+
+        assert self.plugin_manager.execute_plugin("slurm", context, "fetch") == "old result"
+        assert replaced.executor._thread_pool is None
+        assert self.plugin_manager.plugins["slurm"]._executor is None
+
+    def test_broken_definition_keeps_current_plugin(self, mocker):
+        registry_before = self.plugin_manager.plugins
+        mocker.patch.object(self.plugin_manager, '_read_plugin_definition', return_value=None)
+
+        self.plugin_manager.reload_plugin("sample_plugin")
+
+        assert self.plugin_manager.plugins is registry_before
+
+    def test_watcher_reports_changed_folders(self, tmp_path):
+        from hw_agent.core.plugin_watcher import PluginWatcher
+
+        (tmp_path / "first").mkdir()
+        (tmp_path / "second").mkdir()
+        (tmp_path / "first" / "config.yaml").write_text("name: first")
+        changes = []
+        watcher = PluginWatcher(str(tmp_path), ["__pycache__"], on_change=changes.append)
+
+        assert watcher.check() == []
+        (tmp_path / "first" / "config.yaml").write_text("name: first plugin")
+        (tmp_path / "second" / "plugin.py").write_text("")
+
+        assert watcher.check() == ["first", "second"]
+        assert changes == ["first", "second"]
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from hw_agent.models.migration_models import RepositoryMigrationRequest
+from hw_agent.repositories.journal_repository import JournalRepository
+from hw_agent.repositories.sqlite_repository import SQLiteRepository
+from hw_agent.repositories.yaml_repository import YAMLRepository
+from hw_agent.services.migration_service import RepositoryMigrationService
+from tests.conftest import build_configuration
+
+
+@pytest.fixture
+def migration(repository_files, monkeypatch, forget_singleton):
+    monkeypatch.setenv("MIGRATION_PROGRESS_DIR", str(repository_files / "migrations"))
+    forget_singleton(RepositoryMigrationService)
+    source = YAMLRepository()
+    source.save_configurations({f"config-{index:02d}": build_configuration(f"cluster-{index:02d}") for index in range(25)})
+    return source, RepositoryMigrationService()
+
+
+def stored_in_sqlite():
+    repository = SQLiteRepository()
+    try:
+        return list(repository.iter_configurations())
+    finally:
+        repository.close()
+
+
+class TestRepositoryMigration:
+
+    def test_copies_and_verifies(self, migration):
+        source, service = migration
+
+        report = service.migrate(RepositoryMigrationRequest(source="yaml", target="sqlite", batch_size=10))
+
+        assert report.verified
+        assert (report.copied, report.updated, report.deleted, report.rounds) == (25, 0, 0, 1)
+        assert report.source_count == report.target_count == 25
+        assert report.source_hash == report.target_hash
+        copied = stored_in_sqlite()
+        assert [configuration.model_dump() for configuration in copied] == [
+            configuration.model_dump() for configuration in source.iter_configurations()
+        ]
+
+    def test_resumes_after_the_last_batch_written(self, migration, mocker):
+        _, service = migration
+        restore = SQLiteRepository.restore_configurations
+        calls = []
+
+        def fail_on_third_batch(repository, configurations):
+            calls.append(len(configurations))
+            if len(calls) == 3:
+                raise OSError("disk full")
+            restore(repository, configurations)
+
+        mocker.patch.object(SQLiteRepository, "restore_configurations", autospec=True, side_effect=fail_on_third_batch)
+        with pytest.raises(OSError):
+            service.migrate(RepositoryMigrationRequest(source="yaml", target="sqlite", batch_size=10))
+        progress = json.loads(open(service.progress_file("yaml", "sqlite")).read())
+        assert (progress["phase"], progress["last_config_id"], progress["copied"]) == ("copy", "config-19", 20)
+
+        mocker.patch.object(SQLiteRepository, "restore_configurations", restore)
+        report = service.migrate(RepositoryMigrationRequest(source="yaml", target="sqlite", batch_size=10))
+
+        assert report.verified
+        assert (report.resumed_after, report.copied, report.updated) == ("config-19", 25, 0)
+        assert len(stored_in_sqlite()) == 25
+
+    def test_rerun_copies_changes_and_deletions(self, migration):
+        source, service = migration
+        service.migrate(RepositoryMigrationRequest(source="yaml", target="sqlite", batch_size=10))
+
+        source.save_configuration("config-03", build_configuration("renamed", connection_info={"host": "renamed.example.org", "port": 2222}))
+        source.save_configuration("config-99", build_configuration("added"))
+        source.delete_configuration("config-10")
+        source.delete_configuration("config-24")
+        report = service.migrate(RepositoryMigrationRequest(source="yaml", target="sqlite", batch_size=10))
+
+        assert report.verified
+        assert report.resumed_after is None
+        assert (report.updated, report.deleted, report.rounds) == (2, 2, 2)
+        assert report.source_count == report.target_count == 24
+        copied = {configuration.config_id: configuration for configuration in stored_in_sqlite()}
+        assert "config-10" not in copied and "config-24" not in copied
+        assert copied["config-03"].connection_info == {"host": "renamed.example.org", "port": 2222}
+        assert copied["config-99"].metadata.name == "added"
+
+    def test_journal_target_is_read_once_per_pass_and_deleted_in_batches(self, migration, mocker):
+        source, service = migration
+        service.migrate(RepositoryMigrationRequest(source="yaml", target="journal", batch_size=10))
+        for index in range(5, 20):
+            source.delete_configuration(f"config-{index:02d}")
+        iterations = mocker.spy(JournalRepository, "iter_configurations")
+        deletes = mocker.spy(JournalRepository, "delete_configurations")
+
+        report = service.migrate(RepositoryMigrationRequest(source="yaml", target="journal", batch_size=10))
+
+        assert report.verified
+        assert (report.deleted, report.rounds) == (15, 2)
+        assert iterations.call_count == report.rounds
+        assert [len(call.args[1]) for call in deletes.call_args_list] == [15]
+
+    def test_rejects_unknown_or_identical_types(self):
+        with pytest.raises(ValueError):
+            RepositoryMigrationRequest(source="yaml", target="yaml")
+        with pytest.raises(ValueError):
+            RepositoryMigrationRequest(source="yaml", target="postgres")
@@ -0,0 +1,51 @@
+from hw_agent.plugins.hpc.slurm_inventory import SlurmNodeInventory, parse_scontrol_node_line
+
+
+def _node_line(name, cpus, memory_mb, partitions, state="IDLE"):
+    return (
+        f"NodeName={name} Arch=x86_64 CoresPerSocket=56 CPUAlloc=0 CPUTot={cpus} "
+        f"OS=Linux 5.14.0-284.30.1.el9_2.x86_64 #1 SMP PREEMPT_DYNAMIC RealMemory={memory_mb} "
+        f"State={state} Partitions={partitions}\n"
+    )
+
+
+class TestSlurmNodeInventory:
+
+    def test_parse_line_with_spaces_in_values(self):
+        node = parse_scontrol_node_line(_node_line("gs01", 112, 262144, "gpp"))
+
+        assert node["NodeName"] == "gs01"
+        assert node["CPUTot"] == "112"
+        assert node["RealMemory"] == "262144"
+        assert node["Partitions"] == "gpp"
+
+    def test_parse_line_ignores_non_node_lines(self):
+        assert parse_scontrol_node_line("\n") is None
+        assert parse_scontrol_node_line(b"No nodes in the system\n") is None
+
+    def test_aggregates_nodes_per_partition(self):
+        lines = (_node_line(f"gs{i:05d}", 112, 262144, "gpp,debug") for i in range(10000))
+
+        inventory = SlurmNodeInventory().add_lines(lines)
+        clusters = {c.name: c for c in inventory.to_clusters_info().clusters}
+
+        assert inventory.node_count == 10000
+        assert set(clusters) == {"gpp", "debug"}
+        assert clusters["gpp"].node_count == 10000
+        assert clusters["gpp"].cores_per_node == 112
+        assert clusters["gpp"].memory_per_node == 256
+
+    def test_heterogeneous_partition_is_split_by_shape(self):
+        lines = [
+            _node_line("gs01", 112, 262144, "gpp"),
+            _node_line("gs02", 112, 1048576, "gpp"),
+            _node_line("gs03", 112, 262144, "gpp", state="FUTURE"),
+        ]
+
+        clusters = {c.name: c for c in SlurmNodeInventory().add_lines(lines).to_clusters_info().clusters}
+
+        assert set(clusters) == {"gpp (112c/256GB)", "gpp (112c/1024GB)"}
+        assert all(c.node_count == 1 for c in clusters.values())
+
+    def test_empty_inventory_returns_none(self):
+        assert SlurmNodeInventory().add_lines([]).to_clusters_info() is None
@@ -0,0 +1,177 @@
+import json
+import sqlite3
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from hw_agent.models.connection_config_models import ConnectionConfigQuery
+from hw_agent.repositories.sqlite_repository import SQLiteRepository
+from tests.conftest import HPC_CONNECTION_INFO, build_configuration
+
+
+@pytest.fixture
+def repository(sqlite_repository):
+    return sqlite_repository
+
+
+class TestSQLiteRepository:
+
+    def test_database_uses_wal(self, repository):
+        assert repository.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_reader_connections_are_per_thread_and_read_only(self, repository):
+        readers = []
+        thread = threading.Thread(target=lambda: readers.append(repository._get_reader()))
+        thread.start()
+        thread.join()
+
+        assert repository._get_reader() is repository._get_reader()
+        assert readers[0] is not repository._get_reader()
+        assert repository._get_reader().execute("PRAGMA query_only").fetchone()[0] == 1
+
+    def test_reader_of_an_ended_thread_is_closed(self, repository):
+        readers = []
+        thread = threading.Thread(target=lambda: readers.append(repository._get_reader()))
+        thread.start()
+        thread.join()
+
+        assert readers[0] not in repository._reader_connections
+        with pytest.raises(sqlite3.ProgrammingError):
+            readers[0].execute("SELECT 1")
+
+    def test_writes_are_visible_to_existing_readers(self, repository):
+        assert repository.get_configuration("config-1") is None
+
+        repository.save_configuration("config-1", build_configuration("first"))
+        assert repository.get_configuration("config-1").metadata.name == "first"
+
+        repository.delete_configuration("config-1")
+        assert repository.get_configuration("config-1") is None
+
+    def test_concurrent_reads_during_writes(self, repository):
+        repository.save_configuration("config-1", build_configuration("first"))
+        errors = []
+
+        def read():
+            try:
+                for _ in range(200):
+                    assert repository.get_configuration("config-1") is not None
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for index in range(50):
+            repository.save_configuration(f"config-{index + 2}", build_configuration("other"))
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
+        assert len(repository.get_configurations()) == 51
+
+
+class TestSQLiteRepositoryListing:
+
+    def _save(self, repository, count):
+        for index in range(count):
+            configuration = build_configuration(f"cluster-{index:02d}", "hpc" if index % 2 else "kubernetes")
+            repository.save_configuration(f"config-{index:02d}", configuration)
+
+    def test_keyset_pagination_visits_every_configuration_once(self, repository):
+        self._save(repository, 25)
+        seen, cursor = [], None
+        while True:
+            page = repository.list_configurations(ConnectionConfigQuery(sort_by="name", order="desc", limit=10, cursor=cursor))
+            seen.extend(item.metadata.name for item in page.items)
+            if not page.next_cursor:
+                break
+            cursor = page.next_cursor
+
+        assert seen == [f"cluster-{index:02d}" for index in reversed(range(25))]
+
+    def test_filters_and_connection_info(self, repository):
+        self._save(repository, 25)
+
+        page = repository.list_configurations(ConnectionConfigQuery(orchestrator_type="hpc", name="cluster-1"))
+        assert [item.config_id for item in page.items] == [f"config-{index}" for index in (11, 13, 15, 17, 19)]
+        assert all(item.connection_info is None for item in page.items)
+
+        page = repository.list_configurations(ConnectionConfigQuery(contact="ops@example.org", limit=1, include_connection_info=True))
+        assert page.items[0].connection_info == HPC_CONNECTION_INFO
+
+    def test_cursor_of_another_sort_is_rejected(self, repository):
+        self._save(repository, 3)
+        cursor = repository.list_configurations(ConnectionConfigQuery(limit=1)).next_cursor
+
+        with pytest.raises(ValidationError):
+            ConnectionConfigQuery(sort_by="name", cursor=cursor)
+
+    def test_replacing_a_configuration_keeps_created_at(self, repository):
+        repository.save_configuration("config-1", build_configuration("first"))
+        created_at = repository.get_configuration("config-1").created_at
+
+        repository.save_configuration("config-1", build_configuration("renamed"))
+        configuration = repository.get_configuration("config-1")
+        assert configuration.metadata.name == "renamed"
+        assert configuration.created_at == created_at
+        assert configuration.updated_at > created_at
+
+    def test_legacy_table_is_migrated(self, tmp_path, monkeypatch):
+        db_file = tmp_path / "legacy.db"
+        connection = sqlite3.connect(db_file)
+        connection.execute("CREATE TABLE configurations (config_id TEXT PRIMARY KEY, connection_info TEXT)")
+        connection.execute(
+            "INSERT INTO configurations VALUES (?, ?)",
+            ("config-1", json.dumps(build_configuration("legacy").model_dump(mode="json")))
+        )
+        connection.execute("INSERT INTO configurations VALUES ('broken', 'not json')")
+        connection.commit()
+        connection.close()
+
+        monkeypatch.setenv("SQLITE_DB_FILE", str(db_file))
+        repository = SQLiteRepository()
+        try:
+            assert repository.get_configuration("config-1").metadata.name == "legacy"
+            # Unreadable rows are kept aside instead of being lost
+            legacy_rows = repository.connection.execute("SELECT config_id FROM configurations_legacy").fetchall()
+            assert legacy_rows == [("broken",)]
+        finally:
+            repository.close()
+
+
+class TestSQLiteRepositoryBulk:
+
+    def test_bulk_save_and_export_across_batches(self, repository):
+        configurations = {f"config-{index:04d}": build_configuration(f"cluster-{index}") for index in range(1200)}
+        repository.save_configurations(configurations)
+
+        exported = [configuration.config_id for configuration in repository.iter_configurations()]
+        assert exported == sorted(configurations)
+
+    def test_failed_bulk_save_stores_nothing(self, repository, mocker):
+        original_upsert = repository._upsert
+        calls = []
+
+        def failing_upsert(*args):
+            calls.append(args)
+            if len(calls) == 3:
+                raise sqlite3.OperationalError("disk I/O error")
+            return original_upsert(*args)
+
+        mocker.patch.object(repository, "_upsert", side_effect=failing_upsert)
+        with pytest.raises(sqlite3.OperationalError):
+            repository.save_configurations({f"config-{index}": build_configuration("x") for index in range(5)})
+
+        assert list(repository.iter_configurations()) == []
+
+    def test_failed_write_is_not_committed_by_the_next_one(self, repository, mocker):
+        mocker.patch.object(repository, "_bump_generation", side_effect=sqlite3.OperationalError("disk I/O error"))
+        with pytest.raises(sqlite3.OperationalError):
+            repository.save_configuration("partial", build_configuration("partial"))
+        mocker.stopall()
+
+        repository.save_configuration("complete", build_configuration("complete"))
+
+        assert [configuration.config_id for configuration in repository.iter_configurations()] == ["complete"]
@@ -0,0 +1,50 @@
+from hw_agent.plugins.hpc.facts_cache import SSHFactsCache
+
+
+class TestSSHFactsCache:
+
+    def test_entries_are_keyed_by_host_and_fingerprint(self):
+        cache = SSHFactsCache(ttl_seconds=60)
+        cache.store("login1", "SHA256:aaa", {"cpu_info": {"vendor": "Intel"}}, "boot-1")
+
+        assert cache.get_entry("login1", "SHA256:aaa")["facts"] == {"cpu_info": {"vendor": "Intel"}}
+        # A new host key means a different machine behind the same name
+        assert cache.get_entry("login1", "SHA256:bbb") is None
+
+    def test_expired_entry_is_renewed(self, mocker):
+        cache = SSHFactsCache(ttl_seconds=60)
+        mocker.patch("hw_agent.plugins.hpc.facts_cache.time.time", return_value=1000)
+        cache.store("login1", "SHA256:aaa", {}, "boot-1")
+
+        mocker.patch("hw_agent.plugins.hpc.facts_cache.time.time", return_value=1061)
+        entry = cache.get_entry("login1", "SHA256:aaa")
+        assert cache.is_expired(entry)
+
+        cache.renew("login1", "SHA256:aaa")
+        assert not cache.is_expired(cache.get_entry("login1", "SHA256:aaa"))
+
+    def test_entries_survive_restarts(self, tmp_path):
+        cache_file = tmp_path / "facts.json"
+        SSHFactsCache(ttl_seconds=60, cache_file=str(cache_file)).store("login1", "SHA256:aaa", {"os": "RHEL"}, "boot-1")
+
+        reloaded = SSHFactsCache(ttl_seconds=60, cache_file=str(cache_file))
+
+        assert reloaded.get_entry("login1", "SHA256:aaa")["marker"] == "boot-1"
+
+    def test_failed_probes_are_not_stored(self):
+        cache = SSHFactsCache(ttl_seconds=60)
+        cache.store("login1", "SHA256:aaa", {"cpu_info": None, "hostnamectl_info": {"os": "RHEL"}}, "boot-1")
+        cache.store("login2", "SHA256:bbb", {"cpu_info": {"vendor": "Intel"}}, None)
+
+        assert cache.get_entry("login1", "SHA256:aaa") is None
+        assert cache.get_entry("login2", "SHA256:bbb") is None
+
+    def test_missing_marker_is_never_unchanged(self):
+        cache = SSHFactsCache(ttl_seconds=60)
+        cache.store("login1", "SHA256:aaa", {"os": "RHEL"}, "boot-1")
+        entry = cache.get_entry("login1", "SHA256:aaa")
+        entry["marker"] = ""
+
+        assert not cache.is_unchanged(entry, "")
+        assert not cache.is_unchanged(entry, None)
+        assert not cache.is_unchanged(None, "boot-1")
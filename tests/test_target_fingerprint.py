@@ -0,0 +1,137 @@
+import copy
+
+import pytest
+
+from hw_agent.core.broker import Broker
+from hw_agent.core.plugin_context import PluginContext
+from hw_agent.core.plugin_executor import PluginExecutor
+from hw_agent.core.target_fingerprint import compute_target_fingerprint
+from hw_agent.models.connection_config_models import ConnectionConfigRead
+from hw_agent.models.plugin_models import PluginExecutionPolicy
+from hw_agent.repositories.sqlite_repository import SQLiteRepository
+from hw_agent.repositories.yaml_repository import YAMLRepository
+from tests.conftest import build_configuration
+
+KUBECONFIG = {
+    "kubeconfig": {
+        "apiVersion": "v1",
+        "kind": "Config",
+        "current-context": "team-a",
+        "clusters": [{"name": "prod", "cluster": {"server": "https://k8s.example.org:443/", "certificate-authority-data": "Q0E="}}],
+        "contexts": [{"name": "team-a", "context": {"cluster": "prod", "user": "admin", "namespace": "default"}}],
+        "users": [{"name": "admin", "user": {"client-certificate-data": "Q0VSVA==", "client-key-data": "S0VZ"}}],
+        "preferences": {},
+    }
+}
+
+
+def renamed_kubeconfig(server: str) -> dict:
+    # Same cluster and credentials, registered by another team with its own names
+    kubeconfig = copy.deepcopy(KUBECONFIG)
+    config = kubeconfig["kubeconfig"]
+    config["current-context"] = "team-b"
+    config["contexts"][0]["name"] = "team-b"
+    config["contexts"][0]["context"].update(cluster="production", user="ops")
+    config["clusters"][0].update(name="production")
+    config["clusters"][0]["cluster"]["server"] = server
+    config["users"][0]["name"] = "ops"
+    return kubeconfig
+
+
+
+class TestTargetFingerprint:
+
+    def test_kubernetes_targets_are_normalized(self):
+        fingerprint = compute_target_fingerprint("kubernetes", KUBECONFIG)
+
+        assert compute_target_fingerprint("kubernetes", renamed_kubeconfig("HTTPS://K8S.example.org")) == fingerprint
+        assert compute_target_fingerprint("kubernetes", renamed_kubeconfig("https://k8s.example.org:6443")) != fingerprint
+
+        other_user = copy.deepcopy(KUBECONFIG)
+        other_user["kubeconfig"]["users"][0]["user"]["client-certificate-data"] = "T1RIRVI="
+        assert compute_target_fingerprint("kubernetes", other_user) != fingerprint
+
+    def test_openstack_targets_include_region_and_project(self):
+        openstack = {"auth_url": "https://keystone.example.org:5000/v3/", "username": "u", "password": "a",
+                     "project_name": "p", "user_domain_name": "Default", "region_name": "RegionOne"}
+
+        fingerprint = compute_target_fingerprint("openstack", openstack)
+        assert compute_target_fingerprint("openstack", {**openstack, "auth_url": "https://KEYSTONE.example.org:5000/v3"}) == fingerprint
+        assert compute_target_fingerprint("openstack", {**openstack, "project_name": "q"}) != fingerprint
+        assert compute_target_fingerprint("openstack", {**openstack, "password": "b"}) != fingerprint
+        assert compute_target_fingerprint("kubernetes", openstack) != fingerprint
+
+    def test_hpc_targets_include_the_credentials(self):
+        hpc = {"ssh_credentials": {"login_node": "Login.example.org", "user": "u", "private_key": "k"}}
+
+        fingerprint = compute_target_fingerprint("hpc", hpc)
+        assert compute_target_fingerprint("hpc", {"ssh_credentials": {**hpc["ssh_credentials"], "login_node": "login.example.org", "port": 22}}) == fingerprint
+        assert compute_target_fingerprint("hpc", {"ssh_credentials": {**hpc["ssh_credentials"], "private_key": "revoked"}}) != fingerprint
+
+
+class TestSharedCollections:
+
+    def test_configurations_with_different_keys_collect_separately(self, mocker):
+        executor = PluginExecutor(PluginExecutionPolicy(timeout_seconds=None, result_ttl_seconds=300), "hpc")
+        collections = []
+
+        def fetch(context):
+            collections.append(context.config_id)
+            return f"collected by {context.config_id}"
+
+        plugin_manager = mocker.patch("hw_agent.core.broker.plugin_manager")
+        plugin_manager.execute_plugin.side_effect = lambda orchestrator_type, context, operation, target: executor.execute(
+            (operation, target), lambda: fetch(context)
+        )
+        broker = Broker.__new__(Broker)
+
+        def collect(config_id, private_key):
+            config = ConnectionConfigRead(
+                config_id=config_id,
+                metadata={"name": "cluster", "description": "test", "contact": "ops@example.org"},
+                orchestrator_type="hpc",
+                connection_info={"ssh_credentials": {"login_node": "login", "user": "u", "private_key": private_key}},
+            )
+            context = PluginContext(config_id=config_id, connection_config=config, plugin_definition={})
+            return broker._collect(config, context)
+
+        assert collect("valid", "k") == "collected by valid"
+        # Same host, user and key: the cached collection is shared
+        assert collect("copy", "k") == "collected by valid"
+        # Same host and user with another key: it has to authenticate itself
+        assert collect("revoked", "revoked") == "collected by revoked"
+        assert collections == ["valid", "revoked"]
+
+
+class TestDuplicateTargets:
+
+    def _save_fleet(self, repository):
+        repository.save_configuration("a", build_configuration(orchestrator_type="kubernetes", connection_info=KUBECONFIG))
+        repository.save_configuration("b", build_configuration(orchestrator_type="kubernetes", connection_info=renamed_kubeconfig("https://k8s.example.org")))
+        repository.save_configuration("c", build_configuration(orchestrator_type="kubernetes", connection_info=renamed_kubeconfig("https://other.example.org")))
+        repository.save_configuration("d", build_configuration(orchestrator_type="hpc", connection_info={"ssh_credentials": {"login_node": "login", "user": "u", "private_key": "k"}}))
+
+    def test_sqlite_groups_configurations_of_the_same_target(self, sqlite_repository):
+        self._save_fleet(sqlite_repository)
+
+        groups = sqlite_repository.list_duplicate_targets()
+        assert [group.config_ids for group in groups] == [["a", "b"]]
+        assert groups[0].target_fingerprint == sqlite_repository.get_configuration("a").target_fingerprint
+
+    def test_yaml_groups_configurations_of_the_same_target(self, repository_files):
+        repository = YAMLRepository()
+        self._save_fleet(repository)
+
+        assert [group.config_ids for group in repository.list_duplicate_targets()] == [["a", "b"]]
+
+    def test_fingerprints_are_added_to_existing_databases(self, sqlite_repository, monkeypatch):
+        self._save_fleet(sqlite_repository)
+        sqlite_repository.connection.execute("DROP INDEX idx_configurations_target_fingerprint")
+        sqlite_repository.connection.execute("ALTER TABLE configurations DROP COLUMN target_fingerprint")
+        sqlite_repository.connection.commit()
+
+        reopened = SQLiteRepository()
+        try:
+            assert [group.config_ids for group in reopened.list_duplicate_targets()] == [["a", "b"]]
+        finally:
+            reopened.close()
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+import yaml
+
+from hw_agent.models.connection_config_models import ConnectionConfigQuery
+from hw_agent.repositories.yaml_repository import YAMLRepository
+from tests.conftest import HPC_CONNECTION_INFO, build_configuration
+
+
+@pytest.fixture
+def config_file(repository_files):
+    return repository_files / "configurations.yaml"
+
+
+class TestYAMLRepository:
+
+    def test_lookups_do_not_parse_the_file_again(self, config_file, mocker):
+        repository = YAMLRepository()
+        repository.save_configuration("config-1", build_configuration("first"))
+        load = mocker.spy(yaml, "load")
+
+        for _ in range(10):
+            assert repository.get_configuration("config-1").metadata.name == "first"
+        assert load.call_count == 0
+
+    def test_external_changes_are_picked_up(self, config_file):
+        repository = YAMLRepository()
+        other = YAMLRepository()
+        repository.save_configuration("config-1", build_configuration("first"))
+        assert other.get_configuration("config-1").metadata.name == "first"
+
+        other.delete_configuration("config-1")
+        assert repository.get_configuration("config-1") is None
+
+    def test_failed_write_keeps_the_previous_file(self, config_file, mocker):
+        repository = YAMLRepository()
+        repository.save_configuration("config-1", build_configuration("first"))
+
+        mocker.patch("hw_agent.repositories.yaml_repository.yaml.dump", side_effect=OSError("disk full"))
+        with pytest.raises(OSError):
+            repository.save_configuration("config-2", build_configuration("second"))
+
+        assert list(yaml.safe_load(config_file.read_text())) == ["config-1"]
+        assert repository.get_configuration("config-2") is None
+        # No temp file is left behind
+        assert os.listdir(config_file.parent) == ["configurations.yaml"]
+
+    def test_listing_with_connection_info(self, config_file):
+        repository = YAMLRepository()
+        for index in range(5):
+            repository.save_configuration(f"config-{index}", build_configuration(f"cluster-{index}"))
+
+        page = repository.list_configurations(ConnectionConfigQuery(sort_by="name", order="desc", limit=2))
+        assert [item.config_id for item in page.items] == ["config-4", "config-3"]
+        assert page.items[0].connection_info is None
+
+        page = repository.list_configurations(
+            ConnectionConfigQuery(sort_by="name", order="desc", limit=2, cursor=page.next_cursor, include_connection_info=True)
+        )
+        assert [item.config_id for item in page.items] == ["config-2", "config-1"]
+        assert page.items[0].connection_info == HPC_CONNECTION_INFO